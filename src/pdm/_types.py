@@ -29,6 +29,9 @@ class RepositoryConfig:
     ca_certs: str | None = None
     client_cert: str | None = None
     client_key: str | None = None
+    pool_max_connections: int | None = None
+    pool_keepalive: int | None = None
+    http2: bool | None = None
     include_packages: list[str] = dc.field(default_factory=list)
     exclude_packages: list[str] = dc.field(default_factory=list)
 
@@ -72,6 +75,12 @@ class RepositoryConfig:
             lines.append(f"[primary]{config_prefix}type[/] = {self.type}")
         if self.ca_certs:
             lines.append(f"[primary]{config_prefix}ca_certs[/] = {self.ca_certs}")
+        if self.pool_max_connections is not None:
+            lines.append(f"[primary]{config_prefix}pool_max_connections[/] = {self.pool_max_connections}")
+        if self.pool_keepalive is not None:
+            lines.append(f"[primary]{config_prefix}pool_keepalive[/] = {self.pool_keepalive}")
+        if self.http2 is not None:
+            lines.append(f"[primary]{config_prefix}http2[/] = {self.http2}")
         return "\n".join(lines)
 
     @property
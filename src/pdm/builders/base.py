@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import contextlib
 import functools
+import hashlib
+import json
 import logging
 import os
 import shutil
 import subprocess
 import textwrap
 import threading
-from collections.abc import Iterable
+import time
+import uuid
+from collections.abc import Iterable, Iterator
 from logging import Logger
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, cast
@@ -33,6 +38,7 @@ if TYPE_CHECKING:
     from typing import ParamSpec, TypeVar
 
     from pdm.environments import BaseEnvironment
+    from pdm.models.caches import InterpreterCache
 
     R = TypeVar("R")
     P = ParamSpec("P")
@@ -132,12 +138,27 @@ def log_subprocessor(
         outstream.stop()
 
 
+def remove_shared_env(path: Path) -> None:
+    """Remove a shared build env, raise an OSError if it is being used by a build.
+
+    Builds take the env lock while installing the requirements, and hold a lease
+    under `.leases` until they finish.
+    """
+    import filelock
+
+    with filelock.FileLock(path / ".lock", timeout=0):
+        for lease in path.joinpath(".leases").glob("*.lock"):
+            with filelock.FileLock(lease, timeout=0):
+                pass
+        shutil.rmtree(path)
+
+
 class _Prefix:
-    def __init__(self, executable: str, shared: str, overlay: str) -> None:
+    def __init__(self, executable: str, shared: str, overlay: str, cache: InterpreterCache | None = None) -> None:
         self.bin_dirs: list[str] = []
         self.lib_dirs: list[str] = []
         for path in (overlay, shared):
-            paths = get_sys_config_paths(executable, vars={"base": path, "platbase": path}, kind="prefix")
+            paths = get_sys_config_paths(executable, vars={"base": path, "platbase": path}, kind="prefix", cache=cache)
             self.bin_dirs.append(paths["scripts"])
             self.lib_dirs.extend({paths["platlib"], paths["purelib"]})
         self.site_dir = os.path.join(overlay, "site")
@@ -177,7 +198,7 @@ class EnvBuilder:
         "requires": ["setuptools>=61"],
     }
 
-    _shared_envs: ClassVar[dict[int, str]] = {}
+    _shared_envs: ClassVar[dict[str, str]] = {}
     _overlay_envs: ClassVar[dict[str, str]] = {}
 
     if TYPE_CHECKING:
@@ -185,13 +206,37 @@ class EnvBuilder:
         _requires: list[str]
         _prefix: _Prefix | None
 
-    def get_shared_env(self, key: int) -> str:
+    def get_shared_env(self, key: str) -> str:
+        project = self._env.project
+        if project.core.state.enable_cache:
+            # The shared env is persisted in the cache and reused across invocations
+            path = project.cache("build_envs") / key
+            created = path / ".created"
+            max_age = project.config["cache.max_age.build_envs"]
+            with contextlib.suppress(OSError):
+                # Re-create the env from time to time, as unpinned build requirements aren't upgraded in place.
+                # It is kept if other builds are using it.
+                if max_age > 0 and time.time() - created.stat().st_mtime > max_age * 86400:
+                    remove_shared_env(path)
+                    logger.debug("Removed expired shared build env: %s", path)
+            path.mkdir(parents=True, exist_ok=True)
+            with contextlib.suppress(FileExistsError):
+                created.touch(exist_ok=False)
+            project.cache_usage.touch(path)
+            logger.debug("Using shared build env: %s", path)
+            return str(path)
         if key in self._shared_envs:
             logger.debug("Reusing shared build env: %s", self._shared_envs[key])
             return self._shared_envs[key]
         # We don't save the cache here, instead it will be done after the installation
         # finished.
-        return self._env.project.core.create_temp_dir("-shared", "pdm-build-env-")
+        return project.core.create_temp_dir("-shared", "pdm-build-env-")
+
+    def _get_shared_env_key(self, requires: Iterable[str]) -> str:
+        """Build envs are shared by the builds with the same requires list and interpreter."""
+        interpreter = self._env.interpreter
+        identity = [interpreter.executable.as_posix(), interpreter.identifier, *sorted(set(requires))]
+        return hashlib.sha256(json.dumps(identity).encode()).hexdigest()[:32]
 
     def get_overlay_env(self, key: str) -> str:
         if key not in self._overlay_envs:
@@ -240,9 +285,10 @@ class EnvBuilder:
             _Prefix(
                 self.executable,
                 # Build backends with the same requires list share the cached base env.
-                shared=self.get_shared_env(hash(frozenset(self._requires))),
+                shared=self.get_shared_env(self._get_shared_env_key(self._requires)),
                 # Overlay envs are unique for each source to be built.
                 overlay=self.get_overlay_env(os.path.normcase(self.src_dir).rstrip("\\/")),
+                cache=self._env.project.interpreter_cache,
             )
             if self.isolated
             else None
@@ -314,23 +360,52 @@ class EnvBuilder:
         return missing
 
     def install(self, requirements: Iterable[str], shared: bool = False) -> None:
+        import filelock
+
+        requirements = list(requirements)
+        assert self._prefix is not None
+        if not shared:
+            self._install_to(requirements, self._prefix.overlay)
+            return
+        # The shared env may be populated by other builds or PDM processes at the same time
+        with filelock.FileLock(os.path.join(self._prefix.shared, ".lock")):
+            self._install_to(requirements, self._prefix.shared)
+        # The shared env is prepared and is safe to be cached now. This is to make
+        # sure no broken env is returned early when run in parallel mode.
+        key = self._get_shared_env_key(requirements)
+        if key not in self._shared_envs:
+            self._shared_envs[key] = self._prefix.shared
+
+    @contextlib.contextmanager
+    def using_shared_env(self) -> Iterator[None]:
+        """Hold a lease on the shared env until the build is done, so that it won't be
+        removed by `pdm cache clear` or `pdm cache prune` while it is in use.
+        """
+        if self._prefix is None:
+            yield
+            return
+        import filelock
+
+        lease = filelock.FileLock(os.path.join(self._prefix.shared, ".leases", f"{uuid.uuid4().hex}.lock"))
+        # Pruning checks the leases under the env lock, so take it under the same lock.
+        with filelock.FileLock(os.path.join(self._prefix.shared, ".lock")):
+            lease.acquire()
+        try:
+            yield
+        finally:
+            lease.release()
+            with contextlib.suppress(OSError):
+                os.unlink(lease.lock_file)
+
+    def _install_to(self, requirements: list[str], path: str) -> None:
         from pdm.installers.core import install_requirements
 
         missing = list(self.check_requirements(requirements))
         if not missing:
             return
-        assert self._prefix is not None
-        path = self._prefix.shared if shared else self._prefix.overlay
         env = PythonEnvironment(self._env.project, python=str(self._env.interpreter.path), prefix=path)
         install_requirements(missing, env, allow_uv=False)
 
-        if shared:
-            # The shared env is prepared and is safe to be cached now. This is to make
-            # sure no broken env is returned early when run in parallel mode.
-            key = hash(frozenset(requirements))
-            if key not in self._shared_envs:
-                self._shared_envs[key] = path
-
     def prepare_metadata(self, out_dir: str) -> str:
         """Prepare metadata and store in the out_dir.
         Some backends doesn't provide that API, in that case the metadata will be
@@ -10,9 +10,10 @@ class SdistBuilder(EnvBuilder):
 
     @wrap_error
     def build(self, out_dir: str, metadata_directory: str | None = None) -> str:
-        if self.isolated:
-            self.install(self._requires, shared=True)
-            requires = self._hook.get_requires_for_build_sdist(self.config_settings)
-            self.install(requires)
-        filename = self._hook.build_sdist(out_dir, self.config_settings)
-        return os.path.join(out_dir, filename)
+        with self.using_shared_env():
+            if self.isolated:
+                self.install(self._requires, shared=True)
+                requires = self._hook.get_requires_for_build_sdist(self.config_settings)
+                self.install(requires)
+            filename = self._hook.build_sdist(out_dir, self.config_settings)
+            return os.path.join(out_dir, filename)
@@ -28,6 +28,7 @@ from pdm.exceptions import PdmException, PdmUsageError, ProjectError, Resolution
 from pdm.models.candidates import Candidate
 from pdm.models.markers import EnvSpec
 from pdm.models.repositories import LockedRepository, Package
+from pdm.models.requirements import FileRequirement
 from pdm.project import Project
 from pdm.project.lockfile import FLAG_CROSS_PLATFORM, FLAG_INHERIT_METADATA, FLAG_STATIC_URLS
 from pdm.resolver.reporters import RichLockReporter
@@ -292,10 +293,32 @@ def do_sync(
     hooks: HookManager | None = None,
 ) -> None:
     """Synchronize project"""
+    from pdm.installers.stamp import SyncStamp
+
     hooks = hooks or HookManager(project)
+    install_self = not no_self and project.is_distribution
+    stamp: SyncStamp | None = None
     if requirements is None:
-        requirements = []
         selection.validate()
+        # The whole environment is synced with the selected groups, skip it if nothing has changed since the last time.
+        # Remote override files may change without notice, so the stamp isn't used with them.
+        if not dry_run and not reinstall and not any("://" in override for override in project.core.state.overrides):
+            stamp = SyncStamp(
+                project.environment,
+                {
+                    "groups": sorted(selection),
+                    "clean": clean,
+                    "only_keep": only_keep,
+                    "install_self": install_self,
+                    "no_editable": no_editable if isinstance(no_editable, bool) else sorted(no_editable),
+                },
+            )
+            if not any(map(hooks.has_receivers, ("pre_install", "post_install"))) and stamp.is_fresh():
+                if not quiet:
+                    project.core.ui.echo("All packages are synced to date, nothing to do.")
+                return
+            stamp.clear()
+        requirements = []
         all_deps = project._resolve_dependencies(list(selection))
         for group in selection:
             requirements.extend(project.get_dependencies(group, all_deps))
@@ -307,7 +330,7 @@ def do_sync(
         clean=clean,
         dry_run=dry_run,
         no_editable=no_editable,
-        install_self=not no_self and project.is_distribution,
+        install_self=install_self,
         reinstall=reinstall,
         only_keep=only_keep,
         fail_fast=fail_fast,
@@ -317,6 +340,17 @@ def do_sync(
         hooks.try_emit("pre_install", packages=packages, dry_run=dry_run)
         synchronizer.synchronize()
         hooks.try_emit("post_install", packages=packages, dry_run=dry_run)
+    # Local directories and the project itself, if not editable, are reinstalled when changed.
+    # Like the synchronizer, the project is installed non-editable if any no_editable is given.
+    if (
+        stamp is not None
+        and not (install_self and no_editable)
+        and not any(
+            isinstance(req := p.candidate.req, FileRequirement) and req.is_local_dir and not req.editable
+            for p in packages
+        )
+    ):
+        stamp.write()
 
 
 def ask_for_import(project: Project) -> None:
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+
+class CommandInfo(NamedTuple):
+    """The information of a builtin command that is needed before its module is imported"""
+
+    module: str
+    help: str
+    aliases: tuple[str, ...] = ()
+
+
+# The manifest of the builtin commands, keyed by the command name.
+# The command modules are only imported when the command is invoked, so the
+# help strings here must be kept in sync with the command classes.
+COMMANDS: dict[str, CommandInfo] = {
+    "add": CommandInfo("add", "Add package(s) to pyproject.toml and install them"),
+    "build": CommandInfo("build", "Build artifacts for distribution"),
+    "cache": CommandInfo("cache", "Control the caches of PDM"),
+    "completion": CommandInfo("completion", "Generate completion scripts for the given shell"),
+    "config": CommandInfo("config", "Display the current configuration"),
+    "export": CommandInfo("export", "Export the locked packages set to other formats"),
+    "fix": CommandInfo("fix", "Fix the project problems according to the latest version of PDM"),
+    "import": CommandInfo("import_cmd", "Import project metadata from other formats"),
+    "info": CommandInfo("info", "Show the project information"),
+    "init": CommandInfo(
+        "init",
+        """Initialize a pyproject.toml for PDM.
+
+    Built-in templates:
+    - default: `pdm init`, A simple template with a basic structure.
+    - minimal: `pdm init minimal`, A minimal template with only `pyproject.toml`.
+    """,
+    ),
+    "install": CommandInfo("install", "Install dependencies from lock file"),
+    "list": CommandInfo("list", "List packages installed in the current working set"),
+    "lock": CommandInfo("lock", "Resolve and lock dependencies"),
+    "new": CommandInfo("new", "Create a new Python project at <project_path>"),
+    "outdated": CommandInfo("outdated", "Check for outdated packages and list the latest versions on indexes."),
+    "publish": CommandInfo("publish", "Build and publish the project to PyPI"),
+    "python": CommandInfo("python", "Manage installed Python interpreters", aliases=("py",)),
+    "remove": CommandInfo("remove", "Remove packages from pyproject.toml"),
+    "run": CommandInfo("run", "Run commands or scripts with local packages loaded"),
+    "search": CommandInfo("search", "[DEPRECATED] Search for PyPI packages"),
+    "self": CommandInfo("self_cmd", "Manage the PDM program itself (previously known as plugin)", aliases=("plugin",)),
+    "show": CommandInfo("show", "Show the package information"),
+    "sync": CommandInfo("sync", "Synchronize the current working set with lock file"),
+    "update": CommandInfo("update", "Update package(s) in pyproject.toml"),
+    "use": CommandInfo(
+        "use", "Use the given python version or path as base interpreter. If not found, PDM will try to install one."
+    ),
+    "venv": CommandInfo("venv", "Virtualenv management"),
+}
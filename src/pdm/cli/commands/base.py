@@ -49,6 +49,11 @@ class BaseCommand:
             help=help_text,
             **kwargs,
         )
+        cls.setup_parser(parser, name)
+
+    @classmethod
+    def setup_parser(cls, parser: argparse.ArgumentParser, name: str) -> None:
+        """Add the arguments of the command to the subparser and bind the command to it."""
         command = cls.init_parser(parser)
         command.name = name
         # Store the command instance in the parsed args. See pdm/core.py for more details
@@ -1,13 +1,21 @@
 import argparse
+import contextlib
 import os
+import sqlite3
 from collections.abc import Iterable
 from pathlib import Path
 
 from pdm import termui
+from pdm.builders.base import remove_shared_env
 from pdm.cli.commands.base import BaseCommand
 from pdm.cli.options import verbose_option
 from pdm.exceptions import PdmUsageError
+from pdm.models.cached_package import CachedPackage
 from pdm.project import Project
+from pdm.utils import parse_size
+
+CACHE_TYPES = ("hashes", "http", "wheels", "metadata", "packages", "build_envs")
+SQLITE_SIDECARS = ("-wal", "-shm", "-journal")
 
 
 class Command(BaseCommand):
@@ -18,6 +26,7 @@ class Command(BaseCommand):
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         subparsers = parser.add_subparsers(title="commands", metavar="")
         ClearCommand.register_to(subparsers, "clear")
+        PruneCommand.register_to(subparsers, "prune")
         RemoveCommand.register_to(subparsers, "remove")
         ListCommand.register_to(subparsers, "list")
         InfoCommand.register_to(subparsers, "info")
@@ -71,11 +80,185 @@ def remove_cache_files(project: Project, pattern: str) -> None:
     project.core.ui.echo(f"{len(files)} file{'s' if len(files) > 1 else ''} removed")
 
 
+def _get_entry_files(entry: Path) -> list[Path]:
+    """Get the files of a cache entry, a database is stored along with its sidecar files."""
+    return [entry, *(p for suffix in SQLITE_SIDECARS if (p := entry.with_name(entry.name + suffix)).exists())]
+
+
+def _iter_evictable_entries(project: Project, type_: str) -> Iterable[tuple[Path, int]]:
+    if type_ == "packages":
+        # Packages still referred to by some environments can't be evicted
+        for pkg in project.package_cache.iter_packages():
+            if not any(os.path.exists(fn) for fn in pkg.referrers):
+                yield pkg.path, directory_size(pkg.path)
+        return
+    if type_ == "build_envs":
+        for env in project.cache(type_).iterdir():
+            if env.is_dir():
+                yield env, directory_size(env)
+        return
+    for file in find_files(project.cache(type_), "*"):
+        if not file.name.endswith(SQLITE_SIDECARS):
+            yield file, sum(map(file_size, _get_entry_files(file)))
+
+
+def _last_modified(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0
+
+
+def _prune_http_cache(database: Path, excess: int) -> tuple[int, int]:
+    """Delete the oldest responses from the HTTP cache database.
+
+    The HTTP cache doesn't record when an entry is read, but a stale entry is
+    stored again when it is revalidated, so the creation time is used instead.
+    """
+    if not database.exists():
+        return 0, 0
+    count = freed = 0
+    with contextlib.closing(sqlite3.connect(database, timeout=30)) as conn:
+        conn.execute("PRAGMA foreign_keys=ON")
+        rows = conn.execute(
+            "SELECT id, length(data) + coalesce("
+            "(SELECT sum(length(chunk_data)) FROM streams WHERE entry_id = entries.id), 0) "
+            "FROM entries ORDER BY created_at"
+        ).fetchall()
+        with conn:
+            for entry_id, size in rows:
+                if freed >= excess:
+                    break
+                conn.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
+                count += 1
+                freed += size
+        with contextlib.suppress(sqlite3.Error):
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return count, freed
+
+
+def _prune_sqlite_cache(database: Path, excess: int) -> tuple[int, int]:
+    """Delete the least recently used entries from a key-value cache database.
+
+    Entries without an access time, written by older versions of PDM, go first
+    in the order they were stored.
+    """
+    if not database.exists():
+        return 0, 0
+    count = freed = 0
+    with contextlib.closing(sqlite3.connect(database, timeout=30)) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        order = "coalesce(last_used, 0), rowid" if "last_used" in columns else "rowid"
+        rows = conn.execute(f"SELECT rowid, length(key) + length(value) FROM cache ORDER BY {order}").fetchall()
+        with conn:
+            for rowid, size in rows:
+                if freed >= excess:
+                    break
+                conn.execute("DELETE FROM cache WHERE rowid = ?", (rowid,))
+                count += 1
+                freed += size
+        with contextlib.suppress(sqlite3.Error):
+            conn.execute("VACUUM")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return count, freed
+
+
+def _get_cache_databases(project: Project, type_: str) -> list[Path]:
+    """Get the cache databases of the given type, the least recently used first.
+
+    Other files under the metadata cache, such as the interpreter probes, the working
+    set snapshots and the parsed lockfiles, aren't part of the cache and are kept.
+    """
+    root = project.cache(type_)
+    if type_ == "http":
+        # Archives take most of the space, prune them first
+        return [root / "http-archives.db", root / "http-cache.db"]
+    databases = [root / "hashes.db"] if type_ == "hashes" else list(root.glob("package_meta_*.db"))
+    usage = project.cache_usage
+    usage.flush()
+    last_used = usage.get_many(databases)
+    return sorted(databases, key=lambda path: last_used.get(path) or _last_modified(path))
+
+
+def prune_cache(project: Project, type_: str, max_size: int) -> tuple[int, int]:
+    """Evict the least recently used entries of the given cache type until
+    its size is within `max_size`.
+
+    Returns the number of entries removed and the bytes freed.
+    """
+    if type_ in ("http", "hashes", "metadata"):
+        databases = _get_cache_databases(project, type_)
+        # Other files aren't evicted, so they don't count towards the limit
+        excess = sum(file_size(file) for db in databases if db.exists() for file in _get_entry_files(db)) - max_size
+        if excess <= 0:
+            return 0, 0
+        # The entries are rows of the databases, evict them instead of the whole database
+        prune_database = _prune_http_cache if type_ == "http" else _prune_sqlite_cache
+        count = freed = 0
+        for database in databases:
+            if freed >= excess:
+                break
+            try:
+                removed, size = prune_database(database, excess - freed)
+            except sqlite3.Error as e:
+                project.core.ui.echo(f"Failed to prune {database}: {e}", verbosity=termui.Verbosity.DETAIL)
+                continue
+            count += removed
+            freed += size
+        return count, freed
+    excess = directory_size(project.cache(type_)) - max_size
+    if excess <= 0:
+        return 0, 0
+    entries = list(_iter_evictable_entries(project, type_))
+    usage = project.cache_usage
+    usage.flush()
+    last_used = usage.get_many(path for path, _ in entries)
+    entries.sort(key=lambda entry: last_used.get(entry[0]) or _last_modified(entry[0]))
+    removed: list[Path] = []
+    freed = 0
+    for path, size in entries:
+        if freed >= excess:
+            break
+        try:
+            if type_ == "packages":
+                CachedPackage(path).cleanup()
+            elif type_ == "build_envs":
+                remove_shared_env(path)
+            else:
+                for file in _get_entry_files(path):
+                    os.unlink(file)
+        except OSError as e:
+            project.core.ui.echo(f"Failed to remove {path}: {e}", verbosity=termui.Verbosity.DETAIL)
+            continue
+        project.core.ui.echo(f"Removed {path}", verbosity=termui.Verbosity.DETAIL)
+        removed.append(path)
+        freed += size
+    usage.forget(removed)
+    return len(removed), freed
+
+
+def prune_caches(project: Project, types: Iterable[str] = CACHE_TYPES, max_size: int | None = None) -> tuple[int, int]:
+    """Prune the caches of the given types that exceed their `cache.max_size.<type>` limits.
+
+    Returns the number of entries removed and the bytes freed.
+    """
+    count = freed = 0
+    for type_ in types:
+        limit = max_size if max_size is not None else project.config.get(f"cache.max_size.{type_}")
+        if limit is None:
+            continue
+        removed, size = prune_cache(project, type_, limit)
+        count += removed
+        freed += size
+    return count, freed
+
+
 class ClearCommand(BaseCommand):
     """Clean all the files under cache directory"""
 
     arguments = (verbose_option,)
-    CACHE_TYPES = ("hashes", "http", "wheels", "metadata", "packages")
+    CACHE_TYPES = CACHE_TYPES
 
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         parser.add_argument(
@@ -92,6 +275,21 @@ class ClearCommand(BaseCommand):
             os.unlink(file)
         return len(files)
 
+    @staticmethod
+    def _clear_build_envs(project: Project, root: Path) -> int:
+        count = 0
+        for env in root.iterdir():
+            if not env.is_dir():
+                continue
+            files = len(list(find_files(env, "*")))
+            try:
+                remove_shared_env(env)
+            except OSError as e:
+                project.core.ui.echo(f"Failed to remove {env}: {e}", verbosity=termui.Verbosity.DETAIL)
+            else:
+                count += files
+        return count
+
     def handle(self, project: Project, options: argparse.Namespace) -> None:
         if not options.type:
             types: Iterable[str] = self.CACHE_TYPES
@@ -103,6 +301,8 @@ class ClearCommand(BaseCommand):
             for type_ in types:
                 if type_ == "packages":
                     packages += project.package_cache.cleanup()
+                elif type_ == "build_envs":
+                    files += self._clear_build_envs(project, project.cache(type_))
                 else:
                     files += self._clear_files(project.cache(type_))
             message = []
@@ -117,6 +317,34 @@ class ClearCommand(BaseCommand):
         project.core.ui.echo(text)
 
 
+class PruneCommand(BaseCommand):
+    """Evict the least recently used cache entries exceeding the size limits"""
+
+    arguments = (verbose_option,)
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "type",
+            nargs="?",
+            help="Prune the given type of caches",
+            choices=CACHE_TYPES,
+        )
+        parser.add_argument(
+            "--max-size",
+            type=parse_size,
+            help="The maximum size to keep, e.g. `10GB`. Defaults to the `cache.max_size.<type>` config",
+        )
+
+    def handle(self, project: Project, options: argparse.Namespace) -> None:
+        types: Iterable[str] = (options.type,) if options.type else CACHE_TYPES
+        with project.core.ui.open_spinner(f"Pruning {options.type or 'all'} caches..."):
+            count, freed = prune_caches(project, types, options.max_size)
+        if not count:
+            project.core.ui.echo("No cache entries need to be removed")
+        else:
+            project.core.ui.echo(f"{count} entr{'ies' if count > 1 else 'y'} ({format_size(freed)}) removed")
+
+
 class RemoveCommand(BaseCommand):
     """Remove files matching the given pattern"""
 
@@ -163,6 +391,7 @@ class InfoCommand(BaseCommand):
                 ("wheels", "Wheels Cache"),
                 ("metadata", "Metadata Cache"),
                 ("packages", "Package Cache"),
+                ("build_envs", "Build Environments Cache"),
             ]:
                 cache_location = project.cache(name)
                 size = directory_size(cache_location)
@@ -170,6 +399,9 @@ class InfoCommand(BaseCommand):
                 if name == "packages":
                     packages = list(project.package_cache.iter_packages())
                     output.append(f"    Packages: {len(packages)}, Size: {format_size(size)}")
+                elif name == "build_envs":
+                    envs = [env for env in cache_location.iterdir() if env.is_dir()]
+                    output.append(f"    Environments: {len(envs)}, Size: {format_size(size)}")
                 else:
                     files = list(find_files(cache_location, "*"))
                     output.append(f"    Files: {len(files)}, Size: {format_size(size)}")
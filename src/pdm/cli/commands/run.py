@@ -9,7 +9,6 @@ import signal
 import subprocess
 import sys
 from collections.abc import Mapping, Sequence
-from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple, cast
 
@@ -21,7 +20,6 @@ from pdm.cli.hooks import HookManager
 from pdm.cli.options import skip_option, venv_option
 from pdm.cli.utils import check_project_file
 from pdm.exceptions import PdmUsageError
-from pdm.signals import pdm_signals
 from pdm.utils import deprecation_warning, expand_env_vars, is_path_relative_to
 
 if TYPE_CHECKING:
@@ -571,7 +569,3 @@ def run_script_if_present(script_name: str, sender: Project, hooks: HookManager,
     sender.project_config.reload()
     sender.pyproject.reload()
     sender.lockfile.reload()
-
-
-for hook in pdm_signals:
-    pdm_signals.signal(hook).connect(partial(run_script_if_present, hook), weak=False)
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 from argcomplete.completers import DirectoriesCompleter, FilesCompleter
 from packaging.requirements import InvalidRequirement, Requirement
 
+from pdm.cli.utils import LazyArgumentParser
 from pdm.compat import tomllib
 
 if TYPE_CHECKING:
@@ -173,6 +174,8 @@ def configure_parser(core: Core) -> None:
                 if not path:
                     _set_completer(action, _scripts)
                 for name, subparser in action.choices.items():
+                    if isinstance(subparser, LazyArgumentParser):
+                        subparser.ensure_loaded()
                     visit(subparser, (*path, name))
             elif action.dest in _GROUP_DESTS:
                 _set_completer(action, _groups)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 from collections.abc import Generator
+from functools import partial
 from typing import Any
 
 from pdm.project.core import Project
@@ -47,9 +48,34 @@ class HookManager:
             and not (self.skip_post and name.startswith("post_"))
         )
 
+    def has_receivers(self, name: str) -> bool:
+        """
+        Tells whether emitting the hook would run a project script or a plugin receiver.
+        """
+        if not self.should_run(name):
+            return False
+        if name in self.project.scripts:
+            return True
+        return any(
+            getattr(receiver, "func", None) is not _run_project_script
+            for receiver in pdm_signals.signal(name).receivers_for(self.project)
+        )
+
     def try_emit(self, name: str, **kwargs: Any) -> None:
         """
         Emit a hook signal if rules allow it.
         """
         if self.should_run(name):
             pdm_signals.signal(name).send(self.project, hooks=self, **kwargs)
+
+
+def _run_project_script(script_name: str, sender: Project, hooks: HookManager, **kwargs: Any) -> None:
+    from pdm.cli.commands.run import run_script_if_present
+
+    run_script_if_present(script_name, sender, hooks, **kwargs)
+
+
+# Run the project scripts named after the hooks. This module is always imported by pdm.core,
+# so the receivers are connected no matter which command is invoked.
+for hook in pdm_signals:
+    pdm_signals.signal(hook).connect(partial(_run_project_script, hook), weak=False)
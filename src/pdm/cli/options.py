@@ -254,6 +254,24 @@ def no_isolation_option(
 
 install_group.options.append(no_isolation_option)
 
+
+@Option(
+    "--no-compile",
+    dest="compile_bytecode",
+    nargs=0,
+    help="Don't compile the bytecode of installed packages, regardless of the `install.compile` config",
+)
+def no_compile_option(
+    project: Project,
+    namespace: argparse.Namespace,
+    values: str | Sequence[Any] | None,
+    option_string: str | None = None,
+) -> None:
+    project.core.state.compile_bytecode = False
+
+
+install_group.options.append(no_compile_option)
+
 groups_group = ArgumentGroup("Dependencies Selection")
 groups_group.add_argument(
     "-G",
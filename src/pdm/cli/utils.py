@@ -144,6 +144,35 @@ class ArgumentParser(argparse.ArgumentParser):
         return args, argv
 
 
+class LazyArgumentParser(ArgumentParser):
+    """An argument parser whose arguments are added by the loader on the first use,
+    so that the module defining them is only imported when necessary.
+    """
+
+    def __init__(
+        self, *args: Any, loader: Callable[[argparse.ArgumentParser], None] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._loader = loader
+
+    def ensure_loaded(self) -> None:
+        if self._loader is not None:
+            loader, self._loader = self._loader, None
+            loader(self)
+
+    def parse_known_args(self, args: Any = None, namespace: Any = None) -> Any:
+        self.ensure_loaded()
+        return super().parse_known_args(args, namespace)
+
+    def format_usage(self) -> str:
+        self.ensure_loaded()
+        return super().format_usage()
+
+    def format_help(self) -> str:
+        self.ensure_loaded()
+        return super().format_help()
+
+
 def format_similar_command(root_command: str, commands: list[str], script_commands: list[str]) -> str:
     from difflib import get_close_matches
 
@@ -15,10 +15,9 @@ import importlib
 import importlib.metadata
 import itertools
 import os
-import pkgutil
 import sys
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, cast
@@ -27,10 +26,13 @@ import tomlkit.exceptions
 
 from pdm import termui
 from pdm.__version__ import __version__
+from pdm.cli.commands import COMMANDS
+from pdm.cli.hooks import HookManager
 from pdm.cli.options import ignore_python_option, no_cache_option, non_interactive_option, pep582_option, verbose_option
-from pdm.cli.utils import ArgumentParser, ErrorArgumentParser, format_similar_command
+from pdm.cli.utils import ErrorArgumentParser, LazyArgumentParser, format_similar_command
 from pdm.exceptions import PdmArgumentError, PdmUsageError
 from pdm.installers import InstallManager
+from pdm.models.caches import EntryPointCache
 from pdm.models.repositories import BaseRepository, PyPIRepository
 from pdm.project import Project
 from pdm.project.config import Config
@@ -43,7 +45,6 @@ if TYPE_CHECKING:
     from pdm.cli.commands.base import BaseCommand
     from pdm.project.config import ConfigItem
 
-COMMANDS_MODULE_PATH = importlib.import_module("pdm.cli.commands").__path__
 WORKSPACE_ROOT_ONLY_COMMANDS = frozenset({"info", "install", "lock", "outdated", "sync"})
 
 
@@ -59,6 +60,8 @@ class State:
     """Whether to make an isolated environment and install requirements for build"""
     enable_cache: bool = True
     """Whether to enable the cache"""
+    compile_bytecode: bool = True
+    """Whether to compile the bytecode of installed packages as configured by `install.compile`"""
     overrides: list[str] = dc.field(default_factory=list)
     """The requirement overrides for the resolver"""
 
@@ -112,14 +115,23 @@ class Core:
         pep582_option.add_to_parser(self.parser)
         non_interactive_option.add_to_parser(self.parser)
 
-        self.subparsers = self.parser.add_subparsers(parser_class=ArgumentParser, title="commands", metavar="")
-        for _, name, _ in pkgutil.iter_modules(COMMANDS_MODULE_PATH):
-            module = importlib.import_module(f"pdm.cli.commands.{name}", __name__)
-            try:
-                klass = module.Command
-            except AttributeError:
-                continue
-            self.register_command(klass, klass.name or name)
+        self.subparsers = self.parser.add_subparsers(parser_class=LazyArgumentParser, title="commands", metavar="")
+        # The builtin commands are registered from the manifest, and the command module
+        # is imported to add the arguments only when the command is invoked.
+        for name, info in COMMANDS.items():
+            self.commands.append(name)
+            self.subparsers.add_parser(
+                name,
+                aliases=info.aliases,
+                help=info.help,
+                description=info.help,
+                loader=partial(self._load_command, info.module, name),
+            )
+
+    @staticmethod
+    def _load_command(module_name: str, name: str, parser: argparse.ArgumentParser) -> None:
+        module = importlib.import_module(f"pdm.cli.commands.{module_name}")
+        module.Command.setup_parser(parser, name)
 
     def __call__(self, *args: Any, **kwargs: Any) -> None:
         return self.main(*args, **kwargs)
@@ -159,7 +171,6 @@ class Core:
     def handle(self, project: Project, options: argparse.Namespace) -> None:
         """Called before command invocation"""
         from pdm.cli.commands.fix import Command as FixCommand
-        from pdm.cli.hooks import HookManager
 
         self.ui.set_verbosity(options.verbose)
         self.ui.set_theme(project.global_config.load_theme())
@@ -291,6 +302,10 @@ class Core:
                 from pdm.cli.actions import check_update
 
                 check_update(project)
+            if project.config["cache.auto_prune"]:
+                from pdm.cli.commands.cache import prune_caches
+
+                prune_caches(project)
 
     def register_command(self, command: type[BaseCommand], name: str | None = None) -> None:
         """Register a subcommand to the subparsers,
@@ -316,8 +331,7 @@ class Core:
         """
         Config.add_config(name, config_item)
 
-    def _add_project_plugins_library(self) -> None:
-        project = self.create_project(is_global=False, global_config=os.getenv("PDM_CONFIG_FILE"))
+    def _add_project_plugins_library(self, project: Project) -> None:
         plugin_root = project.project_plugins_dir
         if project.is_global or not plugin_root.exists():
             return
@@ -349,11 +363,15 @@ class Core:
                 ...
             ```
         """
-        self._add_project_plugins_library()
-        entry_points: Iterable[importlib.metadata.EntryPoint] = itertools.chain(
-            importlib.metadata.entry_points(group="pdm"),
-            importlib.metadata.entry_points(group="pdm.plugin"),
-        )
+        project = self.create_project(is_global=False, global_config=os.getenv("PDM_CONFIG_FILE"))
+        self._add_project_plugins_library(project)
+        groups = ("pdm", "pdm.plugin")
+        entry_points: Iterable[importlib.metadata.EntryPoint]
+        if os.getenv("PDM_NO_CACHE"):
+            entry_points = itertools.chain.from_iterable(importlib.metadata.entry_points(group=g) for g in groups)
+        else:
+            # Avoid scanning all installed distributions unless the sys.path entries change
+            entry_points = EntryPointCache(project.cache_dir / "entry_points.json").get(groups)
         for plugin in entry_points:
             try:
                 plugin.load()(self)
@@ -393,17 +411,19 @@ class Core:
 
 def main(args: list[str] | None = None) -> None:
     """The CLI entry function"""
-    import argcomplete
-    from argcomplete.completers import SuppressCompleter
-
-    from pdm.cli.completions import configure_parser
-
     core = Core()
-    configure_parser(core)
-    argcomplete.autocomplete(
-        core.parser,
-        always_complete_options=False,
-        default_completer=SuppressCompleter(),
-    )
+    if "_ARGCOMPLETE" in os.environ:
+        # Only load the arguments of all commands when completing
+        import argcomplete
+        from argcomplete.completers import SuppressCompleter
+
+        from pdm.cli.completions import configure_parser
+
+        configure_parser(core)
+        argcomplete.autocomplete(
+            core.parser,
+            always_complete_options=False,
+            default_completer=SuppressCompleter(),
+        )
     with core.exit_stack:
         return core.main(args or sys.argv[1:])
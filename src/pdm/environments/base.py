@@ -227,11 +227,13 @@ class BaseEnvironment(abc.ABC):
     def get_working_set(self) -> WorkingSet:
         """Get the working set based on local packages directory."""
         paths = self.get_paths()
-        return WorkingSet([paths["platlib"], paths["purelib"]])
+        return WorkingSet([paths["platlib"], paths["purelib"]], cache=self.project.working_set_cache)
 
     @cached_property
     def spec(self) -> EnvSpec:
-        return get_env_spec(self.interpreter.executable.as_posix(), self._env_spec_compat_lib)
+        return get_env_spec(
+            self.interpreter.executable.as_posix(), self._env_spec_compat_lib, self.project.interpreter_cache
+        )
 
     @property
     def allow_all_spec(self) -> EnvSpec:
@@ -34,7 +34,9 @@ class PythonEnvironment(BaseEnvironment):
         else:
             replace_vars = None
             kind = "user" if not is_venv and self.project.global_config["global_project.user_site"] else "default"
-        paths = get_sys_config_paths(str(self.interpreter.executable), replace_vars, kind=kind)
+        paths = get_sys_config_paths(
+            str(self.interpreter.executable), replace_vars, kind=kind, cache=self.project.interpreter_cache
+        )
         if is_venv:
             python_xy = f"python{self.interpreter.identifier}"
             paths["include"] = os.path.join(paths["data"], "include", "site", python_xy)
@@ -61,4 +63,4 @@ class PythonEnvironment(BaseEnvironment):
         shared_paths = self.extra_paths[:]
         if venv is not None and venv.include_system_site_packages:
             shared_paths.extend(venv.base_paths)
-        return WorkingSet(paths, shared_paths=list(dict.fromkeys(shared_paths)))
+        return WorkingSet(paths, shared_paths=list(dict.fromkeys(shared_paths)), cache=self.project.working_set_cache)
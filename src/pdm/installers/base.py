@@ -161,13 +161,16 @@ class BaseSynchronizer:
             if not isinstance(dreq, FileRequirement):
                 return True
             url = dreq.get_full_url()
-            if dreq.is_local_dir:
-                # We don't know whether a local dir has been changed, always update
-                return True
             assert can.link is not None
             if url != backend.expand_line(can.link.url_without_fragment):
                 return True
             direct_json = json.loads(content) if (content := dist.read_text("direct_url.json")) else None
+            if dreq.is_local_dir:
+                # Update the local dir only if its source tree has changed since installed
+                if not direct_json or dreq.subdirectory != can.req.subdirectory:  # type: ignore[attr-defined]
+                    return True
+                fingerprint = direct_json.get("dir_info", {}).get("fingerprint")
+                return fingerprint is None or fingerprint != can.prepare(self.environment).source_fingerprint
             if not direct_json or "archive_info" not in direct_json:
                 # We are not able to check, don't update
                 return False
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
 import stat
 from collections.abc import Iterator
 from functools import cached_property
@@ -22,7 +23,7 @@ from pdm.utils import make_file_executable
 _WINDOWS = os.name == "nt"
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
     from typing import Any, BinaryIO, Literal
 
     from installer.sources import WheelContentElement
@@ -62,6 +63,18 @@ class PackageWheelSource(WheelSource):
     def read_dist_info(self, filename: str) -> str:
         return self.package.dist_info.joinpath(filename).read_text("utf-8")
 
+    @cached_property
+    def recorded_files(self) -> dict[str, RecordEntry]:
+        """The hashed RECORD entries of the package, keyed by the path of the file in the cache"""
+        from installer.records import parse_record_file
+
+        result: dict[str, RecordEntry] = {}
+        for elements in parse_record_file(self.read_dist_info("RECORD").splitlines()):
+            record = RecordEntry.from_elements(*elements)
+            if record.hash_ is not None and record.size is not None:
+                result[str(self.package.path.joinpath(record.path))] = record
+        return result
+
     def iter_files(self) -> Iterable[Path]:
         for root, _, files in os.walk(self.package.path):
             for file in files:
@@ -97,15 +110,27 @@ class InstallDestination(SchemeDictionaryDestination):
         *args: Any,
         link_method: LinkMethod = "copy",
         rename_pth: bool = False,
+        compile_targets: list[str] | None = None,
+        known_records: Mapping[str, RecordEntry] | None = None,
+        verify_records: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.link_method = link_method
         self.rename_pth = rename_pth
+        self.compile_targets = compile_targets
+        # The RECORD entries of the source files, keyed by the source path
+        self.known_records = known_records or {}
+        self.verify_records = verify_records
 
     def _compile_bytecode(self, scheme: Scheme, record: RecordEntry) -> None:
         if self.link_method == "symlink":
             return
+        if self.compile_targets is not None:
+            # Collect the files to be compiled together after the installation
+            if scheme in ("purelib", "platlib") and record.path.endswith(".py"):
+                self.compile_targets.append(str(self._path_with_destdir(scheme, record.path)))
+            return
         super()._compile_bytecode(scheme, record)
 
     def finalize_installation(
@@ -135,6 +160,13 @@ class InstallDestination(SchemeDictionaryDestination):
         for file_scheme, record in record_list:
             self._compile_bytecode(file_scheme, record)
 
+    def _get_known_record(self, stream: BinaryIO) -> tuple[str, int] | None:
+        """Return the recorded hash and size of the source file of the stream, if any"""
+        record = self.known_records.get(getattr(stream, "name", ""))
+        if record is None or record.hash_ is None or record.size is None or record.hash_.name != self.hash_algorithm:
+            return None
+        return record.hash_.value, record.size
+
     def write_to_fs(self, scheme: Scheme, path: str, stream: BinaryIO, is_executable: bool) -> RecordEntry:
         from installer.records import Hash
         from installer.utils import copyfileobj_with_hashing
@@ -150,8 +182,21 @@ class InstallDestination(SchemeDictionaryDestination):
             # when multiple packages are installed at the same time.
             target_path = target_path.with_name(target_path.name + ".pdmtmp")
         if self.link_method == "copy" or not hasattr(stream, "name"):
-            with open(target_path, "wb") as f:
-                hash_, size = copyfileobj_with_hashing(stream, f, self.hash_algorithm)
+            known = self._get_known_record(stream)
+            if known is not None and not self.verify_records and os.fstat(stream.fileno()).st_size == known[1]:
+                # The file is unchanged since it was recorded, copy it as is and reuse the recorded hash
+                src_path = stream.name
+                stream.close()
+                shutil.copyfile(src_path, target_path)
+                hash_, size = known
+            else:
+                with open(target_path, "wb") as f:
+                    hash_, size = copyfileobj_with_hashing(stream, f, self.hash_algorithm)
+                if known is not None and (hash_, size) != known:
+                    raise InvalidWheelSource(
+                        f"The content of {stream.name} doesn't match its RECORD entry, "
+                        "run `pdm cache clear packages` to remove the broken caches"
+                    )
         else:
             src_path = stream.name
             # create links, we don't need the stream anymore
@@ -186,9 +231,13 @@ def install_wheel(
     install_links: bool = False,
     rename_pth: bool = False,
     requested: bool = False,
+    compile_targets: list[str] | None = None,
 ) -> str:
     """Only create .pth files referring to the cached package.
     If the cache doesn't exist, create one.
+
+    If `compile_targets` is given, the installed Python files are appended to it
+    to be compiled later.
     """
     interpreter = str(environment.interpreter.executable)
     script_kind = environment.script_kind
@@ -213,10 +262,15 @@ def install_wheel(
         script_kind=script_kind,
         link_method=link_method,
         rename_pth=rename_pth,
+        compile_targets=compile_targets,
     )
     if install_links:
         package = environment.project.package_cache.cache_wheel(wheel)
+        environment.project.cache_usage.touch(package.path)
         source = PackageWheelSource(package)
+        if link_method == "copy":
+            destination.known_records = source.recorded_files
+            destination.verify_records = environment.project.config["install.cache_verify"]
         if link_method == "symlink":
             # Track usage when symlink is used
             additional_metadata["REFER_TO"] = package.path.as_posix().encode()
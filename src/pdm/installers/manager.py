@@ -9,13 +9,22 @@ from pdm.installers.installers import install_wheel
 from pdm.installers.uninstallers import BaseRemovePaths, StashedRemovePaths
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from pathlib import Path
+
     from pdm.environments import BaseEnvironment
-    from pdm.models.candidates import Candidate
+    from pdm.installers.scheduler import BuildScheduler
+    from pdm.models.candidates import Candidate, PreparedCandidate
 
 
 class InstallManager:
     """The manager that performs the installation and uninstallation actions."""
 
+    # Builds the wheels on a bounded pool if set, during the synchronization
+    build_scheduler: BuildScheduler | None = None
+    # Collects the installed Python files to compile if set
+    compile_targets: list[str] | None = None
+
     def __init__(
         self, environment: BaseEnvironment, *, use_install_cache: bool = False, rename_pth: bool = False
     ) -> None:
@@ -27,15 +36,48 @@ class InstallManager:
         """Install a candidate into the environment, return the distribution"""
         prepared = candidate.prepare(self.environment)
         dist_info = install_wheel(
-            prepared.build(),
+            self.build(candidate, prepared),
             self.environment,
             direct_url=prepared.direct_url(),
             install_links=self.use_install_cache and not candidate.req.editable,
             rename_pth=self.rename_pth,
             requested=candidate.requested,
+            compile_targets=self.compile_targets,
         )
         return Distribution.at(dist_info)
 
+    def fetch(self, candidate: Candidate) -> Future[Path] | None:
+        """Fetch the candidate ahead of the installation, and schedule the build if it needs one.
+
+        Return the future of the build, or None if the candidate is ready to install.
+        """
+        scheduler = self.build_scheduler
+        if scheduler is None:
+            return None
+        if not scheduler.is_scheduled(candidate):
+            if candidate.prepare(self.environment).fetch() is not None:
+                return None
+            if not self.environment.project.core.state.build_isolation:
+                # Non-isolated builds depend on the packages being installed, build them at the installation
+                return None
+        return self.schedule(candidate)
+
+    def schedule(self, candidate: Candidate) -> Future[Path] | None:
+        """Schedule the build of the candidate ahead of the installation.
+
+        Return the future of the build, or None if it isn't scheduled. Override it to return None
+        if the manager doesn't install the packages from the wheels built by :meth:`build`.
+        """
+        if self.build_scheduler is None:
+            return None
+        return self.build_scheduler.submit(candidate)
+
+    def build(self, candidate: Candidate, prepared: PreparedCandidate | None = None) -> Path:
+        """Get the wheel of the candidate to install, building it if needed"""
+        if self.build_scheduler is None:
+            return (prepared or candidate.prepare(self.environment)).build()
+        return self.build_scheduler.build(candidate)
+
     def get_paths_to_remove(self, dist: Distribution) -> BaseRemovePaths:
         """Get the path collection to be removed from the disk"""
         return StashedRemovePaths.from_dist(dist, environment=self.environment)
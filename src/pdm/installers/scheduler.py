@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from pdm import termui
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pdm.environments import BaseEnvironment
+    from pdm.models.candidates import Candidate
+
+
+class BuildScheduler:
+    """Build candidates into wheels on a bounded pool of workers.
+
+    Each build runs the backend in its own subprocess, so the size of the pool
+    bounds the number of concurrent build processes. A candidate is built at most
+    once, a failed build is only scheduled again after :meth:`discard_failed`.
+    """
+
+    def __init__(self, environment: BaseEnvironment, jobs: int | None = None) -> None:
+        self.environment = environment
+        self.jobs = max(jobs or os.cpu_count() or 1, 1)
+        self._executor = ThreadPoolExecutor(self.jobs, thread_name_prefix="pdm-build")
+        self._futures: dict[str, Future[Path]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def requires_build(candidate: Candidate) -> bool:
+        """Whether the candidate is known to be built from source before it is fetched."""
+        if not candidate.req.is_named:  # local paths, VCS and URL requirements
+            return candidate.link is None or not candidate.link.is_wheel
+        return candidate.link is not None and not candidate.link.is_wheel
+
+    def is_scheduled(self, candidate: Candidate) -> bool:
+        with self._lock:
+            return candidate.identify() in self._futures
+
+    def submit(self, candidate: Candidate) -> Future[Path]:
+        """Schedule the build of the candidate, return the future of the built wheel."""
+        key = candidate.identify()
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                termui.logger.debug("Scheduling the build of %s", key)
+                prepared = candidate.prepare(self.environment)
+                future = self._futures[key] = self._executor.submit(prepared.build)
+            return future
+
+    def build(self, candidate: Candidate) -> Path:
+        """Get the wheel of the candidate, waiting for the build on the pool if it needs one."""
+        if not self.is_scheduled(candidate):
+            wheel = candidate.prepare(self.environment).fetch()
+            if wheel is not None:
+                return wheel
+        return self.submit(candidate).result()
+
+    def discard_failed(self) -> None:
+        """Forget the failed builds, so that they are scheduled again when the installation is retried."""
+        with self._lock:
+            for key, future in list(self._futures.items()):
+                if future.done() and (future.cancelled() or future.exception() is not None):
+                    del self._futures[key]
+
+    def shutdown(self, cancel: bool = False) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
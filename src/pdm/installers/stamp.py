@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pdm.termui import logger
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from pdm.environments import BaseEnvironment
+
+
+def _hash_file(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class SyncStamp:
+    """A stamp recorded in the cache after a successful sync of an environment.
+
+    It records the inputs of the sync and the installed distributions, so that a sync
+    with the same inputs can be skipped if the environment hasn't been changed since.
+    The stamps are stored under the metadata cache, keyed by the interpreter, the
+    install prefix of the environment and the project.
+    """
+
+    def __init__(self, environment: BaseEnvironment, inputs: dict[str, Any]) -> None:
+        self.environment = environment
+        project = environment.project
+        self.inputs = {
+            **inputs,
+            "project": str(project.root),
+            "interpreter": str(environment.interpreter.executable),
+            "pyproject": _hash_file(project.pyproject._path),
+            "lockfile": _hash_file(project.lockfile._path),
+            "overrides": [[override, _hash_file(Path(override))] for override in project.core.state.overrides],
+            "compile": project.core.state.compile_bytecode,
+            "config": {
+                key: project.config.get(key)
+                for key in ("install.cache", "install.cache_method", "install.compile", "use_uv")
+            },
+        }
+
+    @cached_property
+    def path(self) -> Path | None:
+        project = self.environment.project
+        data_dir = self.environment.get_paths().get("data")
+        if not data_dir or not project.core.state.enable_cache:
+            return None
+        key = [str(self.environment.interpreter.executable), os.path.normcase(data_dir), str(project.root)]
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return project.cache("metadata") / "sync_stamps" / f"{digest[:32]}.json"
+
+    def _working_set_digest(self) -> str:
+        entries: list[str] = []
+        for key, dist in self.environment.get_working_set().items():
+            # The path of .dist-info directory contains the version, use it to save reading the metadata
+            path = getattr(dist, "_path", None)
+            entries.append(f"{key}:{path if isinstance(path, Path) else dist.version}")
+        return hashlib.sha256("\n".join(sorted(entries)).encode("utf-8")).hexdigest()
+
+    def is_fresh(self) -> bool:
+        """Whether the environment is synced with the same inputs and hasn't been changed since"""
+        if self.path is None:
+            return False
+        try:
+            data = json.loads(self.path.read_text("utf-8"))
+        except (OSError, ValueError):
+            return False
+        return data.get("inputs") == self.inputs and data.get("working_set") == self._working_set_digest()
+
+    def write(self) -> None:
+        if self.path is None:
+            return
+        data = {"inputs": self.inputs, "working_set": self._working_set_digest()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_file, self.path)
+        except OSError as e:
+            logger.debug("Failed to write the sync stamp %s: %s", self.path, e)
+
+    def clear(self) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug("Failed to remove the sync stamp %s: %s", self.path, e)
@@ -1,25 +1,132 @@
 from __future__ import annotations
 
+import contextlib
 import functools
+import os
+import threading
 import traceback
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import chain
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
 from pdm import termui
 from pdm.exceptions import InstallationError
 from pdm.installers.base import BaseSynchronizer
+from pdm.installers.scheduler import BuildScheduler
 from pdm.models.candidates import Candidate
 from pdm.models.reporter import CandidateReporter, InstallationStatus, RichProgressReporter
 from pdm.models.requirements import strip_extras
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from importlib.metadata import Distribution
+    from pathlib import Path
 
     from rich.progress import Progress
 
+    from pdm.installers.manager import InstallManager
+
+
+class _FetchStage:
+    """Fetch the packages ahead of the installation on the network workers, and send
+    the ones to be built to the build scheduler.
+
+    At most ``max_pending`` packages are fetched and not installed yet, the workers
+    wait for the installation to catch up when the limit is reached.
+    """
+
+    def __init__(self, manager: InstallManager, max_pending: int, workers: int | None = None) -> None:
+        self.manager = manager
+        # The same default as ThreadPoolExecutor, for IO bound tasks
+        self._workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix="pdm-fetch")
+        self._slots = threading.Semaphore(max_pending)
+        self._pending: dict[Future, tuple[str, str]] = {}
+        self._closed = False
+
+    def _fetch(self, candidate: Candidate) -> Future[Path] | None:
+        self._slots.acquire()
+        if self._closed:
+            return None
+        return self.manager.fetch(candidate)
+
+    def start(self, jobs: list[tuple[str, str, Candidate]]) -> None:
+        for kind, key, candidate in jobs:
+            self._pending[self._executor.submit(self._fetch, candidate)] = (kind, key)
+
+    def ready(self) -> Iterator[tuple[str, str]]:
+        """Yield the jobs as soon as their packages are ready to install"""
+        while self._pending and not self._closed:
+            done, _ = wait(self._pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = self._pending.pop(future)
+                if (
+                    not future.cancelled()
+                    and future.exception() is None
+                    and isinstance(build := future.result(), Future)
+                ):
+                    self._pending[build] = job
+                else:
+                    # The errors will be raised again by the installation
+                    yield job
+
+    def on_installed(self, future: Future) -> None:
+        """Callback when the installation of a fetched package is done"""
+        self._slots.release()
+
+    def close(self) -> None:
+        self._closed = True
+        for future in self._pending:
+            future.cancel()
+        # Wake up the workers waiting for the installation
+        for _ in range(self._workers):
+            self._slots.release()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
 
 class Synchronizer(BaseSynchronizer):
+    # The number of packages that can be fetched ahead of the installation
+    MAX_PENDING_INSTALLS = 32
+
+    @contextlib.contextmanager
+    def _scheduling_builds(self, jobs: list[tuple[str, str]]) -> Iterator[None]:
+        """Queue the builds of the packages to install on the build scheduler up front"""
+        if not self.parallel:
+            yield
+            return
+        project = self.environment.project
+        scheduler = self.manager.build_scheduler = BuildScheduler(
+            self.environment, project.config.get("install.build_jobs")
+        )
+        # Non-isolated builds depend on the packages installed in the environment, don't build them ahead
+        if project.core.state.build_isolation:
+            for kind, key in jobs:
+                if kind == "remove" or key in self.SEQUENTIAL_PACKAGES:
+                    continue
+                if scheduler.requires_build(self.candidates[key]):
+                    self.manager.schedule(self.candidates[key])
+        try:
+            yield
+        except BaseException:
+            scheduler.shutdown(cancel=True)
+            raise
+        else:
+            scheduler.shutdown()
+        finally:
+            self.manager.build_scheduler = None
+
+    def _compile_bytecode(self, files: list[str]) -> None:
+        """Compile the bytecode of the installed files with the target interpreter"""
+        from subprocess import CalledProcessError
+
+        from pdm.models.in_process import compile_bytecode
+
+        try:
+            compile_bytecode(str(self.environment.interpreter.executable), files)
+        except CalledProcessError as e:
+            termui.logger.warning("Failed to compile the bytecode of the installed packages: %s", e)
+
     def install_candidate(self, key: str, progress: Progress) -> Candidate:
         """Install candidate"""
         can = self.candidates[key]
@@ -182,31 +289,51 @@ class Synchronizer(BaseSynchronizer):
                         job.cancel()
                     state.mark_failed = True
 
+        project = self.environment.project
+        if project.core.state.compile_bytecode and project.config["install.compile"] == "deferred":
+            # Collect the installed files and compile them all at once when the installation is done
+            self.manager.compile_targets = []
         # get rich progress and live handler to deal with multiple spinners
-        with InstallationStatus(self.ui, "Synchronizing") as status:
+        with (
+            self._scheduling_builds(sequential_jobs + parallel_jobs),
+            InstallationStatus(self.ui, "Synchronizing") as status,
+        ):
             for i in range(self.retry_times + 1):
                 status.update_spinner(completed=0, total=len(sequential_jobs) + len(parallel_jobs))
-                for kind, key in sequential_jobs:
-                    try:
-                        handlers[kind](key, status.progress)
-                    except Exception:
-                        termui.logger.exception("Error occurs: ")
-                        state.sequential_failed.append((kind, key))
-                        state.errors.extend([f"{kind} [success]{key}[/] failed:\n", traceback.format_exc()])
-                        if self.fail_fast:
-                            state.mark_failed = True
-                            break
-                    finally:
-                        status.update_spinner(advance=1)
-                if state.mark_failed:
-                    break
-                state.jobs.clear()
-                if parallel_jobs:
-                    with ThreadPoolExecutor() as executor:
-                        for kind, key in parallel_jobs:
-                            future = executor.submit(handlers[kind], key, status.progress)
-                            future.add_done_callback(functools.partial(update_progress, kind=kind, key=key))
-                            state.jobs.append(future)
+                # Start fetching the packages while the sequential jobs are running
+                fetcher = _FetchStage(self.manager, self.MAX_PENDING_INSTALLS)
+                try:
+                    fetcher.start(
+                        [(kind, key, self.candidates[key]) for kind, key in parallel_jobs if kind != "remove"]
+                    )
+                    for kind, key in sequential_jobs:
+                        try:
+                            handlers[kind](key, status.progress)
+                        except Exception:
+                            termui.logger.exception("Error occurs: ")
+                            state.sequential_failed.append((kind, key))
+                            state.errors.extend([f"{kind} [success]{key}[/] failed:\n", traceback.format_exc()])
+                            if self.fail_fast:
+                                state.mark_failed = True
+                                break
+                        finally:
+                            status.update_spinner(advance=1)
+                    if state.mark_failed:
+                        break
+                    state.jobs.clear()
+                    if parallel_jobs:
+                        with ThreadPoolExecutor(thread_name_prefix="pdm-install") as executor:
+                            removals = [(kind, key) for kind, key in parallel_jobs if kind == "remove"]
+                            for kind, key in chain(removals, fetcher.ready()):
+                                if state.mark_failed:
+                                    break
+                                future = executor.submit(handlers[kind], key, status.progress)
+                                future.add_done_callback(functools.partial(update_progress, kind=kind, key=key))
+                                if kind != "remove":
+                                    future.add_done_callback(fetcher.on_installed)
+                                state.jobs.append(future)
+                finally:
+                    fetcher.close()
                 if (
                     state.mark_failed
                     or i == self.retry_times
@@ -216,6 +343,9 @@ class Synchronizer(BaseSynchronizer):
                 sequential_jobs, state.sequential_failed = state.sequential_failed, []
                 parallel_jobs, state.parallel_failed = state.parallel_failed, []
                 state.errors.clear()
+                if self.manager.build_scheduler is not None:
+                    # The failed builds are scheduled again by the fetch stage of the next round
+                    self.manager.build_scheduler.discard_failed()
                 status.update_spinner(description=f"Retry failed jobs({i + 2}/{self.retry_times + 1})")
 
             try:
@@ -237,7 +367,11 @@ class Synchronizer(BaseSynchronizer):
                     else:
                         self.install_candidate(self_key, status.progress)
 
+                if self.manager.compile_targets:
+                    status.update_spinner(description="Compiling bytecode...")
+                    self._compile_bytecode(self.manager.compile_targets)
                 status.update_spinner(description=f"{termui.Emoji.POPPER} All complete!")
             finally:
+                self.manager.compile_targets = None
                 # Now we remove the .pdmtmp suffix from the installed packages
                 self._fix_pth_files()
@@ -2,13 +2,22 @@ from __future__ import annotations
 
 import contextlib
 import hashlib
+import importlib.metadata as im
 import json
 import os
+import pickle
+import shutil
+import sqlite3
 import stat
-from collections.abc import Iterable
+import struct
+import sys
+import threading
+import time
+import zipfile
+from collections.abc import Callable, Iterable
 from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from packaging.utils import canonicalize_name, parse_wheel_filename
 
@@ -18,7 +27,7 @@ from pdm.models.cached_package import CachedPackage
 from pdm.models.candidates import Candidate
 from pdm.models.markers import EnvSpec
 from pdm.termui import logger
-from pdm.utils import atomic_open_for_write, create_tracked_tempdir, make_file_executable
+from pdm.utils import create_tracked_tempdir, make_file_executable
 
 if TYPE_CHECKING:
     from httpx import Client
@@ -27,6 +36,7 @@ if TYPE_CHECKING:
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
+T = TypeVar("T")
 
 
 class JSONFileCache(Generic[KT, VT]):
@@ -68,11 +78,181 @@ class JSONFileCache(Generic[KT, VT]):
         self._write_cache()
 
 
-class CandidateInfoCache(JSONFileCache[Candidate, CandidateInfo]):
+class SQLiteCache(Generic[KT, VT]):
+    """A cache that stores key-value pairs in an indexed SQLite database.
+
+    Entries are looked up on demand instead of being loaded at once, and writes are
+    buffered in memory and flushed in batches. The database runs in WAL mode so that
+    it can be shared by concurrent PDM processes.
+
+    If ``TRACK_ACCESS`` is true, the time an entry is last read is recorded along
+    with it, so that ``pdm cache prune`` can evict the least recently used entries.
+    """
+
+    BATCH_SIZE = 200
+    BUSY_TIMEOUT = 30
+    TRACK_ACCESS = False
+
+    def __init__(self, cache_file: Path | str) -> None:
+        self.cache_file = Path(cache_file)
+        self._pending: dict[str, VT] = {}
+        self._accessed: set[str] = set()
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+
+    def _create_table(self, conn: sqlite3.Connection) -> None:
+        conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL)")
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        if "last_used" not in columns:
+            # Databases created by older versions of PDM
+            conn.execute("ALTER TABLE cache ADD COLUMN last_used REAL")
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.cache_file, timeout=self.BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._create_table(conn)
+        except (OSError, sqlite3.Error) as e:
+            logger.debug("Failed to open the cache database %s: %s", self.cache_file, e)
+            self._disabled = True
+            return None
+        self._conn = conn
+        return conn
+
+    def __contains__(self, obj: KT) -> bool:
+        try:
+            self.get(obj)
+        except KeyError:
+            return False
+        return True
+
+    @classmethod
+    def _get_key(cls, obj: KT) -> str:
+        return str(obj)
+
+    def get(self, obj: KT) -> VT:
+        key = self._get_key(obj)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            conn = self._connect()
+            if conn is None:
+                raise KeyError(key)
+            try:
+                row = conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                logger.debug("Failed to read from the cache database %s: %s", self.cache_file, e)
+                row = None
+        if row is None:
+            raise KeyError(key)
+        self._record_access([key])
+        return json.loads(row[0])
+
+    def get_many(self, objs: Iterable[KT]) -> dict[KT, VT]:
+        """Look up multiple entries at once, missing entries are omitted from the result."""
+        keys = {self._get_key(obj): obj for obj in objs}
+        result: dict[KT, VT] = {}
+        with self._lock:
+            remaining = [key for key in keys if key not in self._pending]
+            result.update((keys[key], self._pending[key]) for key in keys if key in self._pending)
+            conn = self._connect()
+            if conn is None:
+                return result
+            try:
+                for i in range(0, len(remaining), self.BATCH_SIZE):
+                    chunk = remaining[i : i + self.BATCH_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(f"SELECT key, value FROM cache WHERE key IN ({placeholders})", chunk)
+                    found = dict(rows)
+                    result.update((keys[key], json.loads(value)) for key, value in found.items())
+                    self._record_access(found)
+            except sqlite3.Error as e:
+                logger.debug("Failed to read from the cache database %s: %s", self.cache_file, e)
+        return result
+
+    def _record_access(self, keys: Iterable[str]) -> None:
+        """Remember the entries that are read, their access time is written along with the next flush."""
+        if not self.TRACK_ACCESS:
+            return
+        with self._lock:
+            self._accessed.update(keys)
+            if len(self._accessed) >= self.BATCH_SIZE:
+                self.flush()
+
+    def set(self, obj: KT, value: VT) -> None:
+        key = self._get_key(obj)
+        with self._lock:
+            self._pending[key] = value
+            if len(self._pending) >= self.BATCH_SIZE:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write all pending entries and access times to the database in a single transaction."""
+        with self._lock:
+            if not self._pending and not self._accessed:
+                return
+            pending, self._pending = self._pending, {}
+            accessed, self._accessed = self._accessed - pending.keys(), set()
+            conn = self._connect()
+            if conn is None:
+                return
+            now = time.time()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, last_used) VALUES (?, ?, ?)",
+                    [(key, json.dumps(value), now) for key, value in pending.items()],
+                )
+                conn.executemany("UPDATE cache SET last_used = ? WHERE key = ?", [(now, key) for key in accessed])
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                logger.debug("Failed to write to the cache database %s: %s", self.cache_file, e)
+                with contextlib.suppress(sqlite3.Error):
+                    conn.execute("ROLLBACK")
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __del__(self) -> None:
+        with contextlib.suppress(Exception):
+            self.close()
+
+
+class CandidateInfoCache(SQLiteCache[Candidate, CandidateInfo]):
     """A cache manager that stores the
     candidate -> (dependencies, requires_python, summary) mapping.
     """
 
+    TRACK_ACCESS = True
+
+    def _create_table(self, conn: sqlite3.Connection) -> None:
+        super()._create_table(conn)
+        # Migrate the entries from the legacy JSON cache file, if any.
+        legacy_file = self.cache_file.with_suffix(".json")
+        if not legacy_file.exists():
+            return
+        try:
+            data = json.loads(legacy_file.read_text("utf-8"))
+            rows = [(key, json.dumps(value)) for key, value in data.items()]
+        except (OSError, ValueError, AttributeError):
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("INSERT OR IGNORE INTO cache (key, value) VALUES (?, ?)", rows)
+        conn.execute("COMMIT")
+        with contextlib.suppress(OSError):
+            legacy_file.unlink()
+
     @staticmethod
     def get_url_part(link: Link) -> str:
         import base64
@@ -95,12 +275,51 @@ class CandidateInfoCache(JSONFileCache[Candidate, CandidateInfo]):
         return f"{obj.name}{extras}-{version}"
 
 
+class _HashStore(SQLiteCache[str, str]):
+    """The database behind :class:`HashCache`, keyed by the sha224 digest of the URL."""
+
+    TRACK_ACCESS = True
+
+    @classmethod
+    def _get_key(cls, obj: str) -> str:
+        return hashlib.sha224(obj.encode("utf-8")).hexdigest()
+
+    def _create_table(self, conn: sqlite3.Connection) -> None:
+        super()._create_table(conn)
+        self._migrate_legacy_tree(conn)
+
+    def _migrate_legacy_tree(self, conn: sqlite3.Connection) -> None:
+        """Import the hashes stored in the legacy one-file-per-URL layout and remove it.
+
+        The legacy layout stores each hash under ``aa/bb/cc/dd/<rest>`` where the path
+        parts joined together form the sha224 digest of the URL.
+        """
+        directory = self.cache_file.parent
+        legacy_roots = [p for p in directory.iterdir() if p.is_dir() and len(p.name) == 2]
+        if not legacy_roots:
+            return
+        rows: list[tuple[str, str]] = []
+        for root in legacy_roots:
+            for path in root.glob("*/*/*/*"):
+                with contextlib.suppress(OSError, UnicodeError):
+                    key = "".join(path.relative_to(directory).parts)
+                    rows.append((key, json.dumps(path.read_text("utf-8").strip())))
+        logger.debug("Migrating %d cached hashes into %s", len(rows), self.cache_file)
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("INSERT OR IGNORE INTO cache (key, value) VALUES (?, ?)", rows)
+        conn.execute("COMMIT")
+        for root in legacy_roots:
+            shutil.rmtree(root, ignore_errors=True)
+
+
 class HashCache:
     """Caches hashes of PyPI artifacts so we do not need to re-download them.
 
     Hashes are only cached when the URL appears to contain a hash in it and the
     cache key includes the hash value returned from the server). This ought to
     avoid issues where the location on the server changes.
+
+    All hashes are stored in a single indexed database under the cache directory.
     """
 
     FAVORITE_HASH = "sha256"
@@ -108,6 +327,8 @@ class HashCache:
 
     def __init__(self, directory: Path | str) -> None:
         self.directory = Path(directory)
+        self.cache_file = self.directory / "hashes.db"
+        self._store = _HashStore(self.cache_file)
 
     def _read_from_link(self, link: Link, session: Client) -> Iterable[bytes]:
         if link.is_file:
@@ -153,23 +374,286 @@ class HashCache:
                 self.set(link.url_without_fragment, hash_value)
         return hash_value
 
-    def _get_path_for_key(self, key: str) -> Path:
-        hashed = hashlib.sha224(key.encode("utf-8")).hexdigest()
-        parts = (hashed[:2], hashed[2:4], hashed[4:6], hashed[6:8], hashed[8:])
-        return self.directory.joinpath(*parts)
-
     def get(self, url: str) -> str | None:
-        path = self._get_path_for_key(url)
-        with contextlib.suppress(OSError, UnicodeError):
-            return path.read_text("utf-8").strip()
-        return None
+        try:
+            return self._store.get(url)
+        except KeyError:
+            return None
+
+    def get_many(self, urls: Iterable[str]) -> dict[str, str]:
+        """Get the cached hashes of the given URLs in one lookup.
+
+        URLs without a cached hash are omitted from the result.
+        """
+        return self._store.get_many(urls)
 
     def set(self, url: str, hash: str) -> None:
-        path = self._get_path_for_key(url)
-        with contextlib.suppress(OSError, UnicodeError):
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with atomic_open_for_write(path, encoding="utf-8") as fp:
-                fp.write(hash)
+        self._store.set(url, hash)
+
+    def flush(self) -> None:
+        self._store.flush()
+
+
+class CacheUsage(SQLiteCache[Path, float]):
+    """Records when each cache entry was last used, for the LRU eviction of caches.
+
+    The access time is tracked here instead of relying on the file system atime,
+    which is often disabled or coarse.
+    """
+
+    @classmethod
+    def _get_key(cls, obj: Path) -> str:
+        return Path(obj).as_posix()
+
+    def touch(self, path: Path | str) -> None:
+        self.set(Path(path), time.time())
+
+    def forget(self, paths: Iterable[Path]) -> None:
+        keys = [(self._get_key(path),) for path in paths]
+        with self._lock:
+            self.flush()
+            conn = self._connect()
+            if conn is None or not keys:
+                return
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany("DELETE FROM cache WHERE key = ?", keys)
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                logger.debug("Failed to write to the cache database %s: %s", self.cache_file, e)
+                with contextlib.suppress(sqlite3.Error):
+                    conn.execute("ROLLBACK")
+
+
+class InterpreterCache(SQLiteCache[str, dict[str, Any]]):
+    """Stores the results of the probes that run in a subprocess of a python interpreter.
+
+    Each entry records the fingerprint of the interpreter executable, and is computed
+    again when the interpreter is upgraded or replaced.
+    """
+
+    @staticmethod
+    def _fingerprint(executable: str) -> list[int]:
+        st = os.stat(executable)
+        return [st.st_ino, st.st_mtime_ns, st.st_size]
+
+    def get_or_probe(self, executable: str, key: list[Any], probe: Callable[[], T]) -> T:
+        """Return the cached result of the probe, or run it and save the result."""
+        try:
+            fingerprint = self._fingerprint(executable)
+        except OSError:
+            return probe()
+        cache_key = json.dumps([executable, *key])
+        with contextlib.suppress(KeyError):
+            entry = self.get(cache_key)
+            if entry["fingerprint"] == fingerprint:
+                return entry["result"]
+        result = probe()
+        self.set(cache_key, {"fingerprint": fingerprint, "result": result})
+        # Probes are rare, write the result at once so that other processes can reuse it
+        self.flush()
+        return result
+
+
+class EntryPointCache:
+    """An index of the entry points in the given groups, which saves scanning the
+    metadata of all installed distributions on every run.
+
+    The index is rebuilt when any of the ``sys.path`` entries is modified, which
+    happens when a distribution is installed into or removed from it.
+    """
+
+    def __init__(self, cache_file: Path | str) -> None:
+        self.cache_file = Path(cache_file)
+
+    @staticmethod
+    def _fingerprint() -> list[list[Any]]:
+        result: list[list[Any]] = []
+        for path in sys.path:
+            try:
+                result.append([path, os.stat(path or ".").st_mtime_ns])
+            except OSError:
+                result.append([path, None])
+        return result
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with self.cache_file.open(encoding="utf-8") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: dict[str, Any]) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            logger.debug("Failed to write the entry point cache %s: %s", self.cache_file, e)
+
+    def get(self, groups: Iterable[str]) -> list[im.EntryPoint]:
+        """Return the entry points in the groups, scanning the distributions only if the index is stale."""
+        groups = list(groups)
+        fingerprint = self._fingerprint()
+        data = self._read()
+        if data.get("fingerprint") == fingerprint and data.get("groups") == groups:
+            return [im.EntryPoint(name, value, group) for name, value, group in data["entry_points"]]
+        entry_points = [ep for group in groups for ep in im.entry_points(group=group)]
+        self._write(
+            {
+                "fingerprint": fingerprint,
+                "groups": groups,
+                "entry_points": [[ep.name, ep.value, ep.group] for ep in entry_points],
+            }
+        )
+        return entry_points
+
+
+class WorkingSetCache:
+    """A snapshot of the distributions installed in the library paths, which saves
+    scanning the directories and reading the metadata on every run.
+
+    The snapshot is taken again when any of the paths, or the directories containing
+    the distributions found, is modified, which happens when a distribution is
+    installed into or removed from it.
+    """
+
+    # Don't trust the modification times that may be changed again in the same tick
+    RACY_THRESHOLD = 2
+
+    def __init__(self, cache_dir: Path | str) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def _get_file(self, paths: list[str]) -> Path:
+        key = hashlib.sha256(json.dumps(paths).encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def _fingerprint(dirs: Iterable[str]) -> list[list[Any]]:
+        result: list[list[Any]] = []
+        for path in dirs:
+            try:
+                result.append([path, os.stat(path).st_mtime_ns])
+            except OSError:
+                result.append([path, None])
+        return result
+
+    def get(
+        self, paths: list[str], scan: Callable[[], list[tuple[str, im.Distribution]]]
+    ) -> list[tuple[str, im.Distribution]]:
+        """Return the named distributions in the paths, calling `scan` only if the snapshot is stale."""
+        cache_file = self._get_file(paths)
+        try:
+            with cache_file.open(encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            data = {}
+        if (
+            data.get("paths") == paths
+            and self._fingerprint(path for path, _ in data["fingerprint"]) == data["fingerprint"]
+        ):
+            result: list[tuple[str, im.Distribution]] = []
+            for name, path, link_file in data["distributions"]:
+                dist = im.PathDistribution(Path(path))
+                if link_file is not None:
+                    dist.link_file = Path(link_file)  # type: ignore[attr-defined]
+                result.append((name, dist))
+            return result
+
+        result = scan()
+        distributions: list[list[Any]] = []
+        for name, dist in result:
+            path = getattr(dist, "_path", None)
+            if not isinstance(path, Path):  # Not found on the file system, can't take a snapshot
+                return result
+            link_file = getattr(dist, "link_file", None)
+            distributions.append([name, str(path), None if link_file is None else str(link_file)])
+        fingerprint = self._fingerprint(
+            dict.fromkeys([*paths, *(os.path.dirname(path) for _, path, _ in distributions)])
+        )
+        threshold = (time.time() - self.RACY_THRESHOLD) * 1e9
+        if any(mtime is not None and mtime > threshold for _, mtime in fingerprint):
+            return result
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            temp_file.write_text(
+                json.dumps({"paths": paths, "fingerprint": fingerprint, "distributions": distributions}),
+                encoding="utf-8",
+            )
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.debug("Failed to write the working set cache %s: %s", cache_file, e)
+        return result
+
+
+class EmptyWorkingSetCache(WorkingSetCache):
+    def get(
+        self, paths: list[str], scan: Callable[[], list[tuple[str, im.Distribution]]]
+    ) -> list[tuple[str, im.Distribution]]:
+        return scan()
+
+
+class LockfileCache:
+    """A cache of the parsed lockfiles, stored as pickle files, which saves parsing the
+    TOML document and the requirements in it on every run.
+
+    The first part of the key names the kind of the cached data. Each kind has a single
+    file per scope, usually the project, which is overwritten by every write, so stale
+    entries don't pile up. The full key, with the version of PDM, is stored along with
+    the value and checked when it is read.
+    """
+
+    def __init__(self, cache_dir: Path | str, scope: str = "") -> None:
+        self.cache_dir = Path(cache_dir)
+        self.scope = scope
+
+    def _get_file(self, key: list[str]) -> Path:
+        digest = hashlib.sha256(json.dumps([self.scope, key[0]]).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest[:32]}.pickle"
+
+    @staticmethod
+    def _get_full_key(key: list[str]) -> list[str]:
+        from pdm.__version__ import __version__
+
+        return [__version__, *key]
+
+    def get(self, key: Iterable[str]) -> Any:
+        key = list(key)
+        cache_file = self._get_file(key)
+        try:
+            with cache_file.open("rb") as fp:
+                stored_key, value = pickle.load(fp)
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        except Exception as e:
+            logger.debug("Failed to load the lockfile cache %s: %s", cache_file, e)
+            raise KeyError(key) from None
+        if stored_key != self._get_full_key(key):
+            raise KeyError(key)
+        return value
+
+    def set(self, key: Iterable[str], value: Any) -> None:
+        key = list(key)
+        cache_file = self._get_file(key)
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_file.write_bytes(pickle.dumps((self._get_full_key(key), value), protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(temp_file, cache_file)
+        except (OSError, pickle.PicklingError) as e:
+            logger.debug("Failed to write the lockfile cache %s: %s", cache_file, e)
+            with contextlib.suppress(OSError):
+                temp_file.unlink()
+
+
+class EmptyLockfileCache(LockfileCache):
+    def get(self, key: Iterable[str]) -> Any:
+        raise KeyError(key)
+
+    def set(self, key: Iterable[str], value: Any) -> None:
+        pass
 
 
 class EmptyCandidateInfoCache(CandidateInfoCache):
@@ -179,11 +663,25 @@ class EmptyCandidateInfoCache(CandidateInfoCache):
     def set(self, obj: Candidate, value: CandidateInfo) -> None:
         pass
 
+    def flush(self) -> None:
+        pass
+
+
+class EmptyInterpreterCache(InterpreterCache):
+    def get(self, obj: str) -> dict[str, Any]:
+        raise KeyError
+
+    def set(self, obj: str, value: dict[str, Any]) -> None:
+        pass
+
 
 class EmptyHashCache(HashCache):
     def get(self, url: str) -> str | None:
         return None
 
+    def get_many(self, urls: Iterable[str]) -> dict[str, str]:
+        return {}
+
     def set(self, url: str, hash: str) -> None:
         pass
 
@@ -191,14 +689,20 @@ class EmptyHashCache(HashCache):
 class WheelCache:
     """Caches wheels so we do not need to rebuild them.
 
-    Wheels are only cached when the URL contains egg-info or is a VCS repository
-    with an *immutable* revision. There might be more than one wheels built for
+    Wheels are only cached when the URL contains egg-info, is a VCS repository
+    with an *immutable* revision, or is a local directory, keyed by the fingerprint
+    of its source tree. There might be more than one wheels built for
     one sdist, the one with most preferred tag will be returned.
+
+    The best compatible wheel of each cache directory is memorized in a per-process
+    index, which is invalidated when a wheel is written to that directory.
     """
 
     def __init__(self, directory: Path | str) -> None:
         self.directory = Path(directory)
         self.ephemeral_directory = Path(create_tracked_tempdir(prefix="pdm-wheel-cache-"))
+        self._index: dict[tuple[Path, str, EnvSpec], Path | None] = {}
+        self._index_lock = threading.Lock()
 
     def _get_candidates(self, path: Path) -> Iterable[Path]:
         if not path.exists():
@@ -207,7 +711,7 @@ class WheelCache:
             if candidate.name.endswith(".whl"):
                 yield candidate
 
-    def _get_path_parts(self, link: Link, env_spec: EnvSpec) -> tuple[str, ...]:
+    def _get_path_parts(self, link: Link, env_spec: EnvSpec, fingerprint: str | None = None) -> tuple[str, ...]:
         hash_key = {
             "url": link.url_without_fragment,
             # target env participates in the hash key to handle the some cases
@@ -219,30 +723,56 @@ class WheelCache:
             hash_key["subdirectory"] = link.subdirectory
         if link.hash and link.hash_name:
             hash_key[link.hash_name] = link.hash
+        if fingerprint:
+            # The content hash of a local source tree, see `get_source_tree_fingerprint()`
+            hash_key["fingerprint"] = fingerprint
         hashed = hashlib.sha224(
             json.dumps(hash_key, sort_keys=True, separators=(",", ":"), ensure_ascii=True).encode("utf-8")
         ).hexdigest()
         return (hashed[:2], hashed[2:4], hashed[4:6], hashed[6:])
 
-    def get_path_for_link(self, link: Link, env_spec: EnvSpec) -> Path:
-        parts = self._get_path_parts(link, env_spec)
+    def get_path_for_link(self, link: Link, env_spec: EnvSpec, fingerprint: str | None = None) -> Path:
+        parts = self._get_path_parts(link, env_spec, fingerprint)
         return self.directory.joinpath(*parts)
 
-    def get_ephemeral_path_for_link(self, link: Link, env_spec: EnvSpec) -> Path:
-        parts = self._get_path_parts(link, env_spec)
+    def get_ephemeral_path_for_link(self, link: Link, env_spec: EnvSpec, fingerprint: str | None = None) -> Path:
+        parts = self._get_path_parts(link, env_spec, fingerprint)
         return self.ephemeral_directory.joinpath(*parts)
 
-    def get(self, link: Link, project_name: str | None, env_spec: EnvSpec) -> Path | None:
+    def get(
+        self, link: Link, project_name: str | None, env_spec: EnvSpec, fingerprint: str | None = None
+    ) -> Path | None:
         if not project_name:
             return None
         canonical_name = canonicalize_name(project_name)
 
-        candidate = self._get_from_path(self.get_path_for_link(link, env_spec), canonical_name, env_spec)
+        candidate = self._get_from_path(self.get_path_for_link(link, env_spec, fingerprint), canonical_name, env_spec)
         if candidate is not None:
             return candidate
-        return self._get_from_path(self.get_ephemeral_path_for_link(link, env_spec), canonical_name, env_spec)
+        return self._get_from_path(
+            self.get_ephemeral_path_for_link(link, env_spec, fingerprint), canonical_name, env_spec
+        )
+
+    def invalidate(self, path: Path | str) -> None:
+        """Drop the index entries of the given cache directory after it is written to."""
+        path = Path(path)
+        with self._index_lock:
+            for key in [key for key in self._index if key[0] == path]:
+                del self._index[key]
 
     def _get_from_path(self, path: Path, canonical_name: str, env_spec: EnvSpec) -> Path | None:
+        if not path.exists():
+            return None
+        key = (path, canonical_name, env_spec)
+        with self._index_lock:
+            if key in self._index and ((cached := self._index[key]) is None or cached.exists()):
+                return cached
+        result = self._find_best_match(path, canonical_name, env_spec)
+        with self._index_lock:
+            self._index[key] = result
+        return result
+
+    def _find_best_match(self, path: Path, canonical_name: str, env_spec: EnvSpec) -> Path | None:
         max_compatible_candidate: tuple[tuple[int, ...], Path | None] = ((-1, -1, -1, -1), None)
         for candidate in self._get_candidates(path):
             try:
@@ -271,14 +801,71 @@ def get_wheel_cache(directory: Path | str) -> WheelCache:
     return WheelCache(directory)
 
 
+UNPACK_BUFFER_SIZE = 1024 * 1024
+
+
+def _get_member_path(dest: Path, member: zipfile.ZipInfo) -> Path:
+    """Get the extraction path of a zip member, sanitized the same way as ``ZipFile.extract``."""
+    arcname = member.filename.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid_path_parts = ("", os.path.curdir, os.path.pardir)
+    return dest.joinpath(*(x for x in arcname.split(os.path.sep) if x not in invalid_path_parts))
+
+
+def _copy_stored_member(wheel_fd: int, member: zipfile.ZipInfo, out_fd: int) -> bool:
+    """Copy an uncompressed member with ``copy_file_range(2)``, which lets the kernel
+    clone or copy the data without a round trip through userspace.
+
+    Return False if it can't be done and the caller should fall back to a regular copy.
+    """
+    if not hasattr(os, "copy_file_range") or member.compress_type != zipfile.ZIP_STORED or member.flag_bits & 0x1:
+        return False
+    try:
+        header = struct.unpack(
+            zipfile.structFileHeader, os.pread(wheel_fd, zipfile.sizeFileHeader, member.header_offset)
+        )
+        # The local header may have a different extra field from the central directory.
+        offset = member.header_offset + zipfile.sizeFileHeader + header[10] + header[11]
+        written = 0
+        while written < member.file_size:
+            copied = os.copy_file_range(wheel_fd, out_fd, member.file_size - written, offset + written, written)
+            if copied == 0:
+                return False
+            written += copied
+    except (OSError, struct.error):
+        return False
+    return True
+
+
+def _extract_member(zf: zipfile.ZipFile, wheel_fd: int, member: zipfile.ZipInfo, target: Path) -> None:
+    with open(target, "wb") as fp:
+        if member.file_size and hasattr(os, "posix_fallocate"):
+            with contextlib.suppress(OSError):
+                os.posix_fallocate(fp.fileno(), 0, member.file_size)
+        if not _copy_stored_member(wheel_fd, member, fp.fileno()):
+            fp.seek(0)
+            with zf.open(member) as src:
+                shutil.copyfileobj(src, fp, UNPACK_BUFFER_SIZE)
+            fp.truncate()
+    mode = member.external_attr >> 16
+    if mode and stat.S_ISREG(mode) and mode & 0o111:
+        make_file_executable(target)
+
+
+def _extract_members(wheel: Path, wheel_fd: int, files: list[tuple[zipfile.ZipInfo, Path]]) -> None:
+    with zipfile.ZipFile(wheel) as zf:
+        for member, target in files:
+            _extract_member(zf, wheel_fd, member, target)
+
+
 class PackageCache:
     def __init__(self, root: Path) -> None:
         self.root = root
 
     def cache_wheel(self, wheel: Path) -> CachedPackage:
         """Create a CachedPackage instance from a wheel file"""
-        import zipfile
-
         dest = self.root.joinpath(f"{wheel.name}.cache")
         pkg = CachedPackage(dest, original_wheel=wheel)
         if dest.exists():
@@ -286,19 +873,40 @@ class PackageCache:
         dest.mkdir(parents=True, exist_ok=True)
         with pkg.lock():
             logger.info("Unpacking wheel into cached location %s", dest)
-            with zipfile.ZipFile(wheel) as zf:
-                try:
-                    for item in zf.infolist():
-                        target_path = zf.extract(item, dest)
-                        mode = item.external_attr >> 16
-                        is_executable = bool(mode and stat.S_ISREG(mode) and mode & 0o111)
-                        if is_executable:
-                            make_file_executable(target_path)
-                except Exception:  # pragma: no cover
-                    pkg.cleanup()  # cleanup on any error
-                    raise
+            try:
+                size, elapsed = self._unpack_wheel(wheel, dest)
+            except Exception:  # pragma: no cover
+                pkg.cleanup()  # cleanup on any error
+                raise
+            logger.info("Unpacked %s bytes from %s in %.2fs", size, wheel.name, elapsed)
         return pkg
 
+    @staticmethod
+    def _unpack_wheel(wheel: Path, dest: Path) -> tuple[int, float]:
+        """Extract the wheel members in parallel, return the total size and the time spent."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        start = time.perf_counter()
+        with zipfile.ZipFile(wheel) as zf, open(wheel, "rb") as wheel_fp:
+            files: list[tuple[zipfile.ZipInfo, Path]] = []
+            for member in zf.infolist():
+                target = _get_member_path(dest, member)
+                if member.is_dir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                files.append((member, target))
+            # ZipFile.open() isn't thread-safe, each worker reads the members from its own ZipFile
+            workers = min(len(files), (os.cpu_count() or 1) + 4, 32)
+            with ThreadPoolExecutor(max_workers=workers or 1) as executor:
+                futures = [
+                    executor.submit(_extract_members, wheel, wheel_fp.fileno(), files[i::workers])
+                    for i in range(workers)
+                ]
+                for future in futures:
+                    future.result()
+        return sum(member.file_size for member, _ in files), time.perf_counter() - start
+
     def iter_packages(self) -> Iterable[CachedPackage]:
         for path in self.root.rglob("*.whl.cache"):
             p = CachedPackage(path)
@@ -33,6 +33,7 @@ from pdm.utils import (
     convert_hashes,
     filtered_sources,
     get_rev_from_url,
+    is_path_relative_to,
     normalize_name,
     url_without_fragments,
 )
@@ -358,6 +359,18 @@ class PreparedCandidate:
             cast(Path, self._source_dir)
         )
 
+    @cached_property
+    def source_fingerprint(self) -> str | None:
+        """The content hash of the source tree of a non-editable local directory,
+        which tells whether it has changed since built or installed.
+        """
+        from pdm.models.fingerprint import get_source_tree_fingerprint
+
+        if self.req.editable or self._source_dir is None or not (self.link and self.link.is_file):
+            return None
+        assert self._unpacked_dir is not None
+        return get_source_tree_fingerprint(self._unpacked_dir)
+
     def direct_url(self) -> dict[str, Any] | None:
         """PEP 610 direct_url.json data"""
         req = self.req
@@ -390,7 +403,9 @@ class PreparedCandidate:
                 return _filter_none(
                     {
                         "url": self.link.url_without_fragment,
-                        "dir_info": _filter_none({"editable": req.editable or None}),
+                        "dir_info": _filter_none(
+                            {"editable": req.editable or None, "fingerprint": self.source_fingerprint}
+                        ),
                         "subdirectory": req.subdirectory,
                     }
                 )
@@ -407,6 +422,11 @@ class PreparedCandidate:
         else:
             return None
 
+    def fetch(self) -> Path | None:
+        """Download the candidate, return the wheel if it can be installed without a build"""
+        self._obtain(allow_all=False)
+        return self._cached
+
     def build(self) -> Path:
         """Call PEP 517 build hook to build the candidate into a wheel"""
         self._obtain(allow_all=False)
@@ -424,6 +444,10 @@ class PreparedCandidate:
         termui.logger.info("Running PEP 517 backend to build a wheel for %s", self.link)
         self.reporter.report_build_start(self.link.filename)  # type: ignore[union-attr]
         self._cached = Path(builder.build(build_dir, metadata_directory=self._metadata_dir))
+        wheel_cache = self.environment.project.make_wheel_cache()
+        wheel_cache.invalidate(build_dir)
+        if is_path_relative_to(self._cached, wheel_cache.directory):
+            self.environment.project.cache_usage.touch(self._cached)
         self.reporter.report_build_end(self.link.filename)  # type: ignore[union-attr]
         return self._cached
 
@@ -507,6 +531,10 @@ class PreparedCandidate:
             dist = self._get_metadata_from_metadata_link(self.link.dist_info_link, self.link.dist_info_metadata)
             if dist is not None:
                 return dist
+        elif self.link.is_wheel and not self.link.is_file and self.environment.project.config["pypi.lazy_wheel"]:
+            dist = self._get_metadata_from_lazy_wheel(self.link)
+            if dist is not None:
+                return dist
 
         self._unpack(validate_hashes=False)
         if self._cached:  # check again if the wheel is downloaded to local
@@ -534,6 +562,19 @@ class PreparedCandidate:
                 return None
         return MetadataDistribution(resp.text)
 
+    def _get_metadata_from_lazy_wheel(self, link: Link) -> im.Distribution | None:
+        # Read METADATA from the remote wheel with range requests, without downloading it
+        from zipfile import BadZipFile
+
+        from pdm.models.lazy_wheel import HTTPRangeRequestUnsupported, fetch_wheel_metadata
+
+        try:
+            text = fetch_wheel_metadata(link.normalized, self.environment.session)
+        except (HTTPRangeRequestUnsupported, BadZipFile) as e:
+            termui.logger.debug("Failed to read metadata lazily from %s, downloading the wheel: %s", link.redacted, e)
+            return None
+        return MetadataDistribution(text)
+
     def _get_metadata_from_wheel(self, wheel: Path) -> im.Distribution:
         # Get metadata from METADATA inside the wheel
         metadata_parent = self.environment.project.core.create_temp_dir(prefix="pdm-meta-")
@@ -661,9 +702,13 @@ class PreparedCandidate:
             return None
         wheel_cache = self.environment.project.make_wheel_cache()
         assert self.candidate.link
-        cache_entry = wheel_cache.get(self.candidate.link, self.candidate.name, self.environment.spec)
+        cache_entry = wheel_cache.get(
+            self.candidate.link, self.candidate.name, self.environment.spec, self.source_fingerprint
+        )
         if cache_entry is not None:
             termui.logger.info("Using cached wheel: %s", cache_entry)
+            if is_path_relative_to(cache_entry, wheel_cache.directory):
+                self.environment.project.cache_usage.touch(cache_entry)
         return cache_entry
 
     def _get_build_dir(self) -> str:
@@ -704,8 +749,12 @@ class PreparedCandidate:
     def _get_wheel_dir(self) -> str:
         assert self.candidate.link
         wheel_cache = self.environment.project.make_wheel_cache()
-        if self.should_cache():
+        fingerprint = self.source_fingerprint
+        # Local directories are cached by the fingerprint of the source tree
+        if self.should_cache() or (fingerprint and self.environment.project.core.state.enable_cache):
             termui.logger.info("Saving wheel to cache: %s", self.candidate.link)
-            return wheel_cache.get_path_for_link(self.candidate.link, self.environment.spec).as_posix()
+            return wheel_cache.get_path_for_link(self.candidate.link, self.environment.spec, fingerprint).as_posix()
         else:
-            return wheel_cache.get_ephemeral_path_for_link(self.candidate.link, self.environment.spec).as_posix()
+            return wheel_cache.get_ephemeral_path_for_link(
+                self.candidate.link, self.environment.spec, fingerprint
+            ).as_posix()
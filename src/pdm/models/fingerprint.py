@@ -0,0 +1,121 @@
+"""Content fingerprints of local source trees.
+
+A local directory requirement has no version or archive hash to tell whether it
+has changed since it was built or installed, so the files that make up the
+source tree are hashed instead.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import os
+import subprocess
+from collections.abc import Iterable
+from pathlib import Path
+
+from pdm.compat import tomllib
+from pdm.termui import logger
+
+# Names excluded at any depth: VCS metadata, bytecode and tool caches
+_EXCLUDED_NAMES = (
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    "*.pyc",
+    "*.egg-info",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+)
+# Names excluded at the top level only: build artifacts and environments
+_EXCLUDED_TOP_NAMES = ("build", "dist", ".pdm-build", ".pdm-python", ".venv", "__pypackages__", ".tox", ".nox")
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def _get_backend_excludes(root: Path) -> list[str]:
+    """Read the exclude patterns of known build backends from pyproject.toml"""
+    try:
+        with root.joinpath("pyproject.toml").open("rb") as f:
+            tool = tomllib.load(f).get("tool", {})
+    except (OSError, tomllib.TOMLDecodeError):
+        return []
+    hatch_build = tool.get("hatch", {}).get("build", {})
+    patterns = [
+        *tool.get("pdm", {}).get("build", {}).get("excludes", []),
+        *hatch_build.get("exclude", []),
+        *hatch_build.get("targets", {}).get("wheel", {}).get("exclude", []),
+    ]
+    return [pattern.strip("/").removeprefix("./") for pattern in patterns if isinstance(pattern, str)]
+
+
+def _is_excluded(relpath: str, patterns: list[str]) -> bool:
+    parts = relpath.split("/")
+    if parts[0] in _EXCLUDED_TOP_NAMES:
+        return True
+    if any(fnmatch.fnmatch(part, name) for part in parts for name in _EXCLUDED_NAMES):
+        return True
+    for pattern in patterns:
+        # A pattern matching a directory excludes everything under it
+        for candidate in (pattern, pattern.removeprefix("**/")):
+            if fnmatch.fnmatch(relpath, candidate) or fnmatch.fnmatch(relpath, f"{candidate}/*"):
+                return True
+    return False
+
+
+def _list_git_files(root: Path) -> list[str]:
+    """List the tracked and untracked but not ignored files, relative to the root"""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return [name for name in os.fsdecode(result.stdout).split("\0") if name]
+
+
+def _walk_files(root: Path) -> Iterable[str]:
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        prefix = "" if rel_dir == "." else f"{rel_dir}/"
+        # Don't descend into excluded directories
+        dirnames[:] = [d for d in dirnames if not _is_excluded(prefix + d, [])]
+        for filename in filenames:
+            yield prefix + filename
+
+
+def _hash_file(path: Path) -> bytes:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def get_source_tree_fingerprint(root: Path) -> str:
+    """Return a hash of the files of the source tree at the given path.
+
+    The files are listed by git if the tree is in a git repository, so ignored
+    files don't participate. Build artifacts and the files excluded in the
+    build backend settings are skipped.
+    """
+    patterns = _get_backend_excludes(root)
+    # Fallback to walking the tree if it isn't in a git repository or is ignored as a whole
+    files = _list_git_files(root) or _walk_files(root)
+    digest = hashlib.sha256()
+    count = 0
+    for relpath in sorted(set(files)):
+        if _is_excluded(relpath, patterns):
+            continue
+        path = root / relpath
+        if not path.is_file():  # deleted tracked files or submodules
+            continue
+        digest.update(os.fsencode(relpath) + b"\0" + _hash_file(path))
+        count += 1
+    logger.debug("Fingerprinted %d files in %s", count, root)
+    return f"sha256:{digest.hexdigest()}"
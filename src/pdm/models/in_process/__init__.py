@@ -15,6 +15,7 @@ from collections.abc import Generator
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from pdm.models.caches import InterpreterCache
     from pdm.models.markers import EnvSpec
 
 
@@ -24,8 +25,7 @@ def _in_process_script(name: str) -> Generator[str, None, None]:
         yield str(script)
 
 
-def get_sys_config_paths(executable: str, vars: dict[str, str] | None = None, kind: str = "default") -> dict[str, str]:
-    """Return the sys_config.get_paths() result for the python interpreter"""
+def _get_sys_config_paths(executable: str, vars: dict[str, str] | None = None, kind: str = "default") -> dict[str, str]:
     env = os.environ.copy()
     env.pop("__PYVENV_LAUNCHER__", None)
     if vars is not None:
@@ -36,6 +36,29 @@ def get_sys_config_paths(executable: str, vars: dict[str, str] | None = None, ki
         return json.loads(subprocess.check_output(cmd, env=env))
 
 
+def get_sys_config_paths(
+    executable: str, vars: dict[str, str] | None = None, kind: str = "default", cache: InterpreterCache | None = None
+) -> dict[str, str]:
+    """Return the sys_config.get_paths() result for the python interpreter"""
+    if cache is None:
+        return _get_sys_config_paths(executable, vars, kind)
+    # Probe with placeholders so that the result can be reused for any values of the vars
+    values = vars or {}
+    placeholders = {name: f"__PDM_SYSCONFIG_{name.upper()}__" for name in values}
+    paths = cache.get_or_probe(
+        executable,
+        ["sysconfig", kind, sorted(placeholders)],
+        lambda: _get_sys_config_paths(executable, placeholders if vars is not None else None, kind),
+    )
+    result: dict[str, str] = {}
+    for key, path in paths.items():
+        for name, placeholder in placeholders.items():
+            if placeholder in path:
+                path = os.path.normpath(path.replace(placeholder, values[name]))
+        result[key] = path
+    return result
+
+
 def parse_setup_py(executable: str, path: str) -> dict[str, Any]:
     """Parse setup.py and return the kwargs"""
     with _in_process_script("parse_setup.py") as script:
@@ -46,8 +69,19 @@ def parse_setup_py(executable: str, path: str) -> dict[str, Any]:
             return json.load(fp)
 
 
+def compile_bytecode(executable: str, files: list[str]) -> None:
+    """Compile the bytecode of the files with the python interpreter, on a process pool"""
+    with _in_process_script("compile_bytecode.py") as script:
+        subprocess.run([executable, "-Es", script], input=b"\n".join(map(os.fsencode, files)), check=True)
+
+
 @functools.lru_cache
-def get_env_spec(executable: str, compat_lib: str | None = None) -> EnvSpec:
+def _probe_env_spec(executable: str, shared_libs: tuple[str, ...]) -> dict[str, Any]:
+    with _in_process_script("env_spec.py") as script:
+        return json.loads(subprocess.check_output([executable, "-EsS", script, *shared_libs]))
+
+
+def get_env_spec(executable: str, compat_lib: str | None = None, cache: InterpreterCache | None = None) -> EnvSpec:
     """Get the environment spec of the python interpreter"""
     import importlib.metadata
 
@@ -55,11 +89,13 @@ def get_env_spec(executable: str, compat_lib: str | None = None) -> EnvSpec:
 
     if compat_lib is None:
         required_libs = ["dep_logic", "packaging"]
-        shared_libs = list(
+        shared_libs = tuple(
             dict.fromkeys(str(importlib.metadata.distribution(lib).locate_file("")) for lib in required_libs)
         )
     else:
-        shared_libs = [compat_lib]
+        shared_libs = (compat_lib,)
 
-    with _in_process_script("env_spec.py") as script:
-        return EnvSpec.from_spec(**json.loads(subprocess.check_output([executable, "-EsS", script, *shared_libs])))
+    if cache is None:
+        return EnvSpec.from_spec(**_probe_env_spec(executable, shared_libs))
+    spec = cache.get_or_probe(executable, ["env_spec", *shared_libs], lambda: _probe_env_spec(executable, shared_libs))
+    return EnvSpec.from_spec(**spec)
@@ -0,0 +1,31 @@
+"""Compile the bytecode of the files listed in stdin, one path per line."""
+
+import compileall
+import os
+import sys
+
+
+def _compile_file(path):
+    # Don't report the files that can't be compiled, such as templates or legacy code
+    return compileall.compile_file(path, quiet=2)
+
+
+def main():
+    files = [os.fsdecode(line) for line in sys.stdin.buffer.read().splitlines() if line]
+    if not files:
+        return
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            chunksize = max(len(files) // ((os.cpu_count() or 1) * 4), 1)
+            for _ in executor.map(_compile_file, files, chunksize=chunksize):
+                pass
+    except Exception:
+        # Process pools are not supported on some platforms, compile in this process instead
+        for path in files:
+            _compile_file(path)
+
+
+if __name__ == "__main__":
+    main()
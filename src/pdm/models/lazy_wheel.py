@@ -0,0 +1,158 @@
+"""Read the metadata of a remote wheel without downloading the whole archive.
+
+Only the zip central directory and the ``.dist-info/METADATA`` member are fetched,
+with HTTP range requests.
+"""
+
+from __future__ import annotations
+
+import re
+import zipfile
+from bisect import bisect_left, bisect_right
+from tempfile import TemporaryFile
+from typing import IO, TYPE_CHECKING
+
+from pdm.exceptions import PdmException
+from pdm.termui import logger
+
+if TYPE_CHECKING:
+    from typing import Self
+
+    import httpx
+
+# Large enough to hold the end of central directory record and the central
+# directory itself for most wheels, so that they are fetched in one request.
+CONTENT_CHUNK_SIZE = 64 * 1024
+
+
+class HTTPRangeRequestUnsupported(PdmException):
+    pass
+
+
+class LazyZipOverHTTP:
+    """A seekable file-like object mapped to a ZIP file served over HTTP.
+
+    The content is fetched on demand with range requests and kept in a sparse
+    temporary file, so that each byte is only downloaded once.
+    """
+
+    def __init__(self, url: str, session: httpx.Client, chunk_size: int = CONTENT_CHUNK_SIZE) -> None:
+        self._url = url
+        self._session = session
+        self._chunk_size = chunk_size
+        self._file: IO[bytes] = TemporaryFile()  # noqa: SIM115
+        self._pos = 0
+        # Sorted and disjoint [start, end] intervals that have been downloaded
+        self._left: list[int] = []
+        self._right: list[int] = []
+        try:
+            self._length = self._fetch_tail()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            pos = offset
+        elif whence == 1:
+            pos = self._pos + offset
+        elif whence == 2:
+            pos = self._length + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self._pos = max(0, min(pos, self._length))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._pos
+        end = self._length if size < 0 else min(start + size, self._length)
+        if start >= end:
+            return b""
+        self.ensure_range(start, end - 1)
+        self._file.seek(start)
+        data = self._file.read(end - start)
+        self._pos = start + len(data)
+        return data
+
+    def ensure_range(self, start: int, end: int) -> None:
+        """Make sure the bytes from ``start`` to ``end`` (inclusive) are downloaded."""
+        # Fetch at least a chunk at a time to avoid many tiny requests for zip headers.
+        end = min(max(end, start + self._chunk_size - 1), self._length - 1)
+        i, j = bisect_left(self._right, start), bisect_right(self._left, end)
+        cursor = start
+        for left, right in zip(self._left[i:j], self._right[i:j], strict=True):
+            if left > cursor:
+                self._download(cursor, left - 1)
+            cursor = right + 1
+        if cursor <= end:
+            self._download(cursor, end)
+        # Merge the intervals overlapping with [start, end] into one
+        if i < j:
+            start, end = min(start, self._left[i]), max(end, self._right[j - 1])
+        self._left[i:j], self._right[i:j] = [start], [end]
+
+    def _fetch_tail(self) -> int:
+        content_range, content = self._request(f"bytes=-{self._chunk_size}")
+        match = re.match(r"bytes\s+(\d+)-(\d+)/(\d+)", content_range)
+        if match is None:
+            raise HTTPRangeRequestUnsupported(f"Invalid Content-Range header returned by {self._url}")
+        start, end, length = map(int, match.groups())
+        self._file.truncate(length)
+        self._write(start, end, content)
+        self._left, self._right = [start], [end]
+        return length
+
+    def _download(self, start: int, end: int) -> None:
+        logger.debug("Fetching bytes %d-%d of %s", start, end, self._url)
+        _, content = self._request(f"bytes={start}-{end}")
+        self._write(start, end, content)
+
+    def _request(self, range_header: str) -> tuple[str, bytes]:
+        headers = {"Range": range_header, "Accept-Encoding": "identity"}
+        with self._session.stream("GET", self._url, headers=headers) as resp:
+            # Don't read the body if the server sends the whole file back
+            if resp.status_code != 206:
+                raise HTTPRangeRequestUnsupported(f"Range requests are not supported by the server of {self._url}")
+            return resp.headers.get("Content-Range", ""), resp.read()
+
+    def _write(self, start: int, end: int, content: bytes) -> None:
+        if len(content) != end - start + 1:
+            raise HTTPRangeRequestUnsupported(f"Incomplete range response returned by {self._url}")
+        self._file.seek(start)
+        self._file.write(content)
+
+
+def fetch_wheel_metadata(url: str, session: httpx.Client) -> str:
+    """Read the METADATA file of the wheel at the given URL, with range requests.
+
+    :raises HTTPRangeRequestUnsupported: if the server doesn't honor range requests
+    :raises zipfile.BadZipFile: if the file is not a valid wheel
+    """
+    with LazyZipOverHTTP(url, session) as lazy_file, zipfile.ZipFile(lazy_file) as zf:
+        infos = sorted(zf.infolist(), key=lambda info: info.header_offset)
+        # Each member ends where the next one, or the central directory, starts
+        ends = [info.header_offset for info in infos[1:]] + [zf.start_dir]  # type: ignore[attr-defined]
+        for info, end in zip(infos, ends, strict=True):
+            if re.fullmatch(r"[^/\\]+-[^/\\]+\.dist-info/METADATA", info.filename):
+                # Fetch the whole member, including its local header, in one request
+                lazy_file.ensure_range(info.header_offset, end - 1)
+                return zf.read(info).decode("utf-8")
+        raise zipfile.BadZipFile("No .dist-info/METADATA found in wheel")
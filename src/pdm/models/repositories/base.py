@@ -88,6 +88,16 @@ class BaseRepository:
         self.env_spec = env_spec
         self.reporter = LockReporter()
 
+    def flush_caches(self) -> None:
+        """Persist the pending writes of the repository caches."""
+        self._candidate_info_cache.flush()
+        self._hash_cache.flush()
+
+    def prefetch_metadata(self, requirements: Iterable[Requirement]) -> None:
+        """Start fetching the metadata of the candidates of the given requirements
+        in the background, if supported by the repository.
+        """
+
     def get_filtered_sources(self, req: Requirement) -> list[RepositoryConfig]:
         """Get matching sources based on the index attribute."""
         return filtered_sources(self.sources, req.key)
@@ -302,18 +312,19 @@ class BaseRepository:
         else:  # the req must be a named requirement
             with self.environment.get_finder(sources, env_spec=self.env_spec) as finder:
                 links = [package.link for package in finder.find_matches(req.as_line())]
+        # The links found can still be a local directory or vcs, skipping them.
+        links = [link for link in links if link and not link.is_vcs and not (link.is_file and link.file_path.is_dir())]
+        cached_hashes = self._hash_cache.get_many(link.url_without_fragment for link in links)
         for link in links:
-            if not link or link.is_vcs or (link.is_file and link.file_path.is_dir()):
-                # The links found can still be a local directory or vcs, skipping it.
-                continue
             if not logged:
                 termui.logger.info("Fetching hashes for %s", candidate)
                 logged = True
+            url = link.url_without_fragment
             result.append(
                 {
-                    "url": link.url_without_fragment,
+                    "url": url,
                     "file": link.filename,
-                    "hash": self._hash_cache.get_hash(link, self.environment.session),
+                    "hash": cached_hashes.get(url) or self._hash_cache.get_hash(link, self.environment.session),
                 }
             )
         return result
@@ -341,3 +352,4 @@ class BaseRepository:
 
         with ThreadPoolExecutor() as executor:
             executor.map(do_fetch, candidates)
+        self._hash_cache.flush()
@@ -36,6 +36,40 @@ class Package:
     marker: BaseMarker = dataclasses.field(default_factory=AnyMarker)
 
 
+class _PackageIndex:
+    """Secondary indexes of the locked packages, keeping the order of insertion."""
+
+    def __init__(self) -> None:
+        self.positions: dict[CandidateKey, int] = {}
+        self.by_name: dict[str, list[CandidateKey]] = {}
+        self.by_path: dict[Path, list[CandidateKey]] = {}
+        self.by_url: dict[str | None, list[CandidateKey]] = {}
+        # File requirements without a path, which are matched by URL only
+        self.pathless: list[CandidateKey] = []
+
+    def add(self, key: CandidateKey, package: Package) -> None:
+        if key in self.positions:
+            return
+        self.positions[key] = len(self.positions)
+        self.by_name.setdefault(key[0], []).append(key)
+        req = package.candidate.req
+        if isinstance(req, FileRequirement):
+            if req.path:
+                self.by_path.setdefault(req.path, []).append(key)
+            else:
+                self.pathless.append(key)
+            self.by_url.setdefault(key[2], []).append(key)
+
+    def match_file(self, requirement: FileRequirement) -> list[CandidateKey]:
+        if requirement.path:
+            keys = list(self.by_path.get(requirement.path, []))
+            url = url_without_fragments(requirement.url)
+            keys.extend(key for key in self.pathless if key[2] is None or key[2] == url)
+        else:
+            keys = [*self.by_url.get(None, []), *self.by_url.get(url_without_fragments(requirement.url), [])]
+        return sorted(set(keys), key=self.positions.__getitem__)
+
+
 class LockedRepository(BaseRepository):
     def __init__(
         self,
@@ -50,7 +84,26 @@ class LockedRepository(BaseRepository):
         self._read_lockfile(lockfile)
 
     def add_package(self, package: Package) -> None:
-        self.packages[self._identify_candidate(package.candidate)] = package
+        key = self._identify_candidate(package.candidate)
+        self.packages[key] = package
+        if "_index" in self.__dict__:
+            self._index.add(key, package)
+        self._clear_caches()
+
+    @cached_property
+    def _index(self) -> _PackageIndex:
+        index = _PackageIndex()
+        for key, package in self.packages.items():
+            index.add(key, package)
+        return index
+
+    @cached_property
+    def _candidates_by_spec(self) -> dict[EnvSpec, dict[str, Candidate]]:
+        return {}
+
+    def _clear_caches(self) -> None:
+        self.__dict__.pop("all_candidates", None)
+        self.__dict__.pop("_candidates_by_spec", None)
 
     @cached_property
     def all_candidates(self) -> dict[str, list[Candidate]]:
@@ -63,6 +116,8 @@ class LockedRepository(BaseRepository):
     @property
     def candidates(self) -> dict[str, Candidate]:
         """Return a dict of candidates for the current environment."""
+        if (cached := self._candidates_by_spec.get(self.env_spec)) is not None:
+            return dict(cached)
         result: dict[str, Candidate] = {}
         for candidates in self.all_candidates.values():
             for can in candidates:
@@ -71,7 +126,8 @@ class LockedRepository(BaseRepository):
                     if not marker.matches(self.env_spec):
                         continue
                 result[can.identify()] = can
-        return result
+        self._candidates_by_spec[self.env_spec] = result
+        return dict(result)
 
     def _read_lockfile(self, lockfile: Mapping[str, Any]) -> None:
         if lockfile.get("lock-version"):
@@ -130,7 +186,7 @@ class LockedRepository(BaseRepository):
                         hash_item["file"] = artifact["name"]
                     candidate.hashes.append(hash_item)
                 dependencies = package.get("tool", {}).get("pdm", {}).get("dependencies")
-                self.packages[self._identify_candidate(candidate)] = Package(candidate, dependencies, "", group_marker)
+                self.add_package(Package(candidate, dependencies, "", group_marker))
 
     def _read_pdm_lock(self, lockfile: Mapping[str, Any]) -> None:
         from pdm.project.lockfile import FLAG_CROSS_PLATFORM, FLAG_STATIC_URLS
@@ -164,14 +220,13 @@ class LockedRepository(BaseRepository):
                     raise PdmException(
                         "Static URLs are not allowed in lockfile unless enabled by `pdm lock --static-urls`."
                     )
-                can_id = self._identify_candidate(can)
                 can.requires_python = package.get("requires_python", "")
                 entry = Package(
                     can,
                     package.get("dependencies", []),
                     package.get("summary", ""),
                 )
-                self.packages[can_id] = entry
+                self.add_package(entry)
 
     def _identify_candidate(self, candidate: Candidate) -> CandidateKey:
         url: str | None = None
@@ -216,22 +271,13 @@ class LockedRepository(BaseRepository):
         return (self._get_dependencies_from_lockfile,)
 
     def _matching_entries(self, requirement: Requirement) -> Iterable[Package]:
-        for key, entry in self.packages.items():
-            can_req = entry.candidate.req
-            if requirement.name:
-                if key[0] != requirement.identify():
-                    continue
-            else:
-                assert isinstance(requirement, FileRequirement)
-                if not isinstance(can_req, FileRequirement):
-                    continue
-                if requirement.path and can_req.path:
-                    if requirement.path != can_req.path:
-                        continue
-                elif key[2] is not None and key[2] != url_without_fragments(requirement.url):
-                    continue
-
-            yield entry
+        if requirement.name:
+            keys = self._index.by_name.get(requirement.identify(), [])
+        else:
+            assert isinstance(requirement, FileRequirement)
+            keys = self._index.match_file(requirement)
+        for key in keys:
+            yield self.packages[key]
 
     def find_candidates(
         self,
@@ -277,7 +323,7 @@ class LockedRepository(BaseRepository):
             key = self._identify_candidate(entry.candidate)
             existing = self.packages.get(key)
             if existing is None:
-                self.packages[key] = entry
+                self.add_package(entry)
             else:
                 # merge markers
                 old_marker = existing.candidate.req.marker
@@ -299,6 +345,4 @@ class LockedRepository(BaseRepository):
                 for file in entry.candidate.hashes:
                     if file not in existing.candidate.hashes:
                         existing.candidate.hashes.append(file)
-        # clear caches
-        if "all_candidates" in self.__dict__:
-            del self.__dict__["all_candidates"]
+        self._clear_caches()
@@ -1,17 +1,146 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, cast
 
+from pdm._types import NotSet, NotSetType
 from pdm.exceptions import CandidateInfoNotFound, CandidateNotFound
 from pdm.models.candidates import Candidate
 from pdm.models.repositories.base import BaseRepository, CandidateMetadata, cache_result
 from pdm.models.requirements import Requirement, filter_requirements_with_extras
 from pdm.models.search import SearchResultParser
+from pdm.models.specifiers import PySpecSet
+from pdm.termui import logger
+from pdm.utils import normalize_name
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Sequence
 
-    from pdm._types import SearchResults
+    from unearth import Package
+
+    from pdm._types import RepositoryConfig, SearchResults
+    from pdm.environments import BaseEnvironment
+    from pdm.models.markers import EnvSpec
+
+
+class MetadataPrefetcher:
+    """Fetch the index pages of the requirements and the metadata of the candidates
+    that are likely to be pinned next in a background thread pool, so that the network
+    round-trips overlap with the resolution.
+
+    Only the candidates whose metadata can be read without building them are prefetched,
+    i.e. those with PEP 658 metadata or a wheel link, even if the JSON API is enabled.
+    The resolver may never pick them, so an sdist is never built in the background.
+    """
+
+    #: The number of versions to prefetch for each requirement
+    VERSIONS = 2
+    #: The maximum number of concurrent requests
+    MAX_WORKERS = 8
+    #: The maximum number of tasks queued or in flight, more requests are dropped
+    MAX_PENDING = 64
+
+    def __init__(self, repository: PyPIRepository) -> None:
+        self.repository = repository
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+        self._slots = threading.BoundedSemaphore(self.MAX_PENDING)
+        self._lock = threading.Lock()
+        self._seen: set[str] = set()
+        self._futures: dict[str, Future[CandidateMetadata]] = {}
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future | None:
+        if not self._slots.acquire(blocking=False):
+            return None
+        with self._lock:
+            if self._closed:
+                self._slots.release()
+                return None
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.MAX_WORKERS, thread_name_prefix="pdm-prefetch")
+                self.repository.environment.project.core.exit_stack.callback(self.shutdown)
+            future = self._executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def prefetch(self, requirements: Iterable[Requirement]) -> None:
+        """Start fetching the metadata of the top versions of the given requirements."""
+        for req in requirements:
+            if not req.is_named or req.identify() == "python":
+                continue
+            key = req.as_line()
+            with self._lock:
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+            self._submit(self._prefetch_requirement, req)
+
+    def _prefetch_requirement(self, requirement: Requirement) -> None:
+        repository = self.repository
+        requires_python = requirement.requires_python & repository.env_spec.requires_python
+        versions: dict[str, Candidate] = {}
+        try:
+            for candidate in repository._find_candidates(requirement, minimal_version=False):
+                if len(versions) >= self.VERSIONS or self._closed:
+                    break
+                if (
+                    candidate.version not in versions
+                    and requirement.specifier.contains(candidate.version)  # type: ignore[arg-type]
+                    and requires_python.is_subset(PySpecSet(candidate.requires_python))
+                    and self._has_static_metadata(candidate)
+                ):
+                    versions[cast(str, candidate.version)] = candidate
+        except Exception as e:
+            logger.debug("Failed to prefetch candidates for %s: %s", requirement.as_line(), e)
+            return
+        for candidate in versions.values():
+            try:
+                key = repository._candidate_info_cache._get_key(candidate)
+            except KeyError:
+                continue
+            with self._lock:
+                if key in self._futures:
+                    continue
+            if candidate in repository._candidate_info_cache:
+                continue
+            future = self._submit(repository._fetch_dependencies, candidate)
+            if future is not None:
+                with self._lock:
+                    self._futures.setdefault(key, future)
+
+    @staticmethod
+    def _has_static_metadata(candidate: Candidate) -> bool:
+        link = candidate.link
+        return link is not None and bool(link.dist_info_metadata or link.is_wheel)
+
+    def get(self, candidate: Candidate) -> CandidateMetadata:
+        """Get the prefetched metadata of the candidate, waiting for it if still in flight."""
+        try:
+            key = self.repository._candidate_info_cache._get_key(candidate)
+        except KeyError:
+            raise CandidateInfoNotFound(candidate) from None
+        with self._lock:
+            future = self._futures.get(key)
+        # Fetch it directly rather than waiting in the queue if it hasn't started yet
+        if future is None or future.cancel() or future.cancelled():
+            raise CandidateInfoNotFound(candidate)
+        try:
+            result = future.result()
+        except Exception:
+            # Let the regular getters fetch it again and report the error
+            raise CandidateInfoNotFound(candidate) from None
+        logger.debug("Using prefetched metadata for %s", candidate)
+        return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # Nobody is waiting for the speculative requests once the resolution is done, don't hold the exit
+            executor.shutdown(wait=False, cancel_futures=True)
 
 
 class PyPIRepository(BaseRepository):
@@ -19,6 +148,18 @@ class PyPIRepository(BaseRepository):
 
     DEFAULT_INDEX_URL = "https://pypi.org"
 
+    def __init__(
+        self,
+        sources: list[RepositoryConfig],
+        environment: BaseEnvironment,
+        ignore_compatibility: bool | NotSetType = NotSet,
+        env_spec: EnvSpec | None = None,
+    ) -> None:
+        super().__init__(sources, environment, ignore_compatibility=ignore_compatibility, env_spec=env_spec)
+        # The packages found on the index pages, shared by the prefetcher and the resolver
+        self._page_cache: dict[tuple[Any, ...], Future[Sequence[Package]]] = {}
+        self._page_lock = threading.Lock()
+
     @cache_result
     def _get_dependencies_from_json(self, candidate: Candidate) -> CandidateMetadata:  # pragma: no cover
         if not candidate.name or not candidate.version:
@@ -49,22 +190,75 @@ class PyPIRepository(BaseRepository):
             return CandidateMetadata(requirements, requires_python, summary)
         raise CandidateInfoNotFound(candidate)
 
+    @cached_property
+    def prefetcher(self) -> MetadataPrefetcher:
+        return MetadataPrefetcher(self)
+
+    def prefetch_metadata(self, requirements: Iterable[Requirement]) -> None:
+        if self.environment.project.config["pypi.prefetch_metadata"]:
+            self.prefetcher.prefetch(requirements)
+
     def dependency_generators(self) -> Iterable[Callable[[Candidate], CandidateMetadata]]:
         yield self._get_dependencies_from_cache
+        if "prefetcher" in self.__dict__:
+            yield self.prefetcher.get
+        yield from self._fetch_dependency_generators()
+
+    def _fetch_dependency_generators(self) -> Iterable[Callable[[Candidate], CandidateMetadata]]:
         if self.environment.project.config["pypi.json_api"]:
             yield self._get_dependencies_from_json
         yield self._get_dependencies_from_metadata
 
+    def _fetch_dependencies(self, candidate: Candidate) -> CandidateMetadata:
+        """Fetch the metadata of the candidate from the remote, bypassing the caches."""
+        for getter in self._fetch_dependency_generators():
+            try:
+                return getter(candidate)
+            except CandidateInfoNotFound:
+                continue
+        raise CandidateInfoNotFound(candidate)
+
+    def _find_packages(self, requirement: Requirement, minimal_version: bool) -> Sequence[Package]:
+        """Find the packages of the requirement from the index pages.
+
+        The result is kept for the lifetime of the repository, and if the same pages are
+        being fetched by another thread, wait for it instead of fetching them again.
+        """
+        sources = self.get_filtered_sources(requirement)
+        req_name = cast(str, requirement.project_name)
+        allow_yanked = requirement.is_pinned
+        key = (normalize_name(req_name), allow_yanked, minimal_version, tuple(source.url for source in sources))
+        with self._page_lock:
+            future = self._page_cache.get(key)
+            owner = future is None
+            if future is None:
+                future = self._page_cache[key] = Future()
+                future.set_running_or_notify_cancel()
+        if not owner:
+            # Wait outside of the lock, the fetching thread needs it to clean up on failure
+            return future.result()
+        try:
+            with self.environment.get_finder(
+                sources, env_spec=self.env_spec, minimal_version=minimal_version
+            ) as finder:
+                packages = list(finder.find_all_packages(req_name, allow_yanked=allow_yanked))
+        except BaseException as e:
+            # Don't cache the failure, the next call will try again
+            with self._page_lock:
+                del self._page_cache[key]
+            future.set_exception(e)
+            raise
+        future.set_result(packages)
+        return packages
+
     def _find_candidates(self, requirement: Requirement, minimal_version: bool) -> Iterable[Candidate]:
         from unearth.utils import LazySequence
 
-        sources = self.get_filtered_sources(requirement)
         req_name = cast(str, requirement.project_name)
-        with self.environment.get_finder(sources, env_spec=self.env_spec, minimal_version=minimal_version) as finder:
-            cans = LazySequence(
-                Candidate.from_installation_candidate(c, requirement)
-                for c in finder.find_all_packages(req_name, allow_yanked=requirement.is_pinned)
-            )
+        cans = LazySequence(
+            Candidate.from_installation_candidate(c, requirement)
+            for c in self._find_packages(requirement, minimal_version)
+        )
         if not cans:
             raise CandidateNotFound(
                 f"Unable to find candidates for {req_name}. There may "
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import os
 import sqlite3
 import threading
@@ -42,7 +43,13 @@ def _create_truststore_ssl_context() -> SSLContext | None:
 
 _ssl_context = _create_truststore_ssl_context()
 CACHES_TTL = 7 * 24 * 60 * 60  # 7 days
+# Archives are immutable once published, so they can be kept longer
+ARCHIVE_CACHES_TTL = 30 * 24 * 60 * 60  # 30 days
 MAX_RETRIES = 4
+SQLITE_BUSY_TIMEOUT = 30  # seconds
+# The same as the defaults of httpx
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE = 20
 
 
 @cache
@@ -50,8 +57,17 @@ def _get_transport(
     verify: bool | SSLContext | str = True,
     cert: tuple[str, str | None] | None = None,
     proxy: httpx.Proxy | None = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    http2: bool = False,
 ) -> httpx.BaseTransport:
-    return httpx.HTTPTransport(verify=verify, cert=cert, trust_env=True, proxy=proxy, retries=MAX_RETRIES)
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive)
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 is enabled but the `h2` package is not installed, falling back to HTTP/1.1")
+        http2 = False
+    return httpx.HTTPTransport(
+        verify=verify, cert=cert, trust_env=True, proxy=proxy, retries=MAX_RETRIES, limits=limits, http2=http2
+    )
 
 
 class ThreadedSyncSqliteStorage(hishel.SyncSqliteStorage):
@@ -91,8 +107,16 @@ class ThreadedSyncSqliteStorage(hishel.SyncSqliteStorage):
                 # Create cache directory and resolve full path on first connection
                 self.database_path.parent.mkdir(parents=True, exist_ok=True)
                 full_path = self.database_path.resolve()
-                conn = sqlite3.connect(str(full_path), check_same_thread=False)
+                # The connection keeps a cache of prepared statements, which is large
+                # enough to hold all the queries issued by the storage.
+                conn = sqlite3.connect(
+                    str(full_path), check_same_thread=False, timeout=SQLITE_BUSY_TIMEOUT, cached_statements=256
+                )
                 with closing(conn.cursor()) as cursor:
+                    # WAL mode lets readers in other threads and processes proceed while one is writing
+                    cursor.execute("PRAGMA journal_mode=WAL")
+                    cursor.execute("PRAGMA synchronous=NORMAL")
+                    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT * 1000}")
                     cursor.execute("PRAGMA foreign_keys=ON")
                 self.connection = conn
             if not self._initialized:
@@ -100,6 +124,34 @@ class ThreadedSyncSqliteStorage(hishel.SyncSqliteStorage):
                 self._initialized = True
             return self.connection
 
+    def _initialize_database(self) -> None:
+        super()._initialize_database()
+        # hishel sets a shorter busy timeout on the connection that initializes the database
+        assert self.connection is not None
+        with closing(self.connection.cursor()) as cursor:
+            cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT * 1000}")
+
+
+class ArchiveRoutingTransport(httpx.BaseTransport):
+    """Dispatch the requests of package archives and those of the small index and
+    metadata responses to separate cache transports.
+    """
+
+    def __init__(self, metadata_transport: httpx.BaseTransport, archive_transport: httpx.BaseTransport) -> None:
+        self.metadata_transport = metadata_transport
+        self.archive_transport = archive_transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        from unearth.utils import ARCHIVE_EXTENSIONS
+
+        if request.url.path.endswith(ARCHIVE_EXTENSIONS):
+            return self.archive_transport.handle_request(request)
+        return self.metadata_transport.handle_request(request)
+
+    def close(self) -> None:
+        self.metadata_transport.close()
+        self.archive_transport.close()
+
 
 class PDMPyPIClient(PyPIClient):
     def __init__(self, *, sources: list[RepositoryConfig], cache_dir: Path | None = None, **kwargs: Any) -> None:
@@ -115,17 +167,24 @@ class PDMPyPIClient(PyPIClient):
         else:
             # clean up old (pre-hishel 1.0) cache
             cache_db = cache_dir / "http-cache.db"
+            archive_cache_db = cache_dir / "http-archives.db"
             if not cache_db.exists():
                 for f in cache_dir.iterdir():
-                    if not f.name.startswith("http-cache.db"):
+                    if not f.name.startswith((cache_db.name, archive_cache_db.name)):
                         if f.is_dir():
                             shutil.rmtree(f, ignore_errors=True)
                         else:
                             f.unlink()
+            # Large archive bodies are kept apart from the index pages and metadata, so that
+            # they don't bloat the database that is queried the most.
             storage = ThreadedSyncSqliteStorage(database_path=cache_db, default_ttl=CACHES_TTL)
+            archive_storage = ThreadedSyncSqliteStorage(database_path=archive_cache_db, default_ttl=ARCHIVE_CACHES_TTL)
 
             def cache_transport(transport: httpx.BaseTransport) -> httpx.BaseTransport:
-                return hishel.httpx.SyncCacheTransport(next_transport=transport, storage=storage)
+                return ArchiveRoutingTransport(
+                    hishel.httpx.SyncCacheTransport(next_transport=transport, storage=storage),
+                    hishel.httpx.SyncCacheTransport(next_transport=transport, storage=archive_storage),
+                )
 
         mounts: dict[str, httpx.BaseTransport] = {"file://": LocalFSTransport()}
         self._trusted_host_ports: set[tuple[str, int | None]] = set()
@@ -164,7 +223,14 @@ class PDMPyPIClient(PyPIClient):
             cert = None
         source_url = httpx.URL(cast(str, source.url))
         proxy = next((proxy for pattern, proxy in self._proxy_map.items() if pattern.matches(source_url)), None)
-        return _get_transport(verify=verify, cert=cert, proxy=proxy)
+        return _get_transport(
+            verify=verify,
+            cert=cert,
+            proxy=proxy,
+            max_connections=source.pool_max_connections or DEFAULT_MAX_CONNECTIONS,
+            max_keepalive=source.pool_keepalive or DEFAULT_MAX_KEEPALIVE,
+            http2=bool(source.http2),
+        )
 
     def _make_user_agent(self) -> str:
         import platform
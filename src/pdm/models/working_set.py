@@ -6,9 +6,13 @@ import sys
 from collections import ChainMap
 from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pdm.utils import normalize_name
 
+if TYPE_CHECKING:
+    from pdm.models.caches import WorkingSetCache
+
 default_context = im.DistributionFinder.Context()
 
 
@@ -58,26 +62,48 @@ def distributions(path: list[str]) -> Iterable[im.Distribution]:
     return itertools.chain.from_iterable(resolver(context) for resolver in resolvers)
 
 
+def get_distribution_name(dist: im.Distribution) -> str | None:
+    """Get the normalized name of the distribution, or None if it has no metadata.
+
+    The name is parsed from the ``{name}-{version}.dist-info`` directory name if possible,
+    which saves reading the metadata file.
+    """
+    path = getattr(dist, "_path", None)
+    if isinstance(path, Path) and path.suffix == ".dist-info" and path.stem.count("-") == 1:
+        if not path.joinpath("METADATA").is_file():
+            return None
+        return normalize_name(path.stem.split("-")[0])
+    name = dist.metadata.get("Name")
+    return normalize_name(name) if name else None
+
+
+def _scan_distributions(paths: list[str]) -> list[tuple[str, im.Distribution]]:
+    return [(name, dist) for dist in distributions(path=paths) if (name := get_distribution_name(dist))]
+
+
 class WorkingSet(Mapping[str, im.Distribution]):
     """A dictionary of currently installed distributions"""
 
-    def __init__(self, paths: list[str] | None = None, shared_paths: list[str] | None = None) -> None:
+    def __init__(
+        self,
+        paths: list[str] | None = None,
+        shared_paths: list[str] | None = None,
+        cache: WorkingSetCache | None = None,
+    ) -> None:
         if paths is None:
             paths = sys.path
         if shared_paths is None:
             shared_paths = []
-        self._dist_map = {
-            normalize_name(dist.metadata["Name"]): dist
-            for dist in distributions(path=list(dict.fromkeys(paths)))
-            if dist.metadata.get("Name")
-        }
-        self._shared_map = {
-            normalize_name(dist.metadata["Name"]): dist
-            for dist in distributions(path=list(dict.fromkeys(shared_paths)))
-            if dist.metadata.get("Name")
-        }
+        self._dist_map = dict(self._scan(list(dict.fromkeys(paths)), cache))
+        self._shared_map = dict(self._scan(list(dict.fromkeys(shared_paths)), cache))
         self._iter_map = ChainMap(self._dist_map, self._shared_map)
 
+    @staticmethod
+    def _scan(paths: list[str], cache: WorkingSetCache | None) -> list[tuple[str, im.Distribution]]:
+        if cache is None or not paths:
+            return _scan_distributions(paths)
+        return cache.get(paths, lambda: _scan_distributions(paths))
+
     def __getitem__(self, key: str) -> im.Distribution:
         return self._iter_map[key]
 
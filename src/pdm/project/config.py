@@ -15,7 +15,7 @@ from pdm import termui
 from pdm._types import RepositoryConfig
 from pdm.compat import tomllib
 from pdm.exceptions import NoConfigError, PdmUsageError
-from pdm.utils import convert_to_datetime, open_for_write_no_symlink
+from pdm.utils import convert_to_datetime, open_for_write_no_symlink, parse_size
 
 REPOSITORY = "repository"
 SOURCE = "pypi"
@@ -114,6 +114,21 @@ class Config(MutableMapping[str, str]):
             True,
             env_var="PDM_CACHE_DIR",
         ),
+        "cache.max_age.build_envs": ConfigItem(
+            "The number of days after which a cached build environment is re-created to pick up new releases of "
+            "the build requirements, never if set to 0",
+            7,
+            True,
+            env_var="PDM_BUILD_ENVS_MAX_AGE",
+            coerce=int,
+        ),
+        "cache.auto_prune": ConfigItem(
+            "Evict the least recently used cache entries exceeding `cache.max_size.*` at the end of commands",
+            False,
+            True,
+            env_var="PDM_CACHE_AUTO_PRUNE",
+            coerce=ensure_boolean,
+        ),
         "log_dir": ConfigItem(
             "The root directory of log files",
             platformdirs.user_log_dir("pdm"),
@@ -190,6 +205,18 @@ class Config(MutableMapping[str, str]):
             env_var="PDM_INSTALL_PARALLEL",
             coerce=ensure_boolean,
         ),
+        "install.build_jobs": ConfigItem(
+            "The maximum number of packages built in parallel during installation, defaults to the number of CPUs",
+            env_var="PDM_INSTALL_BUILD_JOBS",
+            coerce=int,
+        ),
+        "install.compile": ConfigItem(
+            "When to compile the bytecode of installed packages: `none` to leave it to Python at import time, "
+            "or `deferred` to compile all installed files in parallel after the synchronization",
+            "none",
+            env_var="PDM_INSTALL_COMPILE",
+            coerce=choices("none", "deferred"),
+        ),
         "install.cache": ConfigItem(
             "Cache wheel installation and only put symlinks in the library root",
             False,
@@ -199,6 +226,13 @@ class Config(MutableMapping[str, str]):
             "Specify how to create links to the caches(`symlink/hardlink`)",
             "symlink",
         ),
+        "install.cache_verify": ConfigItem(
+            "Verify the files against the RECORD hashes when copying from the installation caches, "
+            "instead of reusing the recorded hashes",
+            False,
+            env_var="PDM_INSTALL_CACHE_VERIFY",
+            coerce=ensure_boolean,
+        ),
         "python.providers": ConfigItem(
             "List of python provider names for findpython", default=[], coerce=split_by_comma
         ),
@@ -233,6 +267,20 @@ class Config(MutableMapping[str, str]):
         "pypi.ca_certs": ConfigItem(
             "Path to a CA certificate bundle used for verifying the identity of the PyPI server", global_only=True
         ),
+        "pypi.pool_max_connections": ConfigItem(
+            "The maximum number of concurrent connections to PyPI", env_var="PDM_PYPI_POOL_MAX_CONNECTIONS", coerce=int
+        ),
+        "pypi.pool_keepalive": ConfigItem(
+            "The maximum number of idle connections kept alive to PyPI",
+            env_var="PDM_PYPI_POOL_KEEPALIVE",
+            coerce=int,
+        ),
+        "pypi.http2": ConfigItem(
+            "Use HTTP/2 when talking to PyPI, requires the `h2` package",
+            False,
+            env_var="PDM_PYPI_HTTP2",
+            coerce=ensure_boolean,
+        ),
         "pypi.ignore_stored_index": ConfigItem(
             "Don't add the indexes from the config that is not listed in project",
             False,
@@ -247,6 +295,18 @@ class Config(MutableMapping[str, str]):
             env_var="PDM_PYPI_JSON_API",
             coerce=ensure_boolean,
         ),
+        "pypi.prefetch_metadata": ConfigItem(
+            "Prefetch the index pages and metadata of the dependencies in parallel during resolution",
+            True,
+            env_var="PDM_PYPI_PREFETCH_METADATA",
+            coerce=ensure_boolean,
+        ),
+        "pypi.lazy_wheel": ConfigItem(
+            "Read the metadata of remote wheels with HTTP range requests if the index doesn't serve it separately",
+            True,
+            env_var="PDM_PYPI_LAZY_WHEEL",
+            coerce=ensure_boolean,
+        ),
         "scripts.show_header": ConfigItem(
             "Display script name and help before running",
             default=False,
@@ -283,6 +343,17 @@ class Config(MutableMapping[str, str]):
             coerce=ensure_boolean,
         ),
     }
+    _config_map.update(
+        (
+            f"cache.max_size.{name}",
+            ConfigItem(
+                f"The maximum size of the {name} cache, e.g. `10GB`, unlimited if not set",
+                global_only=True,
+                coerce=parse_size,
+            ),
+        )
+        for name in ("hashes", "http", "wheels", "metadata", "packages", "build_envs")
+    )
     _config_map.update(
         (f"theme.{k}", ConfigItem(f"Theme color for {k}", default=v, global_only=True))
         for k, v in termui.DEFAULT_THEME.items()
@@ -409,8 +480,10 @@ class Config(MutableMapping[str, str]):
                 and keyring.save_auth_info(service, username, value)
             ):
                 return
-            if parts[2] == "verify_ssl":
+            if parts[2] in ("verify_ssl", "http2"):
                 value = ensure_boolean(value)
+            elif parts[2] in ("pool_max_connections", "pool_keepalive"):
+                value = int(value)
             self._file_data.setdefault(index_key, {})[parts[2]] = value
             self._save_config()
             return
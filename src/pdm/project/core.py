@@ -51,7 +51,15 @@ if TYPE_CHECKING:
     from pdm.core import Core
     from pdm.environments import BaseEnvironment
     from pdm.installers.base import BaseSynchronizer
-    from pdm.models.caches import CandidateInfoCache, HashCache, WheelCache
+    from pdm.models.caches import (
+        CacheUsage,
+        CandidateInfoCache,
+        HashCache,
+        InterpreterCache,
+        LockfileCache,
+        WheelCache,
+        WorkingSetCache,
+    )
     from pdm.models.candidates import Candidate
     from pdm.resolver.base import Resolver
     from pdm.resolver.providers import BaseProvider
@@ -591,6 +599,9 @@ class Project:
             ca_certs=self.config.get("pypi.ca_certs"),
             client_cert=self.config.get("pypi.client_cert"),
             client_key=self.config.get("pypi.client_key"),
+            pool_max_connections=self.config.get("pypi.pool_max_connections"),
+            pool_keepalive=self.config.get("pypi.pool_keepalive"),
+            http2=self.config["pypi.http2"],
         )
         return config
 
@@ -645,12 +656,32 @@ class Project:
             return cls(sources, self.environment, ignore_compatibility=ignore_compatibility)
 
     def get_locked_repository(self, env_spec: EnvSpec | None = None) -> LockedRepository:
+        cache_key: list[str] | None = None
+        if (content_hash := self.lockfile.content_hash) is not None:
+            # The locked packages are resolved against the project root and the build backend
+            cache_key = ["locked-packages", content_hash, self.root.as_posix(), type(self.backend).__name__]
+            try:
+                targets, packages = self.lockfile_cache.get(cache_key)
+            except KeyError:
+                pass
+            else:
+                repository = LockedRepository({}, self.sources, self.environment, env_spec=env_spec)
+                repository.targets = targets
+                # The packages are keyed by the URLs with the environment variables expanded,
+                # so the keys are computed again instead of being stored with the credentials in them.
+                for package in packages:
+                    repository.add_package(package)
+                return repository
         try:
             lockfile = self.lockfile.open_for_read()
         except ProjectError:
             lockfile = {}
 
-        return LockedRepository(lockfile, self.sources, self.environment, env_spec=env_spec)
+        repository = LockedRepository(lockfile, self.sources, self.environment, env_spec=env_spec)
+        # Old lockfiles without targets are read with the targets of the current environment
+        if cache_key is not None and (lockfile.get("metadata", {}).get("targets") or lockfile.get("lock-version")):
+            self.lockfile_cache.set(cache_key, (repository.targets, list(repository.packages.values())))
+        return repository
 
     def split_extras_groups(self, all_groups: list[str]) -> tuple[list[str], list[str]]:
         """Split the groups into extras and non-extras."""
@@ -784,9 +815,18 @@ class Project:
             return False
         if (lock_inputs := self.lockfile.lock_inputs) is None:
             return False
-        from pdm.project.lockfile.freshness import lock_inputs_match
+        from pdm.project.lockfile.freshness import lock_freshness_key, lock_inputs_match
 
-        return lock_inputs_match(self, lock_inputs)
+        # Matching the inputs is expensive, reuse the verdict until any of its inputs changes
+        if (cache_key := lock_freshness_key(self, lock_inputs)) is not None:
+            try:
+                return self.lockfile_cache.get(cache_key)
+            except KeyError:
+                pass
+        result = lock_inputs_match(self, lock_inputs)
+        if cache_key is not None:
+            self.lockfile_cache.set(cache_key, result)
+        return result
 
     def use_pyproject_dependencies(
         self, group: str, dev: bool = False
@@ -918,6 +958,49 @@ class Project:
             pass
         return path
 
+    @cached_property
+    def cache_usage(self) -> CacheUsage:
+        """The index recording when the cache entries were last used"""
+        from pdm.models.caches import CacheUsage
+
+        usage = CacheUsage(self.cache_dir / "usage.db")
+        self.core.exit_stack.callback(usage.close)
+        return usage
+
+    @cached_property
+    def interpreter_cache(self) -> InterpreterCache:
+        """The cache of the probe results of python interpreters"""
+        from pdm.models.caches import EmptyInterpreterCache, InterpreterCache
+
+        cache_file = self.cache("metadata") / "interpreters.db"
+        if not self.core.state.enable_cache:
+            return EmptyInterpreterCache(cache_file)
+        cache = InterpreterCache(cache_file)
+        self.cache_usage.touch(cache_file)
+        self.core.exit_stack.callback(cache.close)
+        return cache
+
+    @cached_property
+    def working_set_cache(self) -> WorkingSetCache:
+        """The snapshots of the distributions installed in the environments"""
+        from pdm.models.caches import EmptyWorkingSetCache, WorkingSetCache
+
+        cache_dir = self.cache("metadata") / "working_sets"
+        if not self.core.state.enable_cache:
+            return EmptyWorkingSetCache(cache_dir)
+        return WorkingSetCache(cache_dir)
+
+    @cached_property
+    def lockfile_cache(self) -> LockfileCache:
+        """The cache of the parsed lockfiles and their freshness verdicts"""
+        from pdm.models.caches import EmptyLockfileCache, LockfileCache
+
+        cache_dir = self.cache("metadata") / "lockfiles"
+        if not self.core.state.enable_cache:
+            return EmptyLockfileCache(cache_dir)
+        # Only the latest entries of the project are kept
+        return LockfileCache(cache_dir, scope=self.root.as_posix())
+
     def make_wheel_cache(self) -> WheelCache:
         from pdm.models.caches import get_wheel_cache
 
@@ -931,17 +1014,21 @@ class Project:
         from pdm.models.caches import CandidateInfoCache, EmptyCandidateInfoCache
 
         python_hash = hashlib.sha1(str(self.environment.python_requires).encode()).hexdigest()
-        file_name = f"package_meta_{python_hash}.json"
-        return (
-            CandidateInfoCache(self.cache("metadata") / file_name)
-            if self.core.state.enable_cache
-            else EmptyCandidateInfoCache(self.cache("metadata") / file_name)
-        )
+        file_name = f"package_meta_{python_hash}.db"
+        if not self.core.state.enable_cache:
+            return EmptyCandidateInfoCache(self.cache("metadata") / file_name)
+        cache = CandidateInfoCache(self.cache("metadata") / file_name)
+        self.cache_usage.touch(cache.cache_file)
+        return cache
 
     def make_hash_cache(self) -> HashCache:
         from pdm.models.caches import EmptyHashCache, HashCache
 
-        return HashCache(self.cache("hashes")) if self.core.state.enable_cache else EmptyHashCache(self.cache("hashes"))
+        if not self.core.state.enable_cache:
+            return EmptyHashCache(self.cache("hashes"))
+        cache = HashCache(self.cache("hashes"))
+        self.cache_usage.touch(cache.cache_file)
+        return cache
 
     def iter_interpreters(
         self,
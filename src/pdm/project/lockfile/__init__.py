@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -42,10 +43,16 @@ def load_lockfile(project: Project, path: str | Path) -> Lockfile:
 
     try:
         with open(path, "rb") as f:
-            data = tomllib.load(f)
+            content = f.read()
     except OSError:
         return default_lockfile(path, ui=project.core.ui)
     else:
+        content_hash = hashlib.sha256(content).hexdigest()
+        try:
+            data = project.lockfile_cache.get(["data", content_hash])
+        except KeyError:
+            data = tomllib.loads(content.decode("utf-8"))
+            project.lockfile_cache.set(["data", content_hash], data)
         klass: type[Lockfile]
         if data.get("metadata", {}).get("lock_version"):
             klass = PDMLock
@@ -55,4 +62,5 @@ def load_lockfile(project: Project, path: str | Path) -> Lockfile:
             klass = default_lockfile
         lockfile = klass(path, ui=project.core.ui, parse=False)
         lockfile._data = data  # type: ignore[assignment]
+        lockfile.content_hash = content_hash
         return lockfile
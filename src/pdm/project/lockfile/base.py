@@ -41,6 +41,18 @@ class LockInputsState(enum.Enum):
 
 class Lockfile(TOMLFile, metaclass=abc.ABCMeta):
     SUPPORTED_FLAGS: AbstractSet[str]
+    # The arrays rendered one item per line by the lockfile writer
+    MULTILINE_ARRAYS: AbstractSet[str] = frozenset()
+    # The sha256 hash of the file content, if the data is loaded from the file and not modified
+    content_hash: str | None = None
+
+    def _parse(self) -> dict[str, Any]:
+        self.content_hash = None
+        return super()._parse()
+
+    def open_for_write(self) -> tomlkit.TOMLDocument:
+        self.content_hash = None
+        return super().open_for_write()
 
     @property
     @abc.abstractmethod
@@ -102,17 +114,38 @@ class Lockfile(TOMLFile, metaclass=abc.ABCMeta):
         return list(set(groups).difference(self.groups))
 
     def set_data(self, data: Mapping[str, Any]) -> None:
+        self.content_hash = None
         doc = tomlkit.document()
         for line in GENERATED_COMMENTS:
             doc.append(None, tomlkit.comment(line))
         doc.update(data)
         super().set_data(doc)
 
+    def set_generated_data(self, data: dict[str, Any]) -> None:
+        """Set the data generated by PDM, which will be written directly by the lockfile writer
+        instead of being rendered by tomlkit.
+        """
+        self.content_hash = None
+        TOMLFile.set_data(self, data)
+
     def write(self, show_message: bool = True) -> None:
-        super().write()
+        if self._for_write and not isinstance(self._data, tomlkit.TOMLDocument):
+            self._write_generated()
+        else:
+            super().write()
         if show_message:
             self.ui.echo(f"Changes are written to [success]{self._path.name}[/].", verbosity=termui.Verbosity.NORMAL)
 
+    def _write_generated(self) -> None:
+        from pdm.project.lockfile.writer import TOMLWriter
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Keep the line endings of the existing file, like tomlkit does
+        newline = "\r\n" if self._file._linesep == "\r\n" else "\n"
+        writer = TOMLWriter(self.MULTILINE_ARRAYS)
+        with open(self._path, "w", encoding="utf-8", newline=newline) as fp:
+            fp.writelines(writer.iter_document(self._data, GENERATED_COMMENTS))
+
     def __getitem__(self, key: str) -> dict:
         return self._data[key]  # type: ignore[return-value]
 
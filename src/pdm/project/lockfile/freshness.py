@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import hashlib
 import json
+import os
 import re
 from collections.abc import Mapping, Sequence
 from datetime import date, datetime, time
@@ -418,6 +419,42 @@ def _all_specifiers_match(project: Project, repository: LockedRepository) -> boo
     )
 
 
+def _has_local_inputs(locked_inputs: Mapping[str, Any]) -> bool:
+    projects = [locked_inputs.get("project")]
+    if isinstance(workspace := locked_inputs.get("workspace"), Mapping):
+        projects.extend(workspace.values())
+    return any(not isinstance(item, Mapping) or "local" in item for item in projects)
+
+
+def lock_freshness_key(project: Project, locked_inputs: object) -> list[str] | None:
+    """Return the cache key of the freshness verdict, or None if it can't be cached.
+
+    The key covers the lockfile content, the pyproject data of the workspace and the
+    override files. Local path dependencies are read from outside of these files,
+    so the verdict isn't cached for them.
+    """
+    lockfile_hash = project.lockfile.content_hash
+    if lockfile_hash is None or not isinstance(locked_inputs, Mapping) or _has_local_inputs(locked_inputs):
+        return None
+    workspace_project = project.workspace_project or project
+    root = workspace_project.root.resolve()
+    hasher = hashlib.sha256()
+    try:
+        pyproject_data = _to_builtin(workspace_project.pyproject._data, allow_temporal=True)
+    except TypeError:
+        return None
+    hasher.update(json.dumps([root.as_posix(), pyproject_data], sort_keys=True).encode("utf-8"))
+    if workspace_project.is_workspace_root:
+        for member in sorted(workspace_project.iter_members(), key=lambda path: path.relative_to(root).as_posix()):
+            pyproject_file = member / "pyproject.toml"
+            member_hash = get_file_hash(pyproject_file) if pyproject_file.is_file() else ""
+            hasher.update(f"\0{member.relative_to(root).as_posix()}\0{member_hash}".encode())
+    for override in project.core.state.overrides:
+        override_hash = get_file_hash(override) if not _URL_RE.match(override) and os.path.isfile(override) else ""
+        hasher.update(f"\0{override}\0{override_hash}".encode())
+    return ["freshness", lockfile_hash, hasher.hexdigest()]
+
+
 def lock_inputs_match(project: Project, locked_inputs: object) -> bool:
     """Return whether the current project is satisfied by the recorded lock inputs."""
     try:
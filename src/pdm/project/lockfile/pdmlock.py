@@ -2,9 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from functools import cached_property
-from typing import TYPE_CHECKING
-
-import tomlkit
+from typing import TYPE_CHECKING, Any
 
 from pdm.project.lockfile.base import (
     FLAG_CROSS_PLATFORM,
@@ -25,6 +23,7 @@ class PDMLock(Lockfile):
     SUPPORTED_FLAGS = frozenset(
         (FLAG_STATIC_URLS, FLAG_CROSS_PLATFORM, FLAG_DIRECT_MINIMAL_VERSIONS, FLAG_INHERIT_METADATA)
     )
+    MULTILINE_ARRAYS = frozenset(("package.dependencies", "package.files"))
     spec_version = parse_version("4.5.1")
 
     @property
@@ -59,6 +58,7 @@ class PDMLock(Lockfile):
         return result & self.SUPPORTED_FLAGS
 
     def update_hash(self, hash_value: str, algo: str = "sha256") -> None:
+        self.content_hash = None
         self._data.setdefault("metadata", {})["content_hash"] = f"{algo}:{hash_value}"
 
     @property
@@ -93,23 +93,21 @@ class PDMLock(Lockfile):
         """Format lock file from a dict of resolved candidates, a mapping of dependencies
         and a collection of package summaries.
         """
-        from pdm.formats.base import make_array, make_inline_table
 
         def _group_sort_key(group: str) -> tuple[bool, str]:
             return group != "default", group
 
         project = repository.environment.project
-        packages = tomlkit.aot()
+        packages: list[dict[str, Any]] = []
         for entry in sorted(repository.packages.values(), key=lambda x: x.candidate.identify()):
-            base = tomlkit.table()
-            base.update(entry.candidate.as_lockfile_entry(project.root))
-            base.add("summary", entry.summary or "")
+            base = entry.candidate.as_lockfile_entry(project.root)
+            base["summary"] = entry.summary or ""
             if FLAG_INHERIT_METADATA in strategy:
-                base.add("groups", sorted(entry.candidate.req.groups, key=_group_sort_key))
+                base["groups"] = sorted(entry.candidate.req.groups, key=_group_sort_key)
                 if entry.candidate.req.marker is not None:
-                    base.add("marker", str(entry.candidate.req.marker))
+                    base["marker"] = str(entry.candidate.req.marker)
             if entry.dependencies:
-                base.add("dependencies", make_array(sorted(entry.dependencies), True))
+                base["dependencies"] = sorted(entry.dependencies)
             if hashes := entry.candidate.hashes:
                 collected = {}
                 for item in hashes:
@@ -117,28 +115,22 @@ class PDMLock(Lockfile):
                         row = {"url": item["url"], "hash": item["hash"]}
                     else:
                         row = {"file": item["file"], "hash": item["hash"]}
-                    inline = make_inline_table(row)
                     # deduplicate and sort
-                    collected[tuple(row.values())] = inline
+                    collected[tuple(row.values())] = row
                 if collected:
-                    base.add("files", make_array([collected[k] for k in sorted(collected)], True))
+                    base["files"] = [collected[k] for k in sorted(collected)]
             packages.append(base)
-        doc = tomlkit.document()
-        metadata = tomlkit.table()
         if groups is None:
             groups = list(project.iter_groups())
-        metadata.update(
-            {
-                "groups": sorted(groups, key=_group_sort_key),
-                "strategy": sorted(strategy),
-                "targets": [t.as_dict() for t in repository.targets],
-                "lock_version": str(self.spec_version),
-            }
-        )
+        metadata: dict[str, Any] = {
+            "groups": sorted(groups, key=_group_sort_key),
+            "strategy": sorted(strategy),
+            "targets": [t.as_dict() for t in repository.targets],
+            "lock_version": str(self.spec_version),
+        }
         if project.lock_inputs_enabled():
             metadata["lock_inputs"] = project.lock_inputs()
-        metadata.pop(FLAG_STATIC_URLS, None)
-        metadata.pop(FLAG_CROSS_PLATFORM, None)
-        doc.add("metadata", metadata)
-        doc.add("package", packages)
-        self.set_data(doc)
+        data: dict[str, Any] = {"metadata": metadata}
+        if packages:
+            data["package"] = packages
+        self.set_generated_data(data)
@@ -23,6 +23,7 @@ class PyLock(Lockfile):
         return next(iter(self._data.get("tool", {}).get("pdm", {}).get("hashes", {}).items()), ("", ""))
 
     def update_hash(self, hash_value: str, algo: str = "sha256") -> None:
+        self.content_hash = None
         self._data.setdefault("tool", {}).setdefault("pdm", {}).setdefault("hashes", {})[algo] = hash_value
 
     @property
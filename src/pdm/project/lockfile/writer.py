@@ -0,0 +1,107 @@
+"""A streaming TOML writer for the lockfile data generated by PDM.
+
+The output follows the same layout as tomlkit renders the equivalent document:
+values come before sub-tables, a non-empty table holding only tables gets no header,
+and every table header is separated from the previous content by an empty line.
+"""
+
+from __future__ import annotations
+
+import re
+import string
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from typing import Any
+
+_BARE_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "-_")
+_ESCAPE_RE = re.compile(r'[\x00-\x1f\x7f"\\]')
+_COMPACT_ESCAPES = {"\b": "\\b", "\t": "\\t", "\n": "\\n", "\f": "\\f", "\r": "\\r", '"': '\\"', "\\": "\\\\"}
+
+
+def _escape(match: re.Match[str]) -> str:
+    char = match.group()
+    return _COMPACT_ESCAPES.get(char) or f"\\u{ord(char):04x}"
+
+
+def format_string(value: str) -> str:
+    return f'"{_ESCAPE_RE.sub(_escape, value)}"'
+
+
+def format_key(key: str) -> str:
+    return key if key and _BARE_KEY_CHARS.issuperset(key) else format_string(key)
+
+
+def format_value(value: Any, multiline: bool = False) -> str:
+    """Format a value as it appears on the right side of a key/value pair."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return format_string(value)
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, Mapping):
+        if not value:
+            return "{}"
+        return "{" + ", ".join(f"{format_key(k)} = {format_value(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, (list, tuple)):
+        if multiline and value:
+            return "[\n" + "".join(f"    {format_value(item)},\n" for item in value) + "]"
+        return "[" + ", ".join(format_value(item) for item in value) + "]"
+    raise TypeError(f"Unsupported TOML value: {value!r}")
+
+
+def _is_array_of_tables(value: Any) -> bool:
+    return isinstance(value, (list, tuple)) and bool(value) and all(isinstance(item, Mapping) for item in value)
+
+
+class TOMLWriter:
+    """Render plain python data as a TOML document, chunk by chunk.
+
+    :param multiline_arrays: dotted key paths(without array indices) of the arrays
+        to be rendered one item per line, e.g. ``package.files``. Such arrays are
+        always inline arrays, even if all items are tables.
+    """
+
+    def __init__(self, multiline_arrays: Collection[str] = ()) -> None:
+        self.multiline_arrays = multiline_arrays
+        self._at_start = True
+
+    def iter_document(self, data: Mapping[str, Any], comments: Iterable[str] = ()) -> Iterator[str]:
+        self._at_start = True
+        for line in comments:
+            self._at_start = False
+            yield f"# {line}\n"
+        yield from self._iter_table((), data)
+
+    def _header(self, text: str) -> str:
+        prefix = "" if self._at_start else "\n"
+        self._at_start = False
+        return f"{prefix}{text}\n"
+
+    def _iter_table(self, path: tuple[str, ...], table: Mapping[str, Any], in_array: bool = False) -> Iterator[str]:
+        prefix = ".".join(path)
+        values: list[tuple[str, Any, bool]] = []
+        tables: list[tuple[str, Any]] = []
+        for key, value in table.items():
+            multiline = (f"{prefix}.{key}" if prefix else key) in self.multiline_arrays
+            if isinstance(value, Mapping) or (not multiline and _is_array_of_tables(value)):
+                tables.append((key, value))
+            else:
+                values.append((key, value, multiline))
+        dotted = ".".join(format_key(key) for key in path)
+        if in_array:
+            yield self._header(f"[[{dotted}]]")
+        elif path and (values or not tables):
+            yield self._header(f"[{dotted}]")
+        for key, value, multiline in values:
+            self._at_start = False
+            yield f"{format_key(key)} = {format_value(value, multiline)}\n"
+        for key, value in tables:
+            if isinstance(value, Mapping):
+                yield from self._iter_table((*path, key), value)
+            else:
+                for item in value:
+                    yield from self._iter_table((*path, key), item, in_array=True)
+
+
+def dumps(data: Mapping[str, Any], comments: Iterable[str] = (), multiline_arrays: Collection[str] = ()) -> str:
+    return "".join(TOMLWriter(multiline_arrays).iter_document(data, comments))
@@ -468,6 +468,12 @@ def working_set(mocker: MockerFixture, repository: RepositoryData) -> MockWorkin
             rv.add_distribution(dist)
             return dist
 
+        def fetch(self, candidate: Candidate) -> None:  # type: ignore[override]
+            return None
+
+        def schedule(self, candidate: Candidate) -> None:  # type: ignore[override]
+            return None
+
         def uninstall(self, dist: Distribution) -> None:  # type: ignore[override]
             del rv[dist.name]
 
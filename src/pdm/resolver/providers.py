@@ -402,6 +402,7 @@ class BaseProvider(AbstractProvider[Requirement, Candidate, str]):
                 continue
             dep.requires_python &= candidate.req.requires_python
             valid_deps.append(dep)
+        self.repository.prefetch_metadata(dep for dep in valid_deps if dep.identify() not in self.overrides)
         # A candidate contributes to the Python requirements only when:
         # It isn't an optional dependency, or the requires-python doesn't cover
         # the req's requires-python.
@@ -48,11 +48,15 @@ class RLResolver(Resolver):
     def resolve(self) -> Resolution:
         from pdm.models.repositories import Package
 
-        mapping = self._do_resolve()
-        if self.project.enable_write_lockfile:  # type: ignore[has-type]
-            if isinstance(self.reporter, RichLockReporter):
-                self.reporter.update(info="Fetching hashes for resolved packages")
-            self.provider.repository.fetch_hashes(mapping.values())
+        repository = self.provider.repository
+        try:
+            mapping = self._do_resolve()
+            if self.project.enable_write_lockfile:  # type: ignore[has-type]
+                if isinstance(self.reporter, RichLockReporter):
+                    self.reporter.update(info="Fetching hashes for resolved packages")
+                repository.fetch_hashes(mapping.values())
+        finally:
+            repository.flush_caches()
         if not (env_python := PySpecSet(self.target.requires_python)).is_superset(self.environment.python_requires):
             python_marker = get_marker(env_python.as_marker_string())
             for candidate in mapping.values():
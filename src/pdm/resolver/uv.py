@@ -184,6 +184,7 @@ class UvResolver(Resolver):
                         "",
                     )
                     packages.append(extra_entry)
+        hash_cache.flush()
         return Resolution(packages, self.requested_groups)
 
     def resolve(self) -> Resolution:
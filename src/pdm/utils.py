@@ -560,6 +560,19 @@ def convert_to_datetime(value: str) -> datetime:
     return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
 
 
+def parse_size(value: str | int) -> int:
+    """Parse a human readable size like `500MB` or `10GiB` into bytes"""
+    if isinstance(value, int):
+        return value
+    units = {"": 1, "k": 1000, "m": 1000**2, "g": 1000**3, "t": 1000**4}
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([kmgt]?)(i?)b?\s*", value, flags=re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size: {value!r}")
+    number, unit, binary = match.groups()
+    multiplier = 1024 ** " kmgt".index(unit.lower()) if binary and unit else units[unit.lower()]
+    return int(float(number) * multiplier)
+
+
 def get_all_installable_python_versions(build_dir: bool = False) -> list[PythonVersion]:
     """Returns all installable standalone Python interpreter versions from @indygreg
 
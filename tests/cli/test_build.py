@@ -1,14 +1,21 @@
+import os
 import tarfile
+import time
 import zipfile
+from pathlib import Path
 from types import SimpleNamespace
 from unittest import mock
 
 import pytest
 
+from pdm.builders.base import EnvBuilder
+from pdm.builders.wheel import WheelBuilder
 from pdm.cli.commands.build import Command
 
 pytestmark = pytest.mark.usefixtures("local_finder")
 
+_get_shared_env = EnvBuilder.get_shared_env
+
 
 def get_tarball_names(path):
     with tarfile.open(path, "r:gz") as tar:
@@ -169,6 +176,59 @@ def test_build_with_no_isolation(pdm, project):
     assert result.exit_code == 0
 
 
+def test_shared_build_env_persisted_in_cache(fixture_project, mocker):
+    project = fixture_project("demo-module")
+    # Undo the patch of the project fixture
+    mocker.patch.object(EnvBuilder, "get_shared_env", _get_shared_env)
+    first = WheelBuilder(project.root, project.environment)
+    second = WheelBuilder(project.root, project.environment)
+    assert first._prefix.shared == second._prefix.shared
+    assert os.path.dirname(first._prefix.shared) == str(project.cache("build_envs"))
+    project.core.state.enable_cache = False
+    third = WheelBuilder(project.root, project.environment)
+    assert os.path.dirname(third._prefix.shared) != str(project.cache("build_envs"))
+
+
+def test_shared_build_env_recreated_when_expired(fixture_project, mocker):
+    project = fixture_project("demo-module")
+    mocker.patch.object(EnvBuilder, "get_shared_env", _get_shared_env)
+    project.global_config["cache.max_age.build_envs"] = 1
+    shared = Path(WheelBuilder(project.root, project.environment)._prefix.shared)
+    installed = shared / "installed.txt"
+    installed.touch()
+
+    WheelBuilder(project.root, project.environment)
+    assert installed.exists()
+
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(shared / ".created", (two_days_ago, two_days_ago))
+    WheelBuilder(project.root, project.environment)
+    assert shared.is_dir()
+    assert not installed.exists()
+
+
+def test_shared_build_env_not_pruned_while_building(fixture_project, mocker, tmp_path):
+    from pdm.builders.base import remove_shared_env
+
+    project = fixture_project("demo-module")
+    mocker.patch.object(EnvBuilder, "get_shared_env", _get_shared_env)
+    builder = WheelBuilder(project.root, project.environment)
+    mocker.patch.object(builder, "install")
+    shared = builder._prefix.shared
+
+    def build_wheel(*args, **kwargs):
+        with pytest.raises(OSError):
+            remove_shared_env(Path(shared))
+        return "demo.whl"
+
+    mocker.patch.object(builder._hook, "get_requires_for_build_wheel", return_value=[])
+    mocker.patch.object(builder._hook, "build_wheel", side_effect=build_wheel)
+    builder.build(str(tmp_path))
+    assert os.path.isdir(shared)
+    remove_shared_env(Path(shared))
+    assert not os.path.exists(shared)
+
+
 def test_build_ignoring_pip_environment(fixture_project, monkeypatch):
     project = fixture_project("demo-module")
     monkeypatch.setenv("PIP_REQUIRE_VIRTUALENV", "1")
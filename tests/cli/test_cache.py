@@ -172,3 +172,156 @@ def test_clear_package_cache(project, pdm):
     refer_pkg.rmdir()
     pdm(["cache", "clear", "packages"], obj=project, strict=True)
     assert not pkg.path.exists()
+
+
+def test_cache_prune_evicts_least_recently_used(project, pdm):
+    cache_dir = project.cache("wheels") / "arbitrary/path"
+    cache_dir.mkdir(parents=True)
+    wheels = []
+    for name in ("foo-0.1.0.whl", "bar-0.2.0.whl", "baz-0.3.0.whl"):
+        wheel = cache_dir / name
+        wheel.write_bytes(b"x" * 1000)
+        wheels.append(wheel)
+    # bar is the least recently used, then foo, then baz
+    project.cache_usage.touch(wheels[1])
+    project.cache_usage.touch(wheels[0])
+    project.cache_usage.touch(wheels[2])
+
+    result = pdm(["cache", "prune", "wheels", "--max-size", "2000"], obj=project, strict=True)
+    assert "1 entry" in result.output
+    assert not wheels[1].exists()
+    assert wheels[0].exists() and wheels[2].exists()
+
+    project.global_config["cache.max_size.wheels"] = "1kB"
+    pdm(["cache", "prune"], obj=project, strict=True)
+    assert not wheels[0].exists()
+    assert wheels[2].exists()
+
+
+def test_cache_prune_evicts_rows_of_databases(project, pdm, mocker):
+    from pdm.cli.commands.cache import directory_size
+    from pdm.models.caches import InterpreterCache, SQLiteCache
+
+    class AccessTrackedCache(SQLiteCache):
+        TRACK_ACCESS = True
+
+    clock = mocker.patch("time.time", return_value=1000.0)
+    metadata = SQLiteCache(project.cache("metadata") / "package_meta_test.db")
+    for i in range(10):
+        metadata.set(f"foo-{i}", "x" * 1000)
+    metadata.close()
+    # The entries read later are kept, although they are stored first
+    clock.return_value = 2000.0
+    metadata = AccessTrackedCache(project.cache("metadata") / "package_meta_test.db")
+    metadata.get_many(["foo-0", "foo-1"])
+    metadata.close()
+    mocker.stopall()
+    interpreters = InterpreterCache(project.cache("metadata") / "interpreters.db")
+    interpreters.set("python", {"version": "3.12"})
+    interpreters.close()
+    snapshot = project.cache("metadata") / "working_sets" / "snapshot.pickle"
+    snapshot.parent.mkdir()
+    # The files that can't be evicted don't count towards the limit
+    snapshot.write_bytes(b"x" * 100_000)
+    hashes = project.make_hash_cache()
+    for i in range(10):
+        hashes.set(f"https://example.org/foo-{i}.whl", "sha256:" + "x" * 1000)
+    hashes.flush()
+
+    for type_ in ("metadata", "hashes"):
+        # Evict about three entries
+        cache_dir = project.cache(type_)
+        size = directory_size(cache_dir) if type_ == "hashes" else (cache_dir / "package_meta_test.db").stat().st_size
+        max_size = size - 3000
+        pdm(["cache", "prune", type_, "--max-size", str(max_size)], obj=project, strict=True)
+
+    metadata = SQLiteCache(project.cache("metadata") / "package_meta_test.db")
+    remaining = metadata.get_many(f"foo-{i}" for i in range(10))
+    metadata.close()
+    assert sorted(remaining) == ["foo-0", "foo-1", "foo-5", "foo-6", "foo-7", "foo-8", "foo-9"]
+    assert InterpreterCache(project.cache("metadata") / "interpreters.db").get("python") == {"version": "3.12"}
+    assert snapshot.exists()
+    remaining_hashes = hashes.get_many(f"https://example.org/foo-{i}.whl" for i in range(10))
+    assert len(remaining_hashes) == 7
+
+
+def test_cache_prune_keeps_http_cache_on_database_errors(project, pdm, mocker):
+    import sqlite3
+
+    databases = [project.cache("http") / name for name in ("http-cache.db", "http-archives.db")]
+    for database in databases:
+        database.write_bytes(b"x" * 1000)
+    mocker.patch("pdm.cli.commands.cache._prune_http_cache", side_effect=sqlite3.OperationalError("locked"))
+
+    pdm(["cache", "prune", "http", "--max-size", "0"], obj=project, strict=True)
+    assert all(database.exists() for database in databases)
+
+
+def test_cache_prune_keeps_referred_packages(project, pdm):
+    referred = CachedPackage(project.cache("packages") / "foo-0.1.0.whl.cache")
+    unreferred = CachedPackage(project.cache("packages") / "bar-0.1.0.whl.cache")
+    for pkg in (referred, unreferred):
+        pkg.path.mkdir(parents=True)
+        pkg.path.joinpath("data").write_bytes(b"x" * 1000)
+    refer_pkg = project.root / "refer_pkg"
+    refer_pkg.mkdir()
+    referred.add_referrer(str(refer_pkg))
+
+    pdm(["cache", "prune", "packages", "--max-size", "0"], obj=project, strict=True)
+    assert referred.path.exists()
+    assert not unreferred.path.exists()
+
+
+def test_cache_auto_prune(project, pdm):
+    wheel = project.cache("wheels") / "foo-0.1.0.whl"
+    wheel.write_bytes(b"x" * 1000)
+    project.global_config["cache.max_size.wheels"] = "100"
+    pdm(["config", "cache.auto_prune"], obj=project, strict=True)
+    assert wheel.exists()
+    project.global_config["cache.auto_prune"] = True
+    pdm(["config", "cache.auto_prune"], obj=project, strict=True)
+    assert not wheel.exists()
+
+
+def test_cache_prune_build_envs(project, pdm):
+    envs = []
+    for key in ("env1", "env2"):
+        env = project.cache("build_envs") / key
+        env.mkdir(parents=True)
+        env.joinpath("data").write_bytes(b"x" * 1000)
+        envs.append(env)
+    project.cache_usage.touch(envs[1])
+    project.cache_usage.touch(envs[0])
+
+    pdm(["cache", "prune", "build_envs", "--max-size", "1000"], obj=project, strict=True)
+    assert envs[0].exists()
+    assert not envs[1].exists()
+
+    pdm(["cache", "clear", "build_envs"], obj=project, strict=True)
+    assert not envs[0].exists()
+
+
+def test_cache_prune_skips_build_envs_in_use(project, pdm):
+    import filelock
+
+    envs = []
+    for key in ("env1", "env2"):
+        env = project.cache("build_envs") / key
+        env.mkdir(parents=True)
+        env.joinpath("data").write_bytes(b"x" * 1000)
+        envs.append(env)
+    (envs[0] / ".leases").mkdir()
+    # A stale lease left by a crashed build doesn't keep the env
+    (envs[1] / ".leases").mkdir()
+    envs[1].joinpath(".leases", "stale.lock").touch()
+
+    with filelock.FileLock(envs[0] / ".leases" / "build.lock"):
+        pdm(["cache", "prune", "build_envs", "--max-size", "0"], obj=project, strict=True)
+        assert envs[0].joinpath("data").exists()
+        assert not envs[1].exists()
+
+        pdm(["cache", "clear", "build_envs"], obj=project, strict=True)
+        assert envs[0].joinpath("data").exists()
+
+    pdm(["cache", "clear", "build_envs"], obj=project, strict=True)
+    assert not envs[0].exists()
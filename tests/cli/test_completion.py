@@ -198,7 +198,7 @@ def test_completion_engine_completes_commands_and_options():
 
 
 def test_completion_engine_completes_static_values():
-    assert completion_values("cache", "clear", "") == {"hashes", "http", "metadata", "packages", "wheels"}
+    assert completion_values("cache", "clear", "") == {"build_envs", "hashes", "http", "metadata", "packages", "wheels"}
     assert completion_values("export", "--format", "") == {"pylock", "requirements"}
     assert completion_values("export", "--format=r") == {"--format=requirements"}
     assert completion_values("completion", "") == {"bash", "fish", "powershell", "pwsh", "zsh"}
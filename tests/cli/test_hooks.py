@@ -27,6 +27,22 @@ def test_pre_script_fail_fast(project, pdm, capfd, mocker):
     synchronize.assert_not_called()
 
 
+def test_project_scripts_connected_without_loading_run_command():
+    import subprocess
+
+    code = dedent(
+        """
+        import sys
+        import pdm.core
+        from pdm.signals import pdm_signals
+
+        assert "pdm.cli.commands.run" not in sys.modules
+        assert all(pdm_signals.signal(hook).receivers for hook in pdm_signals)
+        """
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_pre_and_post_scripts(project, pdm, capfd, _echo):
     project.pyproject.settings["scripts"] = {
         "pre_script": "python echo.py pre_script",
@@ -1,6 +1,9 @@
+from pathlib import Path
+
 import pytest
 
 from pdm.cli import actions
+from pdm.cli.filters import GroupSelection
 from pdm.models.markers import EnvSpec
 from pdm.pytest import Distribution
 from pdm.utils import cd
@@ -459,3 +462,79 @@ def test_uv_install_pep582_not_allowed(project, pdm):
     result = pdm(["sync"], obj=project)
     assert result.exit_code == 1
     assert "doesn't support PEP 582 local packages" in result.stderr
+
+
+def test_sync_skipped_when_environment_is_synced(project, working_set, pdm, mocker):
+    project.add_dependencies(["requests"])
+    pdm(["install"], obj=project, strict=True)
+    resolve = mocker.spy(actions, "resolve_from_lockfile")
+
+    result = pdm(["sync"], obj=project, strict=True)
+    assert "All packages are synced to date" in result.stdout
+    resolve.assert_not_called()
+
+    # Changes of the working set, the groups or the flags invalidate the stamp
+    del working_set["idna"]
+    pdm(["sync"], obj=project, strict=True)
+    assert "idna" in working_set
+    pdm(["sync", "--clean"], obj=project, strict=True)
+    assert resolve.call_count == 2
+
+
+def test_sync_not_skipped_with_install_hooks(project, working_set, pdm, mocker):
+    project.add_dependencies(["requests"])
+    project.pyproject.settings["scripts"] = {"post_install": "python -V"}
+    project.pyproject.write()
+    pdm(["install"], obj=project, strict=True)
+    resolve = mocker.spy(actions, "resolve_from_lockfile")
+
+    pdm(["sync"], obj=project, strict=True)
+    resolve.assert_called_once()
+
+
+def test_sync_stamp_stored_in_cache(project, working_set, pdm, mocker):
+    project.add_dependencies(["requests"])
+    pdm(["install"], obj=project, strict=True)
+    assert len(list(project.cache("metadata").joinpath("sync_stamps").glob("*.json"))) == 1
+    assert not list(Path(project.environment.get_paths()["data"]).glob("*stamp*"))
+    resolve = mocker.spy(actions, "resolve_from_lockfile")
+
+    project.project_config["install.compile"] = "deferred"
+    pdm(["sync"], obj=project, strict=True)
+    resolve.assert_called_once()
+
+
+def test_sync_stamp_invalidated_by_compile_option(project, working_set, pdm, mocker):
+    project.add_dependencies(["requests"])
+    pdm(["install"], obj=project, strict=True)
+    resolve = mocker.spy(actions, "resolve_from_lockfile")
+
+    pdm(["sync", "--no-compile"], obj=project, strict=True)
+    resolve.assert_called_once()
+    pdm(["sync", "--no-compile"], obj=project, strict=True)
+    resolve.assert_called_once()
+
+
+def test_sync_stamp_invalidated_by_override_file(project, working_set, pdm, mocker):
+    project.add_dependencies(["requests"])
+    override = project.root / "overrides.txt"
+    override.write_text("idna==2.7\n")
+    pdm(["install", "--override", str(override)], obj=project, strict=True)
+    resolve = mocker.spy(actions, "resolve_from_lockfile")
+
+    pdm(["install", "--override", str(override)], obj=project, strict=True)
+    resolve.assert_not_called()
+    override.write_text("idna==2.8\n")
+    pdm(["install", "--override", str(override)], obj=project, strict=True)
+    resolve.assert_called_once()
+
+
+def test_sync_stamp_not_written_for_non_editable_self(project, working_set, mocker):
+    project.pyproject.settings["distribution"] = True
+    project.pyproject.write()
+    write = mocker.patch("pdm.installers.stamp.SyncStamp.write")
+
+    actions.do_sync(project, selection=GroupSelection(project), no_editable=[project.name])
+    write.assert_not_called()
+    actions.do_sync(project, selection=GroupSelection(project))
+    write.assert_called_once()
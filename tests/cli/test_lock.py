@@ -189,6 +189,33 @@ def test_lock_inputs_track_workspace_member_version(project, core, pdm, lock_for
     assert result.exit_code == 1
 
 
+@pytest.mark.usefixtures("repository")
+@pytest.mark.parametrize("lock_format", ["pdm", "pylock"])
+def test_lock_inputs_freshness_verdict_is_cached(project, core, mocker, lock_format):
+    from pdm.project.lockfile import freshness
+
+    project.project_config["lock.format"] = lock_format
+    workspace_project = make_workspace_members(project, core, {"foo": []})
+    enable_lock_inputs(workspace_project)
+    actions.do_lock(workspace_project)
+    matcher = mocker.spy(freshness, "lock_inputs_match")
+
+    def create_project():
+        return core.create_project(
+            workspace_project.root, global_config=workspace_project.global_config.config_file.as_posix()
+        )
+
+    assert create_project().is_lockfile_fresh()
+    assert create_project().is_lockfile_fresh()
+    assert matcher.call_count == 1
+
+    member_pyproject = workspace_project.root / "packages" / "foo" / "pyproject.toml"
+    member_pyproject.write_text('[project]\nname = "foo"\nversion = "0.2.0"\ndependencies = []\n', encoding="utf-8")
+
+    assert not create_project().is_lockfile_fresh()
+    assert matcher.call_count == 2
+
+
 @pytest.mark.usefixtures("repository")
 @pytest.mark.parametrize("lock_format", ["pdm", "pylock"])
 @pytest.mark.parametrize("dependency_kind", ["direct-url", "editable-url"])
@@ -313,6 +340,25 @@ def test_lock_dependencies(project, lock_format):
         assert package in locked
 
 
+def test_lockfile_written_directly_matches_tomlkit(project):
+    import tomlkit
+
+    from pdm.compat import tomllib
+    from pdm.project.lockfile.writer import dumps
+
+    fixture = FIXTURES / "projects/demo/pdm.lock"
+    project.lockfile.set_generated_data(tomllib.loads(fixture.read_text("utf-8")))
+    project.lockfile.write(False)
+    assert project.lockfile._path.read_text("utf-8") == fixture.read_text("utf-8")
+
+    lock_inputs = {
+        "project": {"groups": ["default"], "resolution": {}, "sources": [{"name": "pypi", "verify_ssl": True}]},
+        "workspace": {"packages/a b": {"name": 'a"b\\c\n\x01', "version": "1.0"}},
+    }
+    data = {"metadata": {"groups": ["default"], "lock_inputs": lock_inputs, "targets": [{"requires_python": ">=3.9"}]}}
+    assert dumps(data) == tomlkit.dumps(data)
+
+
 @pytest.mark.parametrize("args", [("-S", "static_urls"), ("--static-urls",)])
 def test_lock_refresh(pdm, project, repository, args, core, mocker):
     project.add_dependencies(["requests"])
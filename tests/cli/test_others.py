@@ -32,6 +32,36 @@ def test_help_option(pdm):
     assert "usage: pdm [-h]" in result.output.lower()
 
 
+def test_builtin_commands_manifest_in_sync():
+    import importlib
+    import pkgutil
+
+    import pdm.cli.commands
+    from pdm.cli.commands import COMMANDS
+
+    modules = {
+        name
+        for _, name, _ in pkgutil.iter_modules(pdm.cli.commands.__path__)
+        if hasattr(importlib.import_module(f"pdm.cli.commands.{name}"), "Command")
+    }
+    assert modules == {info.module for info in COMMANDS.values()}
+    for name, info in COMMANDS.items():
+        command = importlib.import_module(f"pdm.cli.commands.{info.module}").Command
+        assert (command.name or info.module) == name
+        assert (command.description or command.__doc__) == info.help
+
+
+def test_command_module_imported_on_dispatch(core, mocker):
+    load_command = mocker.spy(core, "_load_command")
+    core.init_parser()
+    load_command.assert_not_called()
+
+    options = core.parser.parse_args(["lock", "--static-urls"])
+    load_command.assert_called_once_with("lock", "lock", mocker.ANY)
+    assert options.command.name == "lock"
+    assert options.strategy_change == ["static_urls"]
+
+
 def test_pep582_option(pdm):
     result = pdm(["--pep582", "bash"])
     assert result.exit_code == 0
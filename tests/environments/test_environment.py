@@ -165,7 +165,7 @@ def test_old_python_installs_compatible_dep_logic(project, mocker):
         ],
         stdout=subprocess.DEVNULL,
     )
-    get_env_spec.assert_called_once_with(interpreter.executable.as_posix(), str(compat_lib))
+    get_env_spec.assert_called_once_with(interpreter.executable.as_posix(), str(compat_lib), project.interpreter_cache)
 
 
 def test_compatible_dep_logic_is_reused(project, mocker):
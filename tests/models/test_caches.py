@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import stat
+import sys
+import threading
+import zipfile
+
+import pytest
+from unearth import Link
+
+from pdm.models.caches import (
+    CandidateInfoCache,
+    EntryPointCache,
+    HashCache,
+    InterpreterCache,
+    LockfileCache,
+    PackageCache,
+    SQLiteCache,
+    WheelCache,
+)
+from pdm.models.candidates import Candidate
+from pdm.models.in_process import get_env_spec, get_sys_config_paths
+from pdm.models.requirements import parse_requirement
+from tests import FIXTURES
+
+
+def test_sqlite_cache_batches_writes(tmp_path):
+    cache_file = tmp_path / "cache.db"
+    cache: SQLiteCache[str, list[str]] = SQLiteCache(cache_file)
+    cache.set("foo", ["bar"])
+    assert "foo" in cache
+    assert cache.get("foo") == ["bar"]
+
+    other: SQLiteCache[str, list[str]] = SQLiteCache(cache_file)
+    assert "foo" not in other
+    cache.flush()
+    assert other.get("foo") == ["bar"]
+    assert "baz" not in other
+
+
+def test_sqlite_cache_flushes_when_batch_is_full(tmp_path, monkeypatch):
+    monkeypatch.setattr(SQLiteCache, "BATCH_SIZE", 2)
+    cache_file = tmp_path / "cache.db"
+    cache: SQLiteCache[str, int] = SQLiteCache(cache_file)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    other: SQLiteCache[str, int] = SQLiteCache(cache_file)
+    assert other.get("a") == 1
+    assert other.get("b") == 2
+
+
+def test_candidate_info_cache_migrates_legacy_json(tmp_path):
+    legacy_file = tmp_path / "package_meta_abc.json"
+    legacy_file.write_text(json.dumps({"foo-1.0": [["bar"], ">=3.8", "A package"]}))
+    cache = CandidateInfoCache(tmp_path / "package_meta_abc.db")
+    candidate = Candidate(parse_requirement("foo==1.0"), name="foo", version="1.0")
+    assert candidate in cache
+    assert cache.get(candidate) == [["bar"], ">=3.8", "A package"]
+    assert not legacy_file.exists()
+
+
+def test_hash_cache_get_many(tmp_path):
+    cache = HashCache(tmp_path)
+    cache.set("https://example.org/foo-1.0.tar.gz", "sha256:1234")
+    cache.set("https://example.org/bar-1.0.tar.gz", "sha256:5678")
+    cache.flush()
+
+    cache = HashCache(tmp_path)
+    assert cache.get("https://example.org/foo-1.0.tar.gz") == "sha256:1234"
+    assert cache.get("https://example.org/baz-1.0.tar.gz") is None
+    assert cache.get_many(
+        [
+            "https://example.org/foo-1.0.tar.gz",
+            "https://example.org/bar-1.0.tar.gz",
+            "https://example.org/baz-1.0.tar.gz",
+        ]
+    ) == {"https://example.org/foo-1.0.tar.gz": "sha256:1234", "https://example.org/bar-1.0.tar.gz": "sha256:5678"}
+
+
+def test_hash_cache_migrates_legacy_tree(tmp_path):
+    url = "https://example.org/foo-1.0.tar.gz"
+    hashed = hashlib.sha224(url.encode("utf-8")).hexdigest()
+    legacy_path = tmp_path.joinpath(hashed[:2], hashed[2:4], hashed[4:6], hashed[6:8], hashed[8:])
+    legacy_path.parent.mkdir(parents=True)
+    legacy_path.write_text("sha256:1234")
+
+    cache = HashCache(tmp_path)
+    assert cache.get(url) == "sha256:1234"
+    assert not tmp_path.joinpath(hashed[:2]).exists()
+
+
+def test_wheel_cache_index_is_invalidated_on_write(project, mocker):
+    link = Link("https://example.org/demo-0.0.1.tar.gz")
+    env_spec = project.environment.spec
+    wheel_cache = WheelCache(project.cache("wheels"))
+    cache_path = wheel_cache.get_path_for_link(link, env_spec)
+    cache_path.mkdir(parents=True)
+    assert wheel_cache.get(link, "demo", env_spec) is None
+
+    find_best_match = mocker.spy(wheel_cache, "_find_best_match")
+    shutil.copy2(FIXTURES / "artifacts/demo-0.0.1-py2.py3-none-any.whl", cache_path)
+    assert wheel_cache.get(link, "demo", env_spec) is None
+    find_best_match.assert_not_called()
+
+    wheel_cache.invalidate(cache_path)
+    cached = wheel_cache.get(link, "demo", env_spec)
+    assert cached is not None and cached.name == "demo-0.0.1-py2.py3-none-any.whl"
+    find_best_match.reset_mock()
+    assert wheel_cache.get(link, "demo", env_spec) == cached
+    find_best_match.assert_not_called()
+
+
+def test_package_cache_unpack_wheel(tmp_path):
+    wheel = tmp_path / "foo-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w") as zf:
+        zf.writestr("foo/__init__.py", "print('hello')\n" * 100, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("foo/data.bin", b"\x00\x01" * 1000, compress_type=zipfile.ZIP_STORED)
+        info = zipfile.ZipInfo("foo-1.0.data/scripts/foo")
+        info.external_attr = (stat.S_IFREG | 0o755) << 16
+        zf.writestr(info, "#!python\n")
+        zf.writestr("../evil.txt", "evil")
+        zf.writestr("foo-1.0.dist-info/METADATA", "Name: foo\nVersion: 1.0\n")
+
+    package = PackageCache(tmp_path / "packages").cache_wheel(wheel)
+    assert package.path.joinpath("foo/__init__.py").read_text() == "print('hello')\n" * 100
+    assert package.path.joinpath("foo/data.bin").read_bytes() == b"\x00\x01" * 1000
+    assert package.path.joinpath("evil.txt").read_text() == "evil"
+    assert not tmp_path.joinpath("packages/evil.txt").exists()
+    if os.name != "nt":
+        assert os.access(package.path / "foo-1.0.data/scripts/foo", os.X_OK)
+    assert package.dist_info.name == "foo-1.0.dist-info"
+
+
+def test_package_cache_unpack_wheel_opens_zipfile_per_thread(tmp_path, mocker):
+    wheel = tmp_path / "foo-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for i in range(100):
+            zf.writestr(f"foo/mod{i}.py", f"value = {i}\n" * 1000)
+    threads_by_zipfile: dict[int, set[int]] = {}
+    original_open = zipfile.ZipFile.open
+
+    def open_member(self, *args, **kwargs):
+        threads_by_zipfile.setdefault(id(self), set()).add(threading.get_ident())
+        return original_open(self, *args, **kwargs)
+
+    mocker.patch.object(zipfile.ZipFile, "open", open_member)
+    package = PackageCache(tmp_path / "packages").cache_wheel(wheel)
+    for i in range(100):
+        assert package.path.joinpath(f"foo/mod{i}.py").read_text() == f"value = {i}\n" * 1000
+    assert all(len(threads) == 1 for threads in threads_by_zipfile.values())
+
+
+def test_interpreter_cache_invalidated_when_interpreter_changes(tmp_path, mocker):
+    executable = tmp_path / "python"
+    executable.write_text("v1")
+    probe = mocker.Mock(side_effect=[{"version": 1}, {"version": 2}])
+    cache = InterpreterCache(tmp_path / "interpreters.db")
+    assert cache.get_or_probe(str(executable), ["test"], probe) == {"version": 1}
+    assert InterpreterCache(tmp_path / "interpreters.db").get_or_probe(str(executable), ["test"], probe) == {
+        "version": 1
+    }
+    assert probe.call_count == 1
+
+    executable.write_text("version 2")
+    assert cache.get_or_probe(str(executable), ["test"], probe) == {"version": 2}
+    assert probe.call_count == 2
+
+
+def test_get_sys_config_paths_cached_with_vars(tmp_path, mocker):
+    cache = InterpreterCache(tmp_path / "interpreters.db")
+    check_output = mocker.spy(sys.modules["pdm.models.in_process"].subprocess, "check_output")
+    for prefix in ("prefix1", "prefix2"):
+        base = str(tmp_path / prefix)
+        expected = get_sys_config_paths(sys.executable, {"base": base, "platbase": base}, kind="prefix")
+        paths = get_sys_config_paths(sys.executable, {"base": base, "platbase": base}, kind="prefix", cache=cache)
+        assert paths == expected
+        assert paths["purelib"].startswith(base)
+    # Two uncached calls and one probe for the cache
+    assert check_output.call_count == 3
+
+
+def test_get_env_spec_cached(tmp_path, mocker):
+    cache = InterpreterCache(tmp_path / "interpreters.db")
+    expected = get_env_spec(sys.executable)
+    assert get_env_spec(sys.executable, cache=cache) == expected
+    probe = mocker.patch("pdm.models.in_process._probe_env_spec")
+    assert get_env_spec(sys.executable, cache=InterpreterCache(tmp_path / "interpreters.db")) == expected
+    probe.assert_not_called()
+
+
+def test_entry_point_cache_rebuilt_when_sys_path_changes(tmp_path, mocker, monkeypatch):
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+    monkeypatch.setattr(sys, "path", [str(site_dir)])
+    entry_points = mocker.patch(
+        "importlib.metadata.entry_points",
+        side_effect=lambda group: [importlib.metadata.EntryPoint("hello", "pdm_hello:main", group)],
+    )
+    cache = EntryPointCache(tmp_path / "entry_points.json")
+    expected = [
+        importlib.metadata.EntryPoint("hello", "pdm_hello:main", "pdm"),
+        importlib.metadata.EntryPoint("hello", "pdm_hello:main", "pdm.plugin"),
+    ]
+    assert cache.get(["pdm", "pdm.plugin"]) == expected
+    assert entry_points.call_count == 2
+    assert EntryPointCache(tmp_path / "entry_points.json").get(["pdm", "pdm.plugin"]) == expected
+    assert entry_points.call_count == 2
+
+    site_dir.joinpath("new_plugin-0.1.0.dist-info").mkdir()
+    os.utime(site_dir, ns=(0, 0))
+    assert cache.get(["pdm", "pdm.plugin"]) == expected
+    assert entry_points.call_count == 4
+
+
+def test_lockfile_cache_keeps_latest_entry_per_kind(tmp_path, mocker):
+    cache = LockfileCache(tmp_path, scope="project")
+    cache.set(["data", "hash1"], {"version": 1})
+    cache.set(["data", "hash2"], {"version": 2})
+    cache.set(["freshness", "hash2"], True)
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+    assert cache.get(["data", "hash2"]) == {"version": 2}
+    with pytest.raises(KeyError):
+        cache.get(["data", "hash1"])
+    with pytest.raises(KeyError):
+        LockfileCache(tmp_path, scope="other").get(["data", "hash2"])
+
+    mocker.patch("os.replace", side_effect=OSError("denied"))
+    cache.set(["data", "hash3"], {"version": 3})
+    assert not list(tmp_path.glob("*.tmp"))
+    assert cache.get(["data", "hash2"]) == {"version": 2}
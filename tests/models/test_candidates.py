@@ -317,3 +317,19 @@ def test_get_metadata_for_non_existing_path(project):
     candidate = Candidate(req)
     with pytest.raises(RequirementError, match=r"The local path '.+' does not exist"):
         candidate.prepare(project.environment).metadata
+
+
+@pytest.mark.usefixtures("local_finder")
+def test_cache_local_directory_by_fingerprint(project, tmp_path):
+    source = tmp_path / "demo"
+    shutil.copytree(FIXTURES / "projects/demo", source)
+    req = parse_requirement(source.as_posix())
+    wheel = Candidate(req).prepare(project.environment).build()
+    assert is_path_relative_to(wheel, project.cache("wheels"))
+
+    prepared = Candidate(req).prepare(project.environment)
+    assert prepared._get_build_cache() == wheel
+    assert prepared.direct_url()["dir_info"]["fingerprint"] == prepared.source_fingerprint
+
+    source.joinpath("demo.py").write_text("print('changed')\n")
+    assert Candidate(req).prepare(project.environment)._get_build_cache() is None
@@ -0,0 +1,46 @@
+import subprocess
+
+import pytest
+
+from pdm.models.fingerprint import get_source_tree_fingerprint
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    tmp_path.joinpath("pyproject.toml").write_text('[tool.pdm.build]\nexcludes = ["tests"]\n')
+    tmp_path.joinpath("src/foo").mkdir(parents=True)
+    tmp_path.joinpath("src/foo/__init__.py").write_text("VERSION = '1.0'\n")
+    return tmp_path
+
+
+def test_fingerprint_changes_with_content(source_tree):
+    fingerprint = get_source_tree_fingerprint(source_tree)
+    assert fingerprint.startswith("sha256:")
+    assert get_source_tree_fingerprint(source_tree) == fingerprint
+
+    source_tree.joinpath("src/foo/__init__.py").write_text("VERSION = '1.1'\n")
+    assert get_source_tree_fingerprint(source_tree) != fingerprint
+
+
+def test_fingerprint_ignores_artifacts_and_excluded_files(source_tree):
+    fingerprint = get_source_tree_fingerprint(source_tree)
+    for path in ("src/foo/__pycache__/__init__.pyc", "build/lib/foo.py", "foo.egg-info/PKG-INFO", "tests/test_foo.py"):
+        source_tree.joinpath(path).parent.mkdir(parents=True, exist_ok=True)
+        source_tree.joinpath(path).write_text("data")
+    assert get_source_tree_fingerprint(source_tree) == fingerprint
+
+    # A "build" directory inside the package is not a build artifact
+    source_tree.joinpath("src/foo/build").mkdir()
+    source_tree.joinpath("src/foo/build/__init__.py").write_text("")
+    assert get_source_tree_fingerprint(source_tree) != fingerprint
+
+
+def test_fingerprint_ignores_git_ignored_files(source_tree):
+    subprocess.run(["git", "init", "-q"], cwd=source_tree, check=True)
+    source_tree.joinpath(".gitignore").write_text("*.log\n")
+    fingerprint = get_source_tree_fingerprint(source_tree)
+
+    source_tree.joinpath("debug.log").write_text("data")
+    assert get_source_tree_fingerprint(source_tree) == fingerprint
+    source_tree.joinpath("src/foo/new.py").write_text("data")
+    assert get_source_tree_fingerprint(source_tree) != fingerprint
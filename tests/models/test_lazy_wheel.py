@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import zipfile
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from pdm.models.candidates import Candidate
+from pdm.models.lazy_wheel import HTTPRangeRequestUnsupported, fetch_wheel_metadata
+from pdm.models.requirements import parse_requirement
+from tests import FIXTURES
+
+WHEEL = FIXTURES / "artifacts/setuptools-68.0.0-py3-none-any.whl"
+
+
+@pytest.fixture
+def range_server(httpserver: HTTPServer) -> list[Request]:
+    requests: list[Request] = []
+    content = WHEEL.read_bytes()
+
+    def handler(request: Request) -> Response:
+        requests.append(request)
+        response = Response(content, mimetype="application/octet-stream")
+        return response.make_conditional(request, accept_ranges=True, complete_length=len(content))
+
+    httpserver.expect_request(f"/{WHEEL.name}").respond_with_handler(handler)
+    return requests
+
+
+def test_fetch_wheel_metadata_with_range_requests(project, httpserver, range_server):
+    metadata = fetch_wheel_metadata(httpserver.url_for(f"/{WHEEL.name}"), project.environment.session)
+    with zipfile.ZipFile(WHEEL) as zf:
+        assert metadata == zf.read("setuptools-68.0.0.dist-info/METADATA").decode("utf-8")
+    assert range_server
+    assert all("Range" in request.headers for request in range_server)
+    # Only the central directory and the METADATA member are fetched
+    assert len(range_server) <= 3
+
+
+def test_fetch_wheel_metadata_range_unsupported(project, httpserver: HTTPServer):
+    httpserver.expect_request(f"/{WHEEL.name}").respond_with_data(WHEEL.read_bytes())
+    with pytest.raises(HTTPRangeRequestUnsupported):
+        fetch_wheel_metadata(httpserver.url_for(f"/{WHEEL.name}"), project.environment.session)
+
+
+def test_prepare_metadata_from_lazy_wheel(project, httpserver, range_server):
+    req = parse_requirement(f"setuptools @ {httpserver.url_for(f'/{WHEEL.name}')}")
+    prepared = Candidate(req).prepare(project.environment)
+    assert prepared.metadata.version == "68.0.0"
+    # The wheel is not downloaded
+    assert prepared._cached is None
+
+
+def test_prepare_metadata_fallback_to_download(project, httpserver: HTTPServer):
+    httpserver.expect_request(f"/{WHEEL.name}").respond_with_data(WHEEL.read_bytes())
+    req = parse_requirement(f"setuptools @ {httpserver.url_for(f'/{WHEEL.name}')}")
+    prepared = Candidate(req).prepare(project.environment)
+    assert prepared.metadata.version == "68.0.0"
+    assert prepared._cached is not None
@@ -186,3 +186,28 @@ def test_get_hashes_returns_candidate_hashes(mocker):
     candidate.hashes = [{"hash": "sha256:value"}]
 
     assert repository.get_hashes(candidate) is candidate.hashes
+
+
+def test_add_package_updates_built_index(mocker):
+    repository = make_repository(mocker)
+    demo = make_candidate()
+    repository.add_package(Package(demo))
+    assert [p.candidate for p in repository._matching_entries(parse_requirement("demo"))] == [demo]
+
+    other = Candidate(parse_requirement("other"), name="other", version="1.0")
+    repository.merge_result(EnvSpec.current(), [Package(other)])
+
+    assert [p.candidate for p in repository._matching_entries(parse_requirement("other"))] == [other]
+
+
+def test_candidates_are_memoized_per_env_spec(mocker):
+    repository = make_repository(mocker)
+    repository.add_package(Package(make_candidate()))
+
+    first = repository.candidates
+    first.pop("demo")
+
+    assert "demo" in repository.candidates
+    assert repository._candidates_by_spec.keys() == {repository.env_spec}
+    repository.add_package(Package(Candidate(parse_requirement("other"), name="other", version="1.0")))
+    assert "other" in repository.candidates
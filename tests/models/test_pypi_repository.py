@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+
+import pytest
+from unearth import Link
+
+from pdm.models.candidates import Candidate
+from pdm.models.repositories import CandidateMetadata, PyPIRepository
+from pdm.models.requirements import parse_requirement
+
+
+def _make_candidate(name: str, version: str, metadata: bool = True, wheel: bool = True) -> Candidate:
+    filename = f"{name}-{version}-py3-none-any.whl" if wheel else f"{name}-{version}.tar.gz"
+    url = f"https://my.pypi.org/files/{filename}"
+    link = Link(url, dist_info_metadata=True) if metadata else Link(url)
+    return Candidate(parse_requirement(name), name=name, version=version, link=link)
+
+
+def _run_now(fn, *args):
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+
+@pytest.mark.parametrize("json_api", [False, True])
+def test_prefetch_metadata_of_top_versions(project, mocker, json_api):
+    project.project_config["pypi.json_api"] = json_api
+    repository = project.get_repository(cls=PyPIRepository)
+    mocker.patch.object(repository.prefetcher, "_submit", side_effect=_run_now)
+    candidates = [
+        # sdists without PEP 658 metadata are never prefetched as it needs a build
+        _make_candidate("foo", "3.0", metadata=False, wheel=False),
+        _make_candidate("foo", "2.0", metadata=False),
+        _make_candidate("foo", "1.5"),
+        _make_candidate("foo", "1.0"),
+    ]
+    mocker.patch.object(repository, "_find_candidates", return_value=candidates)
+    fetch = mocker.patch.object(
+        repository,
+        "_fetch_dependencies",
+        side_effect=lambda c: CandidateMetadata([parse_requirement("bar")], ">=3.8", f"foo {c.version}"),
+    )
+
+    repository.prefetch_metadata([parse_requirement("foo")])
+    assert sorted(call.args[0].version for call in fetch.call_args_list) == ["1.5", "2.0"]
+
+    fetch.reset_mock()
+    deps, requires_python, summary = repository.get_dependencies(_make_candidate("foo", "2.0"))
+    assert [dep.as_line() for dep in deps] == ["bar"]
+    assert str(requires_python) == ">=3.8"
+    assert summary == "foo 2.0"
+    fetch.assert_not_called()
+
+
+def test_prefetcher_shutdown_does_not_wait_for_requests(project):
+    import threading
+
+    repository = project.get_repository(cls=PyPIRepository)
+    prefetcher = repository.prefetcher
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_request():
+        started.set()
+        release.wait(10)
+
+    futures = [prefetcher._submit(slow_request) for _ in range(prefetcher.MAX_WORKERS + 1)]
+    assert started.wait(5)
+    try:
+        prefetcher.shutdown()
+        # The queued request is dropped instead of being awaited
+        assert futures[-1].cancelled()
+        assert not any(future.done() for future in futures[:-1])
+        assert prefetcher._submit(slow_request) is None
+    finally:
+        release.set()
+
+
+def test_prefetch_metadata_disabled(project, mocker):
+    project.project_config["pypi.prefetch_metadata"] = False
+    repository = project.get_repository(cls=PyPIRepository)
+    find_candidates = mocker.patch.object(repository, "_find_candidates")
+
+    repository.prefetch_metadata([parse_requirement("foo")])
+    assert "prefetcher" not in repository.__dict__
+    find_candidates.assert_not_called()
+
+
+def test_index_pages_are_fetched_once(project, mocker):
+    project.project_config["pypi.url"] = "https://my.pypi.org/simple"
+    repository = project.get_repository(cls=PyPIRepository)
+    get_finder = mocker.spy(repository.environment, "get_finder")
+
+    first = repository.find_candidates(parse_requirement("demo"))
+    second = repository.find_candidates(parse_requirement("demo>=0.0.1"))
+    assert [c.version for c in first] == [c.version for c in second]
+    assert second[0].req.specifier
+    get_finder.assert_called_once()
+
+
+def test_prefetch_index_pages(project, mocker):
+    project.project_config["pypi.url"] = "https://my.pypi.org/simple"
+    repository = project.get_repository(cls=PyPIRepository)
+    mocker.patch.object(repository.prefetcher, "_submit", side_effect=_run_now)
+    repository.prefetch_metadata([parse_requirement("demo"), parse_requirement("wheel")])
+    get_finder = mocker.spy(repository.environment, "get_finder")
+
+    assert repository.find_candidates(parse_requirement("demo"))
+    assert repository.find_candidates(parse_requirement("wheel"))
+    get_finder.assert_not_called()
+
+
+def test_waiting_for_index_pages_does_not_hold_the_lock(project, mocker):
+    import threading
+    from contextlib import contextmanager
+
+    repository = project.get_repository(cls=PyPIRepository)
+    fetching = threading.Event()
+    release = threading.Event()
+
+    @contextmanager
+    def get_finder(*args, **kwargs):
+        finder = mocker.Mock()
+
+        def find_all_packages(name, **kwargs):
+            if name == "demo":
+                fetching.set()
+                release.wait(5)
+                raise ConnectionError("failed")
+            return []
+
+        finder.find_all_packages.side_effect = find_all_packages
+        yield finder
+
+    mocker.patch.object(repository.environment, "get_finder", side_effect=get_finder)
+    errors: list[BaseException] = []
+
+    def find_demo():
+        try:
+            repository._find_packages(parse_requirement("demo"), False)
+        except ConnectionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=find_demo, daemon=True) for _ in range(2)]
+    threads[0].start()
+    assert fetching.wait(5)
+    threads[1].start()
+    # Other packages can be looked up while a fetch is in flight
+    other = threading.Thread(target=repository._find_packages, args=(parse_requirement("wheel"), False), daemon=True)
+    other.start()
+    other.join(5)
+    assert not other.is_alive()
+
+    release.set()
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+    assert len(errors) == 2
+    assert [key[0] for key in repository._page_cache] == ["wheel"]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pdm.models.session import SQLITE_BUSY_TIMEOUT, ArchiveRoutingTransport
+
 if TYPE_CHECKING:
     from pdm.project.core import Project
 
@@ -24,3 +26,44 @@ def test_session_sources_all_proxy(project: Project, mocker, monkeypatch):
     transport_args = mock_get_transport.call_args
     assert transport_args is not None
     assert transport_args.kwargs["proxy"] is None
+
+
+def test_session_http_cache_stores_archives_separately(project: Project):
+    transport = project.environment.session._transport
+    assert isinstance(transport, ArchiveRoutingTransport)
+    metadata_storage = transport.metadata_transport.storage
+    archive_storage = transport.archive_transport.storage
+    assert metadata_storage.database_path.name == "http-cache.db"
+    assert archive_storage.database_path.name == "http-archives.db"
+    for storage in (metadata_storage, archive_storage):
+        conn = storage._ensure_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == SQLITE_BUSY_TIMEOUT * 1000
+
+
+def test_session_source_pool_settings(project: Project, mocker):
+    project.pyproject.settings["source"] = [
+        {
+            "name": "internal",
+            "url": "https://internal.example.org/simple",
+            "pool_max_connections": 8,
+            "pool_keepalive": 4,
+            "http2": True,
+        }
+    ]
+    project.pyproject.write()
+    mock_get_transport = mocker.patch("pdm.models.session._get_transport")
+
+    assert project.environment.session is not None
+    kwargs = [call.kwargs for call in mock_get_transport.call_args_list]
+    assert {"max_connections": 8, "max_keepalive": 4, "http2": True}.items() <= kwargs[-1].items()
+    assert {"max_connections": 100, "max_keepalive": 20, "http2": False}.items() <= kwargs[0].items()
+
+
+def test_http2_falls_back_without_h2(mocker):
+    from pdm.models.session import _get_transport
+
+    mocker.patch("importlib.util.find_spec", return_value=None)
+    transport = _get_transport(http2=True, max_connections=3)
+    assert transport._pool._http2 is False
+    assert transport._pool._max_connections == 3
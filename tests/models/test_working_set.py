@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import importlib.metadata as im
+import os
 from types import SimpleNamespace
 
+from pdm.models import working_set as working_set_module
+from pdm.models.caches import WorkingSetCache
 from pdm.models.working_set import EgglinkFinder, WorkingSet
 
 
@@ -69,3 +73,41 @@ def test_working_set_uses_default_paths(mocker):
 
 def test_search_paths_ignores_missing_named_egglink(tmp_path):
     assert list(EgglinkFinder._search_paths("missing", [str(tmp_path)])) == []
+
+
+def make_dist_info(path, name, version):
+    dist_info = path / f"{name.replace('-', '_')}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    dist_info.joinpath("METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+    return dist_info
+
+
+def test_working_set_reads_names_from_dist_info_directory(tmp_path, mocker):
+    make_dist_info(tmp_path, "Demo-Package", "1.0")
+    tmp_path.joinpath("broken-1.0.dist-info").mkdir()
+    read_text = mocker.spy(im.PathDistribution, "read_text")
+
+    working_set = WorkingSet([str(tmp_path)])
+
+    assert list(working_set) == ["demo-package"]
+    read_text.assert_not_called()
+    assert working_set["demo-package"].version == "1.0"
+
+
+def test_working_set_snapshot_is_refreshed_when_path_changes(tmp_path, mocker):
+    site_packages = tmp_path / "site-packages"
+    make_dist_info(site_packages, "foo", "1.0")
+    cache = WorkingSetCache(tmp_path / "cache")
+    mocker.patch.object(WorkingSetCache, "RACY_THRESHOLD", -10)
+    scan = mocker.spy(working_set_module, "_scan_distributions")
+
+    assert list(WorkingSet([str(site_packages)], cache=cache)) == ["foo"]
+    working_set = WorkingSet([str(site_packages)], cache=cache)
+    assert list(working_set) == ["foo"]
+    assert working_set["foo"].version == "1.0"
+    assert scan.call_args_list.count(mocker.call([str(site_packages)])) == 1
+
+    make_dist_info(site_packages, "bar", "2.0")
+    os.utime(site_packages, ns=(0, 0))
+    assert sorted(WorkingSet([str(site_packages)], cache=cache)) == ["bar", "foo"]
+    assert scan.call_args_list.count(mocker.call([str(site_packages)])) == 2
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
+import shutil
 import venv
 from collections.abc import Callable
 from pathlib import Path
@@ -213,6 +214,49 @@ def test_can_install_wheel_with_cache_in_multiple_projects(
             assert not os.path.exists(os.path.join(lib_path, file))
 
 
+@pytest.mark.parametrize("preferred", [None])
+def test_install_from_cache_reuses_recorded_hashes(project, supports_link, mocker):
+    from installer import utils as installer_utils
+
+    candidate = Candidate(
+        parse_requirement("future-fstrings"),
+        link=Link("http://fixtures.test/artifacts/future_fstrings-1.2.0-py2.py3-none-any.whl"),
+    )
+    hashing = mocker.patch.object(
+        installer_utils, "copyfileobj_with_hashing", wraps=installer_utils.copyfileobj_with_hashing
+    )
+    InstallManager(project.environment, use_install_cache=True).install(candidate)
+
+    # Only the metadata generated by the installer are hashed
+    assert all(not hasattr(call.args[0], "name") for call in hashing.call_args_list)
+    dist = project.environment.get_working_set()["future-fstrings"]
+    package = next(p for p in project.package_cache.iter_packages() if p.path.name.startswith("future_fstrings"))
+    cached_records = package.dist_info.joinpath("RECORD").read_text().splitlines()
+    assert "future_fstrings.py" in dist.read_text("RECORD")
+    for line in dist.read_text("RECORD").splitlines():
+        if line.startswith("future_fstrings.py,"):
+            assert line in cached_records
+
+
+@pytest.mark.parametrize("preferred", [None])
+def test_install_from_cache_verifies_records(project, supports_link):
+    from installer.exceptions import InvalidWheelSource
+
+    project.project_config["install.cache_verify"] = True
+    candidate = Candidate(
+        parse_requirement("future-fstrings"),
+        link=Link("http://fixtures.test/artifacts/future_fstrings-1.2.0-py2.py3-none-any.whl"),
+    )
+    installer = InstallManager(project.environment, use_install_cache=True)
+    installer.install(candidate)
+    installer.uninstall(project.environment.get_working_set()["future-fstrings"])
+
+    package = next(p for p in project.package_cache.iter_packages() if p.path.name.startswith("future_fstrings"))
+    package.path.joinpath("future_fstrings.py").write_text("print('tampered')\n")
+    with pytest.raises(InvalidWheelSource, match="doesn't match its RECORD"):
+        installer.install(candidate)
+
+
 def test_url_requirement_is_not_cached(project):
     req = parse_requirement(
         "future-fstrings @ http://fixtures.test/artifacts/future_fstrings-1.2.0-py2.py3-none-any.whl"
@@ -317,3 +361,165 @@ def test_compress_file_list_for_rename():
     }
     abs_paths = {os.path.join(project_root, path) for path in paths}
     assert sorted(compress_for_rename(abs_paths)) == [os.path.join(project_root, "test-removal" + os.sep)]
+
+
+def test_local_directory_is_updated_only_when_changed(project, tmp_path):
+    from pdm.installers.base import BaseSynchronizer
+
+    source = tmp_path / "demo"
+    shutil.copytree(FIXTURES / "projects/demo", source)
+    req = parse_requirement(source.as_posix())
+    InstallManager(project.environment).install(Candidate(req))
+    dist = project.environment.get_working_set()["demo"]
+    synchronizer = BaseSynchronizer(project.environment)
+
+    assert not synchronizer._should_update(dist, Candidate(req))
+    source.joinpath("demo.py").write_text("print('changed')\n")
+    assert synchronizer._should_update(dist, Candidate(req))
+
+
+def test_build_scheduler_bounds_concurrent_builds(project, mocker):
+    import threading
+    import time
+
+    from pdm.installers.scheduler import BuildScheduler
+    from pdm.models.candidates import PreparedCandidate
+
+    lock = threading.Lock()
+    running = []
+    max_running = 0
+
+    def build(self):
+        nonlocal max_running
+        with lock:
+            running.append(self)
+            max_running = max(max_running, len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(self)
+        return Path(f"{self.req.name}.whl")
+
+    mocker.patch.object(PreparedCandidate, "build", build)
+    scheduler = BuildScheduler(project.environment, jobs=2)
+    candidates = [
+        Candidate(parse_requirement(f"demo{i} @ http://fixtures.test/artifacts/demo{i}-0.1.0.tar.gz")) for i in range(5)
+    ]
+    assert all(scheduler.requires_build(can) for can in candidates)
+    futures = [scheduler.submit(can) for can in candidates]
+    # Submitting again doesn't build twice
+    assert scheduler.submit(candidates[0]) is futures[0]
+    assert [scheduler.build(can).name for can in candidates] == [f"demo{i}.whl" for i in range(5)]
+    scheduler.shutdown()
+    assert max_running == 2
+
+
+def test_build_scheduler_does_not_rebuild_failed_builds(project, mocker):
+    from pdm.installers.scheduler import BuildScheduler
+    from pdm.models.candidates import PreparedCandidate
+
+    build = mocker.patch.object(PreparedCandidate, "build", side_effect=RuntimeError("build failed"))
+    scheduler = BuildScheduler(project.environment, jobs=1)
+    candidate = Candidate(parse_requirement("demo @ http://fixtures.test/artifacts/demo-0.0.1.tar.gz"))
+    scheduler.submit(candidate)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            scheduler.build(candidate)
+    assert build.call_count == 1
+
+    scheduler.discard_failed()
+    with pytest.raises(RuntimeError):
+        scheduler.build(candidate)
+    assert build.call_count == 2
+    scheduler.shutdown()
+
+
+def test_sync_builds_failed_package_once_per_attempt(project, mocker):
+    from pdm.exceptions import InstallationError
+    from pdm.installers import InstallManager, Synchronizer
+    from pdm.models.candidates import PreparedCandidate
+
+    project.project_config["install.parallel"] = True
+    mocker.patch.object(project.core, "install_manager_class", InstallManager)
+    build = mocker.patch.object(PreparedCandidate, "build", side_effect=RuntimeError("build failed"))
+    candidate = Candidate(parse_requirement("demo @ http://fixtures.test/artifacts/demo-0.0.1.tar.gz"))
+    synchronizer = Synchronizer(project.environment, candidates={"demo": candidate}, retry_times=1)
+
+    with pytest.raises(InstallationError):
+        synchronizer.synchronize()
+    assert build.call_count == 2
+
+
+@pytest.mark.parametrize("opt_out", [False, True])
+def test_sync_schedules_builds_through_install_manager(project, mocker, opt_out):
+    from pdm.installers import InstallManager, Synchronizer
+    from pdm.installers.scheduler import BuildScheduler
+
+    class NoScheduleManager(InstallManager):
+        def schedule(self, candidate):
+            return None
+
+    project.project_config["install.parallel"] = True
+    mocker.patch.object(project.core, "install_manager_class", NoScheduleManager if opt_out else InstallManager)
+    submit = mocker.patch.object(BuildScheduler, "submit")
+    candidate = Candidate(parse_requirement("demo @ http://fixtures.test/artifacts/demo-0.0.1.tar.gz"))
+    synchronizer = Synchronizer(project.environment, candidates={"demo": candidate})
+
+    with synchronizer._scheduling_builds([("add", "demo")]):
+        pass
+
+    assert submit.called is not opt_out
+
+
+def test_fetch_stage_yields_jobs_when_ready(mocker):
+    from concurrent.futures import Future
+
+    from pdm.installers.synchronizers import _FetchStage
+
+    build = Future()
+    manager = mocker.Mock()
+    manager.fetch.side_effect = lambda can: build if can == "sdist" else None
+    fetcher = _FetchStage(manager, max_pending=2, workers=2)
+    fetcher.start([("add", "sdist", "sdist"), ("add", "wheel", "wheel")])
+    ready = fetcher.ready()
+    # The wheel is ready to install while the sdist is being built
+    assert next(ready) == ("add", "wheel")
+    build.set_result(Path("sdist.whl"))
+    assert next(ready) == ("add", "sdist")
+    assert next(ready, None) is None
+    fetcher.close()
+
+
+def test_fetch_stage_limits_pending_installs(mocker):
+    from concurrent.futures import Future
+
+    from pdm.installers.synchronizers import _FetchStage
+
+    manager = mocker.Mock()
+    manager.fetch.return_value = None
+    fetcher = _FetchStage(manager, max_pending=2, workers=4)
+    fetcher.start([("add", f"pkg{i}", f"pkg{i}") for i in range(4)])
+    ready = fetcher.ready()
+    assert len({next(ready), next(ready)}) == 2
+    # No more packages are fetched until the installed ones are done
+    assert manager.fetch.call_count == 2
+    fetcher.on_installed(Future())
+    next(ready)
+    assert manager.fetch.call_count == 3
+    fetcher.close()
+
+
+@pytest.mark.parametrize("compile_bytecode", [True, False])
+def test_sync_compiles_bytecode_when_deferred(project, compile_bytecode):
+    from pdm.installers import Synchronizer
+
+    project.project_config["install.compile"] = "deferred"
+    project.core.state.compile_bytecode = compile_bytecode
+    candidate = Candidate(
+        parse_requirement("demo"),
+        link=Link("http://fixtures.test/artifacts/demo-0.0.1-py2.py3-none-any.whl"),
+    )
+    Synchronizer(project.environment, candidates={"demo": candidate}).synchronize()
+
+    lib_path = Path(project.environment.get_paths()["purelib"])
+    assert lib_path.joinpath("demo.py").exists()
+    assert bool(list(lib_path.glob("__pycache__/demo.*.pyc"))) is compile_bytecode
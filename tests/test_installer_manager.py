@@ -32,6 +32,7 @@ def test_install_passes_candidate_options(mocker):
         install_links=True,
         rename_pth=True,
         requested=True,
+        compile_targets=None,
     )
     distribution_at.assert_called_once_with(mocker.sentinel.dist_info)
 
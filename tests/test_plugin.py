@@ -9,6 +9,12 @@ from pdm.project.config import ConfigItem
 from pdm.utils import cd
 
 
+@pytest.fixture(autouse=True)
+def no_entry_point_cache(monkeypatch):
+    # The entry points are mocked, bypass the index of the installed ones
+    monkeypatch.setenv("PDM_NO_CACHE", "1")
+
+
 class HelloCommand(BaseCommand):
     def add_arguments(self, parser) -> None:
         parser.add_argument("-n", "--name", help="The person's name")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+import textwrap
 import venv
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -740,3 +741,63 @@ def test_saved_python_refuses_symlinked_pdm_python(project):
     # The symlink target outside .pdm-python is left untouched.
     assert real.read_text() == "untouched"
     assert link.is_symlink()
+
+
+@pytest.mark.usefixtures("repository")
+def test_locked_repository_loaded_from_cache(project, pdm, mocker):
+    from pdm.models.repositories import LockedRepository
+
+    project.add_dependencies(["requests"])
+    pdm(["lock"], obj=project, strict=True)
+    project._lockfile = None
+    parsed = project.get_locked_repository()
+    assert project.lockfile.content_hash is not None
+
+    project._lockfile = None
+    read_lockfile = mocker.spy(LockedRepository, "_read_lockfile")
+    loaded = project.get_locked_repository()
+    read_lockfile.assert_called_once_with(mocker.ANY, {})
+    assert loaded.targets == parsed.targets
+    assert sorted(loaded.packages) == sorted(parsed.packages)
+    assert loaded.candidates["requests"].version == parsed.candidates["requests"].version
+
+    # The lockfile is parsed again once it is modified
+    project.lockfile.update_hash("changed")
+    project.get_locked_repository()
+    assert read_lockfile.call_args_list[-1].args[1] != {}
+
+
+def test_locked_repository_cache_does_not_store_expanded_urls(project, monkeypatch):
+    project.root.joinpath("pdm.lock").write_text(
+        textwrap.dedent(
+            """\
+            [metadata]
+            groups = ["default"]
+            strategy = ["inherit_metadata"]
+            lock_version = "4.5.0"
+            content_hash = "sha256:0000"
+
+            [[metadata.targets]]
+            requires_python = ">=3.8"
+
+            [[package]]
+            name = "foo"
+            version = "1.0"
+            url = "https://${TOKEN}@example.org/foo-1.0.tar.gz"
+            summary = ""
+            """
+        )
+    )
+    monkeypatch.setenv("TOKEN", "first-secret")
+    project._lockfile = None
+    parsed = project.get_locked_repository()
+    assert "first-secret" in str(list(parsed.packages))
+    cache_files = list(project.cache("metadata").joinpath("lockfiles").glob("*.pickle"))
+    assert cache_files
+    assert not any(b"first-secret" in cache_file.read_bytes() for cache_file in cache_files)
+
+    monkeypatch.setenv("TOKEN", "second-secret")
+    project._lockfile = None
+    loaded = project.get_locked_repository()
+    assert "second-secret" in str(list(loaded.packages))
+    assert loaded.candidates["foo"].version == "1.0"